@@ -0,0 +1,39 @@
+"""Compare the ``Array`` field with a ``List`` of ``Float`` on 1M numbers."""
+
+import array
+import base64
+import sys
+
+import objective
+
+from utils import bench
+
+
+def main():
+    numbers = [i / 7.0 for i in range(1000000)]
+    raw = array.array('d', numbers).tobytes()
+    encoded = base64.b64encode(raw).decode('ascii')
+
+    floats = objective.List(items=objective.Item(objective.Float))
+    arr = objective.Array(typecode='d')
+    view = objective.Array(typecode='d', zero_copy=True)
+
+    assert floats.deserialize(numbers) == arr.deserialize(numbers).tolist() == view.deserialize(raw).tolist()
+
+    print("1000000 floats")
+    bench("List(items=Item(Float)) from list", lambda: floats.deserialize(numbers), number=1)
+    bench("Array from list", lambda: arr.deserialize(numbers), number=5)
+    bench("Array from bytes", lambda: arr.deserialize(raw), number=5)
+    bench("Array from base64", lambda: arr.deserialize(encoded), number=5)
+    bench("Array from bytes, zero copy", lambda: view.deserialize(raw), number=5)
+    bench("Array from list with minimum and maximum",
+          lambda: objective.Array(minimum=0, maximum=1e6).deserialize(numbers), number=5)
+
+    result = floats.deserialize(numbers)
+    size = sys.getsizeof(result) + sum(sys.getsizeof(number) for number in result)
+    print("{0:<50} {1:>10.1f} MB".format("List(items=Item(Float)) memory", size / 1e6))
+    print("{0:<50} {1:>10.1f} MB".format("Array memory", sys.getsizeof(arr.deserialize(numbers)) / 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Compare parsing and deserializing a repeated request body with the result cache."""
+
+import json
+import shutil
+import tempfile
+
+import objective
+from objective.cache import FileStore, ResultCache
+
+from utils import bench
+
+
+class Item(objective.Mapping):
+    sku = objective.Item(objective.Unicode)
+    quantity = objective.Item(objective.Int)
+    price = objective.Item(objective.Float)
+
+
+class Order(objective.Mapping):
+    id = objective.Item(objective.Unicode)
+    created = objective.Item(objective.UtcDateTime)
+    items = objective.Item(objective.List, items=objective.Item(Item))
+
+
+def main():
+    body = json.dumps({
+        'id': 'order-1',
+        'created': '2019-01-01T12:00:00Z',
+        'items': [{'sku': 'sku-{}'.format(i), 'quantity': str(i), 'price': i * 1.5} for i in range(100)],
+    }).encode('utf-8')
+    node = Order()
+    memory = ResultCache()
+    directory = tempfile.mkdtemp()
+
+    try:
+        files = ResultCache(store=FileStore(directory))
+
+        assert node.deserialize(json.loads(body)) == memory.loads(node, body) == files.loads(node, body)
+
+        print("order with 100 items sent repeatedly")
+        bench("parse and deserialize", lambda: node.deserialize(json.loads(body)), number=100)
+        bench("memory cache", lambda: memory.loads(node, body), number=100)
+        bench("file cache", lambda: files.loads(node, body), number=100)
+
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""Compare ``validate_email`` with the cached offline engine of :py:class:`objective.Email`."""
+
+import validate_email
+
+import objective
+
+from utils import bench
+
+
+def main():
+    domains = ['example.com', 'example.org', 'mail.example.net', 'example.co.uk']
+    addresses = [
+        'user{}.name@{}'.format(i % 1000, domains[i % len(domains)])
+        for i in range(50000)
+    ]
+
+    def plain():
+        return [validate_email.validate_email(address) for address in addresses]
+
+    def calls():
+        email = objective.Email()
+        results = []
+
+        for address in addresses:
+            try:
+                email(None, address)
+                results.append(True)
+
+            except objective.Invalid:
+                results.append(False)
+
+        return results
+
+    def batch():
+        return objective.Email(cache_size=10000).validate_many(addresses)
+
+    assert plain() == calls() == batch()
+
+    print("{} addresses, {} distinct".format(len(addresses), len(set(addresses))))
+    bench("validate_email.validate_email", plain, number=1)
+    bench("Email.__call__", calls, number=1)
+    bench("Email.validate_many", batch, number=1)
+
+
+if __name__ == '__main__':
+    main()
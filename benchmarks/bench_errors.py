@@ -0,0 +1,44 @@
+"""Compare the cost of rejecting a garbage payload with and without bounded error collection."""
+
+import objective
+from objective import traversal
+
+from utils import bench
+
+
+class Numbers(objective.List):
+    items = objective.Item(objective.Int)
+
+
+def main():
+    valid = list(range(100000))
+    garbage = ['junk'] * 100000
+
+    numbers = Numbers()
+    bounded = Numbers(max_errors=10)
+    fail_fast = Numbers(fail_fast=True)
+
+    def reject(node):
+        try:
+            node.deserialize(garbage)
+
+        except objective.Invalid:
+            pass
+
+    def reject_traversal(**kwargs):
+        try:
+            traversal.deserialize(numbers, garbage, **kwargs)
+
+        except objective.Invalid:
+            pass
+
+    print("100000 elements")
+    bench("accept valid", lambda: numbers.deserialize(valid))
+    bench("reject garbage", lambda: reject(numbers))
+    bench("reject garbage, max_errors=10", lambda: reject(bounded))
+    bench("reject garbage, fail_fast=True", lambda: reject(fail_fast))
+    bench("reject garbage, traversal fail_fast=True", lambda: reject_traversal(fail_fast=True))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""Benchmark ``FieldValue`` as the validator of list items."""
+
+import objective
+
+from utils import bench
+
+
+class UncachedFieldValue(objective.Validator):
+
+    """The former ``FieldValue``, which creates a field for every value."""
+
+    def __init__(self, field):
+        self.field_class = field
+
+    def __call__(self, node, value, environment=None):
+        field = self.field_class(environment=environment)
+
+        return field.deserialize(value)
+
+
+def main():
+    value = [str(i) for i in range(100000)]
+
+    uncached = objective.List(items=objective.Item(objective.Field, validator=UncachedFieldValue(objective.Int)))
+    cached = objective.List(items=objective.Item(objective.Field, validator=objective.FieldValue(objective.Int)))
+    shared = objective.List(items=objective.Item(objective.Field, validator=objective.FieldValue(objective.Int())))
+
+    assert uncached.deserialize(value) == cached.deserialize(value) == shared.deserialize(value)
+
+    print("List of 100000 values validated by FieldValue(Int)")
+    bench("field per value", lambda: uncached.deserialize(value), number=1)
+    bench("cached field", lambda: cached.deserialize(value), number=1)
+    bench("field instance", lambda: shared.deserialize(value), number=1)
+
+
+if __name__ == '__main__':
+    main()
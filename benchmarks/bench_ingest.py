@@ -0,0 +1,59 @@
+"""Compare reading a JSON-lines file line by line with the parallel ingestion."""
+
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+
+import objective
+from objective import ingest
+
+
+class Order(objective.Mapping):
+    id = objective.Item(objective.Int)
+    sku = objective.Item(objective.Unicode)
+    quantity = objective.Item(objective.Int)
+    price = objective.Item(objective.Float)
+    created = objective.Item(objective.UtcDateTime)
+
+
+def line_by_line(path):
+    node = Order()
+
+    with open(path, 'rb') as f:
+        return sum(1 for line in f if node.deserialize(json.loads(line)))
+
+
+def timed(label, func):
+    start = time.time()
+    count = func()
+    print("{0:<50} {1:>10.0f} ms  {2} lines".format(label, (time.time() - start) * 1000, count))
+
+
+def main():
+    fd, path = tempfile.mkstemp(suffix='.jsonl')
+
+    try:
+        with os.fdopen(fd, 'w') as f:
+            for i in range(50000):
+                f.write(json.dumps({
+                    'id': i, 'sku': 'sku-{}'.format(i % 1000), 'quantity': str(i % 7), 'price': i / 100.0,
+                    'created': '2019-01-01T12:00:00Z',
+                }))
+                f.write('\n')
+
+        print("{} MB, {} CPUs".format(os.path.getsize(path) // 2 ** 20, multiprocessing.cpu_count()))
+        timed("line by line", lambda: line_by_line(path))
+        timed("ingest in this process", lambda: sum(1 for _ in ingest.read(path, Order, workers=0)))
+
+        for workers in (2, 4):
+            timed("ingest with {} workers".format(workers),
+                  lambda: sum(1 for _ in ingest.read(path, Order, workers=workers, chunk_size=1 << 20)))
+
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
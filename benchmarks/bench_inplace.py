@@ -0,0 +1,54 @@
+"""Compare time and peak memory of the allocating and the in-place deserialization of a large batch."""
+
+import tracemalloc
+
+import objective
+from objective import inplace
+
+from utils import bench
+
+
+class Line(objective.Mapping):
+    sku = objective.Item(objective.Unicode)
+    quantity = objective.Item(objective.Int)
+
+
+class Order(objective.Mapping):
+    id = objective.Item(objective.Int)
+    price = objective.Item(objective.Float)
+    lines = objective.Item(objective.List, items=objective.Item(Line))
+
+
+Batch = objective.List(items=objective.Item(Order))
+
+
+def batch():
+    return [
+        {'id': str(i), 'price': '1.5', 'lines': [{'sku': 'sku', 'quantity': str(j)} for j in range(5)]}
+        for i in range(20000)
+    ]
+
+
+def peak(label, func, **kwargs):
+    """Print the peak of the memory allocated while ``func`` deserializes a batch."""
+
+    data = batch()
+    tracemalloc.start()
+    func(data, **kwargs)
+    _, size = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print("{0:<50} {1:>10.1f} MB peak".format(label, size / 1024.0 / 1024))
+
+
+def main():
+    bench('deserialize', lambda: Batch.deserialize(batch()), number=3)
+    bench('deserialize(inplace=True)', lambda: Batch.deserialize(batch(), inplace=True), number=3)
+
+    peak('deserialize', Batch.deserialize)
+    peak('deserialize(inplace=True)', Batch.deserialize, inplace=True)
+    peak('inplace.deserialize(rollback=False)', lambda data: inplace.deserialize(Batch, data, rollback=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Compare the memory held by deserialized records with and without interned strings.
+
+The number of records may be given as argument, the default is 1,000,000::
+
+    PYTHONPATH=src python benchmarks/bench_intern.py 1000000
+
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+import objective
+from objective.memo import Interner
+
+
+STATUSES = [u'active', u'suspended', u'pending_verification', u'closed']
+COUNTRIES = [u'de', u'fr', u'it', u'es', u'nl', u'pl', u'at', u'ch']
+
+
+def schema(intern):
+    shared = Interner() if intern else None
+
+    class Account(objective.Mapping):
+        id = objective.Item(objective.Int)
+        status = objective.Item(objective.Unicode, intern=intern or None, validator=objective.OneOf(STATUSES))
+        country = objective.Item(objective.Unicode, intern=shared)
+        currency = objective.Item(objective.Unicode, intern=shared)
+
+    return Account()
+
+
+def measure(label, node, lines):
+    gc.collect()
+    tracemalloc.start()
+    start = time.time()
+
+    # every line is parsed separately, so equal strings of different records are different objects
+    records = [node.deserialize(json.loads(line)) for line in lines]
+
+    elapsed = time.time() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print("{0:<30} {1:>10.1f} MB held {2:>10.0f} ms  {3} records".format(
+        label, size / 1024.0 / 1024, elapsed * 1000, len(records)))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    lines = [
+        json.dumps({
+            'id': i,
+            'status': STATUSES[i % len(STATUSES)],
+            'country': COUNTRIES[i % len(COUNTRIES)],
+            'currency': u'EUR' if i % 3 else u'CHF',
+        })
+        for i in range(count)
+    ]
+
+    measure('Unicode', schema(False), lines)
+    measure('Unicode(intern=...)', schema(True), lines)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Measure event loop stalls while a large list of mappings is deserialized."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import objective
+from objective import aio
+
+
+class Row(objective.Mapping):
+    id = objective.Item(objective.Int)
+    name = objective.Item(objective.Unicode)
+    score = objective.Item(objective.Float, missing=objective.Ignore)
+
+
+class Rows(objective.List):
+    items = objective.Item(Row)
+
+
+async def ticker(stalls, period=0.001):
+    """Record by how much every tick is late."""
+
+    clock = time.perf_counter
+
+    while True:
+        expected = clock() + period
+        await asyncio.sleep(period)
+        stalls.append(clock() - expected)
+
+
+async def measure(deserialize):
+    stalls = []
+    task = asyncio.ensure_future(ticker(stalls))
+    await asyncio.sleep(0.01)
+    del stalls[:]
+
+    start = time.perf_counter()
+    await deserialize()
+    total = time.perf_counter() - start
+
+    # let the ticker record a stall at the end
+    await asyncio.sleep(0.01)
+    task.cancel()
+    stalls.sort()
+
+    return total, stalls[-1], stalls[int(len(stalls) * 0.99)]
+
+
+def main():
+    value = [{'id': str(i), 'name': 'row {}'.format(i), 'score': i / 3.0} for i in range(200000)]
+    node = Rows()
+    executor = ThreadPoolExecutor(1)
+
+    async def blocking():
+        return node.deserialize(value)
+
+    strategies = [
+        ("blocking deserialize", blocking),
+        ("chunked, 5 ms interval", lambda: aio.chunked(node, value, interval=0.005)),
+        ("chunked, 1 ms interval", lambda: aio.chunked(node, value, interval=0.001)),
+        ("thread executor", lambda: aio.chunked(node, value, executor=executor)),
+    ]
+
+    print("List of 200000 mappings, ticker every 1 ms")
+    print("{:40} {:>10} {:>14} {:>14}".format("", "total ms", "max stall ms", "p99 stall ms"))
+
+    loop = asyncio.new_event_loop()
+
+    for label, deserialize in strategies:
+        total, worst, p99 = loop.run_until_complete(measure(deserialize))
+        print("{:40} {:10.1f} {:14.2f} {:14.2f}".format(label, total * 1000, worst * 1000, p99 * 1000))
+
+    loop.close()
+
+
+if __name__ == '__main__':
+    main()
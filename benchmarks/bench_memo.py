@@ -0,0 +1,49 @@
+"""Compare memoized with plain fields on a batch with many repeated values."""
+
+import objective
+from objective.memo import Memo
+
+from utils import bench
+
+
+def schema(memoize):
+    class Record(objective.Mapping):
+        status = objective.Item(objective.Unicode, memoize=memoize)
+        country = objective.Item(objective.Unicode, memoize=memoize)
+        created = objective.Item(objective.UtcDateTime, memoize=memoize)
+        count = objective.Item(objective.Int, memoize=memoize)
+
+    class Records(objective.List):
+        items = objective.Item(Record)
+
+    return Records()
+
+
+def main():
+    batch = [
+        {
+            'status': ('active', 'inactive', 'pending')[i % 3],
+            'country': ('DE', 'FR', 'IT', 'ES')[i % 4],
+            'created': '2019-01-0{}T12:00:00Z'.format(i % 9 + 1),
+            'count': str(i % 10),
+        }
+        for i in range(20000)
+    ]
+
+    plain = schema(False)
+    memoized = schema(True)
+
+    assert plain.deserialize(batch) == memoized.deserialize(batch)
+
+    print("20000 records")
+    bench("plain", lambda: plain.deserialize(batch), number=3)
+    bench("memoized", lambda: memoized.deserialize(batch), number=3)
+
+    with Memo(maxsize=100) as memo:
+        bench("memoized, batch scope", lambda: memoized.deserialize(batch), number=3)
+
+    print("batch scope hit rate: {:.3f}".format(memo.hit_rate))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Compare a self referencing schema with an equally deep, explicitly nested schema."""
+
+import objective
+
+from utils import bench
+
+DEPTH = 50
+
+
+class Category(objective.Mapping):
+    name = objective.Item(objective.Unicode)
+    child = objective.Item('Category', missing=objective.Ignore)
+
+
+def nested_schema(depth):
+    """Create ``depth`` distinct mapping classes, which are nested into each other."""
+
+    schema = type('Level', (objective.Mapping,), {'name': objective.Item(objective.Unicode)})
+
+    for _ in range(depth - 1):
+        schema = type('Level', (objective.Mapping,), {
+            'name': objective.Item(objective.Unicode),
+            'child': objective.Item(schema, missing=objective.Ignore),
+        })
+
+    return schema
+
+
+def nested_value(depth):
+    value = {'name': 'leaf'}
+
+    for i in range(depth - 1):
+        value = {'name': str(i), 'child': value}
+
+    return value
+
+
+def main():
+    value = nested_value(DEPTH)
+    recursive = Category()
+    explicit = nested_schema(DEPTH)()
+
+    assert recursive.deserialize(value) == explicit.deserialize(value)
+
+    print("{} levels".format(DEPTH))
+    bench("self referencing schema", lambda: recursive.deserialize(value), number=1000)
+    bench("explicitly nested schema", lambda: explicit.deserialize(value), number=1000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+"""Compare the serialization of large timestamp and float payloads by format."""
+
+import datetime
+
+import pytz
+
+import objective
+
+from utils import bench
+
+
+def main():
+    start = datetime.datetime(2020, 1, 1, tzinfo=pytz.utc)
+    timestamps = [start + datetime.timedelta(seconds=i * 7.5) for i in range(20000)]
+    floats = [i / 7.0 for i in range(100000)]
+
+    for fmt in ('str', 'iso', 'epoch', 'epoch_ms'):
+        node = objective.List(items=objective.Item(objective.UtcDateTime, format=fmt))
+
+        bench('UtcDateTime(format={!r})'.format(fmt), lambda: node.serialize(timestamps))
+        bench('UtcDateTime(format={!r}) trusted'.format(fmt), lambda: node.serialize(timestamps, trusted=True))
+
+    for options in ({}, {'nan': 'null'}, {'precision': 3}):
+        node = objective.List(items=objective.Item(objective.Float, **options))
+
+        bench('Float({})'.format(options), lambda: node.serialize(floats))
+        bench('Float({}) trusted'.format(options), lambda: node.serialize(floats, trusted=True))
+
+
+if __name__ == '__main__':
+    main()
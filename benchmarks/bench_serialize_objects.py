@@ -0,0 +1,48 @@
+"""Compare serializing objects directly with converting them into dicts first."""
+
+import objective
+
+from utils import bench
+
+
+class Row(object):
+
+    __slots__ = ('id', 'name', 'email', 'score', 'active')
+
+    def __init__(self, i):
+        self.id = i
+        self.name = 'user {}'.format(i)
+        self.email = 'user{}@example.com'.format(i)
+        self.score = i / 3.0
+        self.active = bool(i % 2)
+
+
+class RowObjective(objective.Mapping):
+    id = objective.Item(objective.Int)
+    name = objective.Item(objective.Unicode)
+    email = objective.Item(objective.Unicode)
+    score = objective.Item(objective.Float)
+    active = objective.Item(objective.Bool)
+
+
+class Rows(objective.List):
+    items = objective.Item(RowObjective)
+
+
+def main():
+    rows = [Row(i) for i in range(20000)]
+    names = Row.__slots__
+    node = Rows()
+
+    def as_dicts():
+        return node.serialize([{name: getattr(row, name) for name in names} for row in rows])
+
+    assert as_dicts() == node.serialize(rows)
+
+    print("20000 objects with 5 attributes")
+    bench("convert to dicts and serialize", as_dicts)
+    bench("serialize objects", lambda: node.serialize(rows))
+
+
+if __name__ == '__main__':
+    main()
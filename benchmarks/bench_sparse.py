@@ -0,0 +1,46 @@
+"""Compare the lookup strategies of a wide mapping over a range of sparsity levels."""
+
+import objective
+from objective import values
+
+from utils import bench
+
+
+def schema(base):
+    items = {'opt{}'.format(i): objective.Item(objective.Int, missing=objective.Ignore) for i in range(490)}
+    items.update(('required{}'.format(i), objective.Item(objective.Unicode)) for i in range(5))
+    items.update(('default{}'.format(i), objective.Item(objective.Unicode, missing='x')) for i in range(5))
+
+    return type('Config', (base,), items)()
+
+
+class SchemaOrder(objective.Mapping):
+
+    """The former lookup of every item."""
+
+    def _deserialize_children(self, value, environment=None):
+        for name, item in self:
+            yield name, item, value.get(name, values.Undefined)
+
+
+def main():
+    sparse = schema(objective.Mapping)
+    dense = schema(objective.Mapping)
+    dense.sparse_ratio = None
+    baseline = schema(SchemaOrder)
+
+    print("Mapping of 500 items")
+
+    for keys in (5, 50, 125, 250, 490):
+        value = {'opt{}'.format(i): str(i) for i in range(0, 490, 490 // keys)[:keys]}
+        value.update(('required{}'.format(i), 'r') for i in range(5))
+
+        assert baseline.deserialize(value) == sparse.deserialize(value) == dense.deserialize(value)
+
+        bench("{} keys, every item".format(keys), lambda: baseline.deserialize(value), number=100)
+        bench("{} keys, schema order without ignored items".format(keys), lambda: dense.deserialize(value), number=100)
+        bench("{} keys, adaptive".format(keys), lambda: sparse.deserialize(value), number=100)
+
+
+if __name__ == '__main__':
+    main()
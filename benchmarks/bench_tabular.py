@@ -0,0 +1,44 @@
+"""Compare deserializing CSV rows by ``csv.DictReader`` with the positional tabular reader."""
+
+import csv
+import io
+
+import objective
+from objective import tabular
+
+from utils import bench
+
+
+class Order(objective.Mapping):
+    id = objective.Item(objective.Int)
+    sku = objective.Item(objective.Unicode)
+    quantity = objective.Item(objective.Int, missing=1)
+    price = objective.Item(objective.Float)
+    note = objective.Item(objective.Unicode, missing=objective.Ignore)
+
+
+def main():
+    lines = ['id,sku,quantity,price,note']
+    lines.extend('{0},sku {0},{1},{2}.5,'.format(i, '' if i % 3 else i % 7, i % 100) for i in range(10000))
+    data = '\r\n'.join(lines) + '\r\n'
+    node = Order()
+
+    def dict_reader():
+        # empty cells are dropped to apply the missing rules
+        return [
+            node.deserialize({key: cell for key, cell in row.items() if cell != ''})
+            for row in csv.DictReader(io.StringIO(data))
+        ]
+
+    def positional():
+        return [row.value for row in tabular.read(io.StringIO(data), node)]
+
+    assert dict_reader() == positional()
+
+    bench('DictReader + deserialize', dict_reader)
+    bench('tabular.read', positional)
+    bench('tabular.write into ColumnSink', lambda: tabular.write(io.StringIO(data), node, tabular.ColumnSink(node)))
+
+
+if __name__ == '__main__':
+    main()
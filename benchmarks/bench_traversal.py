@@ -0,0 +1,79 @@
+"""Compare the recursive engine with the explicit stack engine of :py:mod:`objective.traversal`."""
+
+import objective
+from objective import traversal
+
+from utils import bench
+
+
+class Tree(objective.List):
+    pass
+
+
+Tree.items = objective.Item(Tree)
+
+
+class Address(objective.Mapping):
+    street = objective.Item(objective.Unicode)
+    city = objective.Item(objective.Unicode)
+    zip = objective.Item(objective.Int)
+
+
+class Person(objective.Mapping):
+    name = objective.Item(objective.Unicode)
+    age = objective.Item(objective.Int)
+    email = objective.Item(objective.Unicode, missing=objective.Ignore)
+    addresses = objective.Item(objective.List, items=objective.Item(Address))
+
+
+class People(objective.List):
+    items = objective.Item(Person)
+
+
+def nested_lists(depth):
+    value = []
+    current = value
+
+    for _ in range(depth):
+        child = []
+        current.append(child)
+        current = child
+
+    return value
+
+
+def main():
+    tree = Tree()
+    people = People()
+
+    shallow = [
+        {'name': 'name {}'.format(i), 'age': str(i), 'addresses': [
+            {'street': 'street', 'city': 'city', 'zip': '12345'},
+        ]}
+        for i in range(10000)
+    ]
+
+    print("shallow: 10000 people")
+    bench("recursive", lambda: people.deserialize(shallow))
+    bench("traversal", lambda: traversal.deserialize(people, shallow))
+
+    # the recursive engine needs some python frames per level
+    deep = nested_lists(200)
+    print("deep: 200 levels")
+    bench("recursive", lambda: tree.deserialize(deep), number=100)
+    bench("traversal", lambda: traversal.deserialize(tree, deep), number=100)
+
+    deeper = nested_lists(10000)
+    print("deeper: 10000 levels")
+    try:
+        tree.deserialize(deeper)
+
+    except RuntimeError:
+        # a RecursionError
+        print("{0:<50} {1:>13}".format("recursive", "RecursionError"))
+
+    bench("traversal", lambda: traversal.deserialize(tree, deeper))
+
+
+if __name__ == '__main__':
+    main()
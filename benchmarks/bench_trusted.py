@@ -0,0 +1,57 @@
+"""Compare the regular with the trusted serialization of a large response."""
+
+import datetime
+import json
+
+import objective
+
+from utils import bench
+
+
+class Comment(objective.Mapping):
+    author = objective.Item(objective.Unicode)
+    text = objective.Item(objective.Unicode)
+    likes = objective.Item(objective.Int)
+
+
+class Post(objective.Mapping):
+    id = objective.Item(objective.Int)
+    title = objective.Item(objective.Unicode)
+    body = objective.Item(objective.Unicode)
+    score = objective.Item(objective.Float)
+    created = objective.Item(objective.UtcDateTime)
+    tags = objective.Item(objective.List, items=objective.Item(objective.Unicode))
+    comments = objective.Item(objective.List, items=objective.Item(Comment))
+    state = objective.Item(objective.Unicode, missing='published')
+    note = objective.Item(objective.Unicode, missing=objective.Ignore)
+
+
+class Posts(objective.List):
+    items = objective.Item(Post)
+
+
+def main():
+    created = datetime.datetime(2019, 1, 1, 12)
+    value = [
+        {
+            'id': i,
+            'title': u'post {}'.format(i),
+            'body': u'text ' * 20,
+            'score': i / 3.0,
+            'created': created,
+            'tags': [u'a', u'b', u'c'],
+            'comments': [{'author': u'user {}'.format(j), 'text': u'nice', 'likes': j} for j in range(5)],
+        }
+        for i in range(5000)
+    ]
+    node = Posts()
+
+    assert json.dumps(node.serialize(value)) == json.dumps(node.serialize(value, trusted=True))
+
+    print("5000 posts with 5 comments each")
+    bench("serialize", lambda: node.serialize(value))
+    bench("serialize trusted", lambda: node.serialize(value, trusted=True))
+
+
+if __name__ == '__main__':
+    main()
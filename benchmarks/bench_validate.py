@@ -0,0 +1,65 @@
+"""Compare ``validate`` with ``deserialize`` in time and peak memory on a large nested payload."""
+
+import tracemalloc
+
+import objective
+
+from utils import bench
+
+
+class Address(objective.Mapping):
+    street = objective.Item(objective.Unicode)
+    city = objective.Item(objective.Unicode)
+    zip = objective.Item(objective.Int)
+
+
+class Person(objective.Mapping):
+    name = objective.Item(objective.Unicode)
+    age = objective.Item(objective.Int)
+    tags = objective.Item(objective.List, items=objective.Item(objective.Unicode))
+    addresses = objective.Item(objective.List, items=objective.Item(Address))
+
+
+class People(objective.List):
+    items = objective.Item(Person)
+
+
+def peak_memory(func):
+    """:returns: the peak of allocated memory in MiB while calling ``func``"""
+
+    tracemalloc.start()
+
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    return peak / 1024.0 / 1024.0
+
+
+def main():
+    people = People()
+    value = [
+        {
+            'name': 'name {}'.format(i),
+            'age': i,
+            'tags': ['a', 'b', 'c'],
+            'addresses': [{'street': 'street', 'city': 'city', 'zip': 12345} for _ in range(3)],
+        }
+        for i in range(20000)
+    ]
+
+    assert people.validate(value)
+
+    print("20000 people")
+    bench("deserialize", lambda: people.deserialize(value), number=3)
+    bench("validate", lambda: people.validate(value), number=3)
+
+    print("{0:<50} {1:>10.3f} MiB".format("deserialize peak memory", peak_memory(lambda: people.deserialize(value))))
+    print("{0:<50} {1:>10.3f} MiB".format("validate peak memory", peak_memory(lambda: people.validate(value))))
+
+
+if __name__ == '__main__':
+    main()
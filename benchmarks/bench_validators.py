@@ -0,0 +1,58 @@
+"""Microbenchmarks of validators with large choice lists and chains."""
+
+import objective
+
+from utils import bench
+
+
+class ListOneOf(objective.Validator):
+
+    """The former ``OneOf``, which tests the membership in the given list."""
+
+    def __init__(self, choices):
+        self.choices = choices
+
+    def __call__(self, node, value, environment=None):
+        if value in self.choices:
+            return value
+
+        raise objective.Invalid()
+
+
+class LoopChain(objective.Validator):
+
+    """The former ``Chain``, which loops over nested chains."""
+
+    def __init__(self, *validators):
+        self.validators = validators
+
+    def __call__(self, node, value, environment=None):
+        for validator in self.validators:
+            value = validator(node, value, environment=environment)
+
+        return value
+
+
+def main():
+    choices = ['choice {}'.format(i) for i in range(10000)]
+    values = [choices[i * 37 % len(choices)] for i in range(10000)]
+
+    def check(validator):
+        return lambda: [validator(None, value) for value in values]
+
+    print("OneOf, 10000 choices, 10000 values")
+    bench("list membership", check(ListOneOf(choices)), number=1)
+    bench("precompiled", check(objective.OneOf(choices)), number=1)
+
+    mapping = {value: value for value in choices}
+
+    def chain(cls):
+        return cls(cls(objective.OneOf(choices), objective.ValueMap(mapping)), objective.NoneOf(['foo']))
+
+    print("nested Chain of OneOf, ValueMap and NoneOf, 10000 values")
+    bench("loop", check(chain(LoopChain)), number=10)
+    bench("flattened and fused", check(chain(objective.Chain)), number=10)
+
+
+if __name__ == '__main__':
+    main()
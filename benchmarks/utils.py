@@ -0,0 +1,19 @@
+"""Helpers shared by the benchmark scripts.
+
+Run a benchmark from the repository root, e.g.::
+
+    PYTHONPATH=src python benchmarks/bench_traversal.py
+
+"""
+
+import timeit
+
+
+def bench(label, func, number=10, repeat=3):
+    """Print the best time per call of ``func`` in milliseconds."""
+
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+    print("{0:<50} {1:>10.3f} ms".format(label, best * 1000))
+
+    return best
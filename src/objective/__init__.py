@@ -18,7 +18,10 @@ from .fields import (
     Mapping,
     BunchMapping,
     Set,
+    Union,
     Unicode,
+    Bytes,
+    Array,
     UtcDateTime,
     Bool,
 )
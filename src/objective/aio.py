@@ -0,0 +1,396 @@
+"""
+Deserialization with asynchronous validators.
+
+A validator may return an awaitable, e.g. if it is a coroutine function, which looks up the value in a cache service:
+
+.. code-block:: python
+
+    class Unique(objective.Validator):
+
+        async def __call__(self, node, value, environment=None):
+            if await environment['cache'].exists(value):
+                raise objective.Invalid(node)
+
+            return value
+
+    result = await Schema().adeserialize(value, environment, concurrency=10)
+
+The awaitables of all children of a mapping or a collection are awaited concurrently, at most ``concurrency`` at once.
+The result and the :py:class:`.exc.InvalidChildren` tree are the same as with :py:meth:`.core.Field.deserialize`.
+
+A :py:class:`.fields.Union` awaits the node it selects and tries its choices one after another.
+
+Nodes, which override ``deserialize`` or ``_deserialize``, and containers with depth or element limits are
+deserialized synchronously. If a validator of their descendants is asynchronous, a ``RuntimeError`` is raised, since it
+can not be awaited there.
+
+A large value blocks the event loop while it is deserialized, even without any asynchronous validator.
+:py:func:`chunked` lets other tasks run in between or deserializes the value in an executor:
+
+.. code-block:: python
+
+    result = await aio.chunked(Schema(), value, interval=0.005)
+
+This module requires python 3.5 or later.
+"""
+
+import asyncio
+import functools
+import inspect
+import time
+
+from . import core, exc, fields, traversal
+
+
+_deserializers = (core.Field.deserialize, fields.ContainerMixin.deserialize)
+
+_errors = (exc.Invalid, ValueError, TypeError)
+
+
+class Pending(object):      # pylint: disable=R0903
+
+    """The awaitable result of a node, whose validator is asynchronous."""
+
+    __slots__ = ('awaitable',)
+
+    def __init__(self, awaitable):
+        self.awaitable = awaitable
+
+
+def _invalid(node, value, ex):
+    """Convert an exception like :py:meth:`.core.Field.deserialize` does."""
+
+    if isinstance(ex, _errors) and not isinstance(ex, exc.InvalidValue):
+        return exc.InvalidValue(node, value=value, origin=ex)
+
+    return ex
+
+
+def begin(node, value, environment=None, semaphore=None):
+    """Deserialize a value as far as possible without awaiting anything.
+
+    :returns: the deserialized value or a :py:class:`Pending` result
+    """
+
+    if type(node).deserialize not in _deserializers or 'deserialize' in node.__dict__ \
+            or getattr(node, 'max_depth', None) is not None or getattr(node, 'max_elements', None) is not None:
+        return _synchronous(node, node.deserialize(value, environment))
+
+    if isinstance(node, fields.Union) and fields.inherits(node, '_deserialize', fields.Union):
+        return _union(node, value, environment, semaphore)
+
+    kind = traversal.container_kind(node)
+    value = node._resolve_value(value, environment)                     # pylint: disable=W0212
+
+    try:
+        if kind is None:
+            value = _synchronous(node, node._deserialize(value, environment))     # pylint: disable=W0212
+
+            return _validate(node, value, environment, semaphore)
+
+        container = node._deserialize_container(value, environment)     # pylint: disable=W0212
+        outcomes = []
+        pending = False
+        invalids = 0
+        max_invalids = node.max_invalids
+
+        for key, child, subvalue in node._deserialize_children(value, environment):    # pylint: disable=W0212
+            try:
+                outcome = begin(child, subvalue, environment, semaphore)
+                pending = pending or isinstance(outcome, Pending)
+
+            except Exception as ex:                                     # pylint: disable=W0703
+                outcome = ex
+
+            outcomes.append((key, outcome))
+
+            if not pending and isinstance(outcome, Exception):
+                # like the synchronous traversal, we stop at an unhandled error or after enough invalid children
+                if isinstance(outcome, exc.Invalid):
+                    invalids += 1
+
+                    if invalids == max_invalids:
+                        break
+
+                elif kind is not traversal.MAPPING or not isinstance(outcome, exc.IgnoreValue):
+                    break
+
+        if pending:
+            return Pending(_gather(node, kind, value, container, outcomes, environment, semaphore))
+
+        return _finish(node, kind, container, outcomes, environment, semaphore)
+
+    except _errors as ex:
+        raise _invalid(node, value, ex)
+
+
+def _synchronous(node, result):
+    """Raise a ``RuntimeError``, if a synchronously deserialized result contains awaitables of validators.
+
+    :returns: the result
+    """
+
+    awaitables = []
+    stack = [result]
+
+    while stack:
+        value = stack.pop()
+
+        if inspect.isawaitable(value):
+            awaitables.append(value)
+
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            stack.extend(value)
+
+    if awaitables:
+        for awaitable in awaitables:
+            close = getattr(awaitable, 'close', None)
+
+            if close is not None:
+                # never awaited on purpose
+                close()
+
+        raise RuntimeError("{!r} is deserialized synchronously, so the asynchronous validators of its descendants"
+                           " can not be awaited.".format(node))
+
+    return result
+
+
+def _union(node, value, environment, semaphore):
+    """Deserialize a value by the node selected by the discriminator of a union or by the first valid choice."""
+
+    value = node._resolve_value(value, environment)                     # pylint: disable=W0212
+
+    try:
+        choice = node._choose(value)                                    # pylint: disable=W0212
+
+        if choice is None:
+            return _try(node, value, environment, semaphore, [], 0)
+
+        outcome = begin(choice, value, environment, semaphore)
+
+        if isinstance(outcome, Pending):
+            return Pending(_then(node, value, outcome.awaitable, environment, semaphore))
+
+        return _validate(node, outcome, environment, semaphore)
+
+    except _errors as ex:
+        raise _invalid(node, value, ex)
+
+
+def _try(node, value, environment, semaphore, invalids, start):
+    """Try the choices of a union from ``start`` on until a valid result, which may be pending."""
+
+    trial = node._trial                                                 # pylint: disable=W0212
+
+    for index in range(start, len(trial)):
+        try:
+            outcome = begin(trial[index], value, environment, semaphore)
+
+        except exc.Invalid as ex:
+            invalids.append(ex)
+
+            continue
+
+        if isinstance(outcome, Pending):
+            return Pending(_try_pending(node, value, environment, semaphore, invalids, index, outcome.awaitable))
+
+        return _validate(node, outcome, environment, semaphore)
+
+    # the reasons of all failed trials
+    raise exc.InvalidChildren(node, invalids, value=value)
+
+
+async def _try_pending(node, value, environment, semaphore, invalids, index, awaitable):   # pylint: disable=R0913
+    """Await a pending trial of a union and try the next choices, if it is invalid."""
+
+    try:
+        result = await awaitable
+
+    except exc.Invalid as ex:
+        invalids.append(ex)
+        outcome = _try(node, value, environment, semaphore, invalids, index + 1)
+
+        if isinstance(outcome, Pending):
+            return await outcome.awaitable
+
+        return outcome
+
+    outcome = _validate(node, result, environment, semaphore)
+
+    if isinstance(outcome, Pending):
+        return await outcome.awaitable
+
+    return outcome
+
+
+async def _then(node, value, awaitable, environment, semaphore):
+    """Await the pending result of the selected node of a union and apply the validator of the union."""
+
+    try:
+        result = await awaitable
+
+    except _errors as ex:
+        raise _invalid(node, value, ex)
+
+    outcome = _validate(node, result, environment, semaphore)
+
+    if isinstance(outcome, Pending):
+        return await outcome.awaitable
+
+    return outcome
+
+
+def _finish(node, kind, container, outcomes, environment, semaphore):
+    """Fill the container with the outcomes of its children in order and apply the validator."""
+
+    invalids = []
+    max_invalids = node.max_invalids
+
+    for key, outcome in outcomes:
+        if not isinstance(outcome, BaseException):
+            if kind is traversal.MAPPING:
+                container[key] = outcome
+
+            else:
+                node.collection_pusher(container, outcome)
+
+            continue
+
+        if kind is traversal.MAPPING and isinstance(outcome, exc.IgnoreValue):
+            # just ignore this value
+            continue
+
+        if not isinstance(outcome, exc.Invalid):
+            raise outcome
+
+        if kind is traversal.COLLECTION:
+            outcome.name = key
+
+        invalids.append(outcome)
+
+        if len(invalids) == max_invalids:
+            raise exc.InvalidChildren(node, invalids, truncated=True)
+
+    if invalids:
+        # on invalids this item is also ``Invalid``
+        raise exc.InvalidChildren(node, invalids)
+
+    return _validate(node, container, environment, semaphore)
+
+
+def _validate(node, value, environment, semaphore):
+    """Apply the validator of the node.
+
+    :returns: the validated value or a :py:class:`Pending` result
+    """
+
+    if node._validator is None:                                         # pylint: disable=W0212
+        return value
+
+    try:
+        result = node._validator(node, value, environment)              # pylint: disable=W0212
+
+    except _errors as ex:
+        raise _invalid(node, value, ex)
+
+    if inspect.isawaitable(result):
+        return Pending(_await(node, value, result, semaphore))
+
+    return result
+
+
+async def _await(node, value, awaitable, semaphore):
+    """Await the result of an asynchronous validator."""
+
+    try:
+        if semaphore is None:
+            return await awaitable
+
+        async with semaphore:
+            return await awaitable
+
+    except _errors as ex:
+        raise _invalid(node, value, ex)
+
+
+async def _gather(node, kind, value, container, outcomes, environment, semaphore):     # pylint: disable=R0913
+    """Await all pending children concurrently and finish the container."""
+
+    results = iter(await asyncio.gather(
+        *(outcome.awaitable for _, outcome in outcomes if isinstance(outcome, Pending)),
+        return_exceptions=True
+    ))
+
+    outcomes = [
+        (key, next(results) if isinstance(outcome, Pending) else outcome)
+        for key, outcome in outcomes
+    ]
+
+    try:
+        result = _finish(node, kind, container, outcomes, environment, semaphore)
+
+    except _errors as ex:
+        raise _invalid(node, value, ex)
+
+    if isinstance(result, Pending):
+        return await result.awaitable
+
+    return result
+
+
+async def deserialize(node, value, environment=None, concurrency=None):
+    """Deserialize a value by a node and await all asynchronous validators.
+
+    :param node: the root node
+    :param value: the value to be deserialized
+    :param environment: additional environment
+    :param concurrency: the maximum number of validators awaited at once
+    """
+
+    semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+    result = begin(node, value, environment, semaphore)
+
+    if isinstance(result, Pending):
+        return await result.awaitable
+
+    return result
+
+
+async def chunked(node, value, environment=None,                        # pylint: disable=R0913
+                  chunk=100, interval=0.005, executor=None, **options):
+    """Deserialize a value without blocking the event loop for longer than ``interval``.
+
+    The value is deserialized by :py:func:`.traversal.steps`, which suspends after every ``chunk`` values of mappings
+    and collections. If ``interval`` seconds have passed since the event loop was last released, it is released
+    again. The result and the errors are the same as with :py:func:`.traversal.deserialize`. Validators are called
+    synchronously.
+
+    :param node: the root node
+    :param value: the value to be deserialized
+    :param environment: additional environment
+    :param chunk: the number of values deserialized between two checks of the clock
+    :param interval: the seconds after which the event loop is released or ``None`` to release it after every chunk
+    :param executor: deserialize the whole value by this :py:class:`concurrent.futures.Executor` instead
+    :param options: the limits of :py:func:`.traversal.deserialize`
+    """
+
+    if executor is not None:
+        return await asyncio.get_event_loop().run_in_executor(
+            executor, functools.partial(traversal.deserialize, node, value, environment, **options)
+        )
+
+    clock = time.perf_counter
+    released = clock()
+
+    for step in traversal.steps(node, value, environment, chunk=chunk, **options):
+        if step is not None:
+            return step[0]
+
+        if interval is None or clock() - released >= interval:
+            await asyncio.sleep(0)
+            released = clock()
@@ -0,0 +1,472 @@
+"""
+Caching of whole deserialization results.
+
+Clients, which retry or poll, send the same body again and again. A :py:class:`ResultCache` keeps the result of a
+deserialization by a hash of the raw body or of the canonical form of the value, of the schema and of the
+environment:
+
+.. code-block:: python
+
+    cache = ResultCache(max_bytes=16 * 1024 * 1024, ttl=60)
+    schema = Schema()
+
+    # the body is only parsed and deserialized on a miss
+    result = cache.loads(schema, request.body)
+
+    result = cache.deserialize(schema, value)
+
+Only valid results are cached. They are stored pickled, so every hit returns a fresh copy, which the caller may
+modify without affecting other hits.
+
+The schema is identified by the node instance, so the same node must be used for every call, a new node never
+hits. To share results between instances, e.g. of several processes, the same explicit ``schema`` key must be given
+for nodes with the same options. Results for an environment other than
+``None`` are only cached, if an ``environment_key`` function is given.
+
+By default the results are kept in the memory of the process. A :py:class:`FileStore` in a directory, e.g. on a
+``tmpfs`` like ``/dev/shm``, shares them between processes. The results are unpickled, so anybody, who can write to
+that directory, can run code in these processes. The directory is created only accessible by its owner and an
+existing one must not be writable by others.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import stat
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+import six
+
+
+_replace = getattr(os, 'replace', os.rename)
+
+
+class MemoryStore(object):
+
+    """Keeps pickled results in the memory of the process with LRU and TTL eviction."""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, ttl=None, clock=time.time):
+        """
+        :param max_bytes: the maximum size of all results
+        :param ttl: the seconds after which a result expires or ``None``
+        :param clock: the function to get the current time
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.clock = clock
+        self.size = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        """:returns: the data stored for the key or ``None``"""
+
+        with self._lock:
+            entry = self._data.pop(key, None)
+
+            if entry is None:
+                return None
+
+            expires, data = entry
+
+            if expires is not None and expires <= self.clock():
+                self.size -= len(data)
+
+                return None
+
+            # move the hit to the end
+            self._data[key] = entry
+
+            return data
+
+    def set(self, key, data):
+        """Store data for the key and evict the least recently used data beyond ``max_bytes``."""
+
+        if len(data) > self.max_bytes:
+            return
+
+        expires = self.clock() + self.ttl if self.ttl is not None else None
+
+        with self._lock:
+            previous = self._data.pop(key, None)
+
+            if previous is not None:
+                self.size -= len(previous[1])
+
+            self._data[key] = (expires, data)
+            self.size += len(data)
+
+            while self.size > self.max_bytes:
+                _, (_, evicted) = self._data.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self):
+        """Remove all data."""
+
+        with self._lock:
+            self._data.clear()
+            self.size = 0
+
+
+class FileStore(object):
+
+    """Keeps pickled results as files in a directory, which may be shared by several processes.
+
+    The modification time of a file is the time it was stored, the access time the time it was used last. The total
+    size is checked by scanning the directory, whenever this process wrote more than the remaining space at the last
+    scan.
+    """
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024, ttl=None, clock=time.time):
+        """
+        :param directory: the directory of the files, which is created if missing
+        :param max_bytes: the maximum size of all files
+        :param ttl: the seconds after which a result expires or ``None``
+        :param clock: the function to get the current time
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.clock = clock
+
+        # the size at the last scan and the bytes written by this process since then
+        self.size = 0
+        self._written = 0
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+
+        self._check_directory()
+
+    def _check_directory(self):
+        """Refuse a directory, where others may place files to be unpickled."""
+
+        if not hasattr(os, 'getuid'):
+            return
+
+        info = os.stat(self.directory)
+
+        if info.st_uid != os.getuid() or info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise ValueError("The directory `{}` must be owned by this user and not writable by others."
+                             .format(self.directory))
+
+    def _path(self, key):
+        return os.path.join(self.directory, key)
+
+    def get(self, key):
+        """:returns: the data stored for the key or ``None``"""
+
+        path = self._path(key)
+
+        try:
+            info = os.stat(path)
+
+            if self.ttl is not None and info.st_mtime + self.ttl <= self.clock():
+                os.remove(path)
+
+                return None
+
+            with open(path, 'rb') as f:
+                data = f.read()
+
+            # mark it as recently used
+            os.utime(path, (self.clock(), info.st_mtime))
+
+        except (IOError, OSError):
+            # missing or removed by another process
+            return None
+
+        return data
+
+    def set(self, key, data):
+        """Store data for the key and evict the least recently used files beyond ``max_bytes``."""
+
+        if len(data) > self.max_bytes:
+            return
+
+        fd, temp = tempfile.mkstemp(dir=self.directory, prefix='.')
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+
+            now = self.clock()
+            os.utime(temp, (now, now))
+
+            # atomic, so other processes never read partial data
+            _replace(temp, self._path(key))
+
+        except (IOError, OSError):
+            if os.path.exists(temp):
+                os.remove(temp)
+
+            raise
+
+        self._written += len(data)
+
+        if self.size + self._written > self.max_bytes:
+            self.evict()
+
+    def _entries(self):
+        for name in os.listdir(self.directory):
+            if name.startswith('.'):
+                # not yet complete
+                continue
+
+            path = self._path(name)
+
+            try:
+                yield path, os.stat(path)
+
+            except OSError:
+                pass
+
+    def evict(self):
+        """Remove expired files and the least recently used files beyond ``max_bytes``."""
+
+        now = self.clock()
+        entries = []
+
+        for path, info in self._entries():
+            if self.ttl is not None and info.st_mtime + self.ttl <= now:
+                self._remove(path)
+
+            else:
+                entries.append((info.st_atime, info.st_size, path))
+
+        entries.sort()
+        size = sum(entry[1] for entry in entries)
+
+        for _, file_size, path in entries:
+            if size <= self.max_bytes:
+                break
+
+            self._remove(path)
+            size -= file_size
+
+        self.size = size
+        self._written = 0
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+
+        except OSError:
+            # already removed by another process
+            pass
+
+    def clear(self):
+        """Remove all files."""
+
+        for path, _ in self._entries():
+            self._remove(path)
+
+        self.size = self._written = 0
+
+
+def _text(tag, data, parts):
+    parts.append(tag)
+    parts.append(str(len(data)).encode('ascii'))
+    parts.append(b':')
+    parts.append(data)
+
+
+def _encode(value, parts):
+    """Append the canonical form of a value to a list of bytes."""
+
+    kind = type(value)
+
+    if value is None:
+        parts.append(b'n')
+
+    elif kind is bool:
+        parts.append(b't' if value else b'f')
+
+    elif kind in six.integer_types:
+        _text(b'i', str(value).encode('ascii'), parts)
+
+    elif kind is float:
+        # distinguishes -0.0 and 0.0
+        _text(b'd', repr(value).encode('ascii'), parts)
+
+    elif kind is six.text_type:
+        _text(b's', value.encode('utf-8', 'surrogatepass') if six.PY3 else value.encode('utf-8'), parts)
+
+    elif kind is six.binary_type:
+        _text(b'b', value, parts)
+
+    elif kind is list or kind is tuple:
+        parts.append(b'l' if kind is list else b'u')
+
+        for item in value:
+            _encode(item, parts)
+
+        parts.append(b'e')
+
+    elif kind is dict:
+        items = []
+
+        for key, item in six.iteritems(value):
+            key_parts = []
+            _encode(key, key_parts)
+            items.append((b''.join(key_parts), item))
+
+        # sorted by the canonical form of the keys, which differs for different keys
+        items.sort(key=lambda encoded: encoded[0])
+        parts.append(b'm')
+
+        for key, item in items:
+            parts.append(key)
+            _encode(item, parts)
+
+        parts.append(b'e')
+
+    else:
+        raise TypeError("Unsupported type {!r}".format(kind))
+
+
+class ResultCache(object):
+
+    """Caches the results of deserialization by a hash of the input."""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, ttl=None, store=None, environment_key=None):
+        """
+        :param max_bytes: the maximum size of all pickled results in memory
+        :param ttl: the seconds after which a result expires or ``None``
+        :param store: a :py:class:`MemoryStore`, a :py:class:`FileStore` or another object with ``get`` and ``set``
+        :param environment_key: a function, which returns a string for an environment
+        """
+        self.store = store if store is not None else MemoryStore(max_bytes=max_bytes, ttl=ttl)
+        self.environment_key = environment_key
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def schema_key(node):
+        """:returns: the default key of the schema, which is unique for the node instance"""
+
+        key = node.__dict__.get('_cache_key')
+
+        if key is None:
+            cls = node.__class__
+            key = node._cache_key = '{}.{}:{}'.format(                  # pylint: disable=W0212
+                cls.__module__, getattr(cls, '__qualname__', cls.__name__), uuid.uuid4().hex
+            )
+
+        return key
+
+    @staticmethod
+    def canonical(value):
+        """:returns: the canonical form of the value as bytes or ``None`` if it contains other types than ``dict``,
+            ``list``, ``tuple``, text, bytes, numbers, ``bool`` and ``None``
+
+        Every value is tagged by its type, so e.g. ``{1: 'x'}`` and ``{'1': 'x'}`` or a list and a tuple differ.
+        """
+
+        parts = []
+
+        try:
+            _encode(value, parts)
+
+        except (TypeError, RuntimeError):
+            # not supported or nested too deep
+            return None
+
+        return b''.join(parts)
+
+    def key(self, node, payload, environment=None, schema=None):
+        """:returns: the hash of the schema, the environment and the payload or ``None`` if it is not cacheable"""
+
+        if environment is None:
+            environment_key = ''
+
+        elif self.environment_key is None:
+            return None
+
+        else:
+            environment_key = self.environment_key(environment)
+
+        digest = hashlib.sha256()
+
+        for part in (schema or self.schema_key(node), environment_key):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+
+        digest.update(payload)
+
+        return digest.hexdigest()
+
+    def _cached(self, key, deserialize):
+        if key is None:
+            return deserialize()
+
+        data = self.store.get(key)
+
+        if data is not None:
+            self.hits += 1
+
+            return pickle.loads(data)
+
+        self.misses += 1
+        result = deserialize()
+
+        try:
+            data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # not cacheable
+            return result
+
+        self.store.set(key, data)
+
+        # the caller gets a copy like on a hit
+        return pickle.loads(data)
+
+    def deserialize(self, node, value, environment=None, schema=None):
+        """Deserialize a value by the node or return a copy of a cached result.
+
+        :param node: the node
+        :param value: the value to be deserialized
+        :param environment: additional environment
+        :param schema: the key of the schema, the default is unique for the node instance
+        """
+
+        payload = self.canonical(value)
+        key = self.key(node, payload, environment, schema) if payload is not None else None
+
+        return self._cached(key, lambda: node.deserialize(value, environment))
+
+    def loads(self, node, data, environment=None, schema=None, loads=json.loads):
+        """Parse and deserialize raw data by the node or return a copy of a cached result.
+
+        :param node: the node
+        :param data: the raw data
+        :param environment: additional environment
+        :param schema: the key of the schema, the default is unique for the node instance
+        :param loads: the function to parse the raw data
+        """
+
+        payload = data.encode('utf-8') if isinstance(data, six.text_type) else bytes(data)
+        key = self.key(node, payload, environment, schema)
+
+        return self._cached(key, lambda: node.deserialize(loads(data), environment))
+
+    def stats(self):
+        """:returns: a dict of all statistics"""
+
+        lookups = self.hits + self.misses
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': float(self.hits) / lookups if lookups else 0.0,
+        }
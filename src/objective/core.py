@@ -6,11 +6,13 @@ De/serialization is done by traversing over the tree and take the
 """
 
 import functools
+import importlib
+import sys
 from collections import OrderedDict
 
 import six
 
-from . import exc, values
+from . import exc, memo, values
 
 
 class reify(object):
@@ -45,11 +47,7 @@ class Missing(object):
     def __call__(self, value):
         """Just raise a `MissingValue` exception."""
 
-        raise exc.MissingValue(
-            self.node,
-            value=value,
-            msg="Value for `{0}` is missing!".format(self.node.__name__)
-        )
+        raise exc.MissingValue(self.node, value=value)
 
 
 class Ignore(Missing):
@@ -77,20 +75,87 @@ class Item(object):
 
         return inst
 
+    owner = None
+    """The class this item was declared in."""
+
     def __init__(self, node_class=None, name=None, *args, **kwargs):
         """Prepares node class instantiation.
 
-        :param node_class: the type of the node
+        :param node_class: the type of the node, a forward reference by class name or a callable returning the type
         :param name: the explicit name of the node
+        :param source: the key or the dotted attribute name of the value to be serialized, the default is the name
         :param args: additional arguments for the node instantiation
         :param kwargs: additional keyword arguments for the node instantiation
 
         """
         self.node_class = node_class
         self.name = name
+        self.source = kwargs.pop('source', None)
         self.node_args = args
         self.node_kwargs = kwargs
 
+    @property
+    def node_class(self):
+        """Resolve a forward reference once and return the type of the node."""
+
+        node_class = self._node_class
+
+        if isinstance(node_class, six.string_types) \
+                or node_class is not None and not isinstance(node_class, type) and callable(node_class):
+            node_class = self._node_class = self.resolve(node_class)
+
+        return node_class
+
+    @node_class.setter
+    def node_class(self, node_class):
+        self._node_class = node_class
+
+    def resolve(self, reference):
+        """Resolve a forward reference.
+
+        A callable is just called. A dotted name is imported. A simple name is looked up starting at the class the
+        item was declared in, which is found by its own name, through the classes it is nested in and ending in the
+        module of that class.
+
+        :param reference: the name of a class or a callable returning the class
+        """
+
+        if not isinstance(reference, six.string_types):
+            return reference()
+
+        owner = self.owner
+
+        if owner is not None:
+            # walk the owner and the classes it is nested in, so a class created by a factory finds itself
+            scope = owner
+
+            while scope is not None:
+                if scope.__name__ == reference:
+                    return scope
+
+                nested = scope.__dict__.get(reference)
+
+                if isinstance(nested, type):
+                    return nested
+
+                scope = scope.__dict__.get('__enclosing__')
+
+            module = sys.modules.get(owner.__module__)
+
+            if hasattr(module, reference):
+                return getattr(module, reference)
+
+        if '.' in reference:
+            module_name, _, class_name = reference.rpartition('.')
+
+            try:
+                return getattr(importlib.import_module(module_name), class_name)
+
+            except (ImportError, AttributeError):
+                pass
+
+        raise ValueError("Unable to resolve `{}` for {!r}.".format(reference, self.name))
+
     def __get__(self, obj, cls=None):
         """Resolve the ``Node`` instance or return the ``Item`` instance."""
 
@@ -143,12 +208,29 @@ class Item(object):
             raise ValueError("You have to create an ``Item`` by calling ``__init__`` with ``node_class`` argument"
                              " or by decorating a ``Node`` class.")
 
+        # forward references of nested items are resolved in the scope of this item
+        for value in six.itervalues(self.node_kwargs):
+            if isinstance(value, Item) and value.owner is None:
+                value.owner = self.owner
+
         node = self.node_class(*self.node_args, **self.node_kwargs)
         node.__item__ = self
 
         return node
 
 
+def _nested_in(nested, cls):
+    """:returns: ``True`` if the class ``nested`` was defined in the body of ``cls``"""
+
+    qualname = getattr(cls, '__qualname__', None)
+
+    if qualname is None:
+        # python 2 has no qualified names, so take any class of the same module, which is not yet linked
+        return nested.__module__ == cls.__module__ and '__enclosing__' not in nested.__dict__
+
+    return getattr(nested, '__qualname__', None) == '{}.{}'.format(qualname, nested.__name__)
+
+
 class NodeMeta(type):
 
     """Performs ``Node`` instantiation by looking up ``Item`` instances."""
@@ -190,8 +272,22 @@ class NodeMeta(type):
             if isinstance(item, Item):
                 # set name if not already set by Item call
                 item.attach_name(node_name)
+
+                if item.owner is None:
+                    item.owner = cls
                 cls.__names__[item.name or node_name] = node_name
 
+        # to find unknown keys by a single set operation
+        cls.__keys__ = frozenset(cls.__names__)
+
+        # link the node classes declared in the body to this class to resolve their forward references
+        for value in six.itervalues(dct):
+            if isinstance(value, Item):
+                value = value._node_class                               # pylint: disable=W0212
+
+            if isinstance(value, NodeMeta) and _nested_in(value, cls):
+                value.__enclosing__ = cls
+
     def __contains__(cls, name):
         return name in cls.__names__
 
@@ -249,6 +345,12 @@ class Node(six.with_metaclass(NodeMeta)):
             )
 
 
+def passthrough(value, environment=None):                           # pylint: disable=W0613
+    """Serialize a value as it is."""
+
+    return value
+
+
 class Field(Node):
 
     """A ``Field`` describes the value of a ``Node``.
@@ -261,11 +363,18 @@ class Field(Node):
     # create a validator in the Field
     _validator = None
 
+    pure = False
+    """A pure field deserializes equal values to equal results without regard to the environment."""
+
+    memo = None
+    """The :py:class:`.memo.Memo` of a memoized field."""
+
     def __init__(self, validator=None, **kwargs):
         """Optionally Assigns the validator.
 
         :param validator: the validator to be used
         :param missing: action to be performed when the value is ``Undefined`` and therefor missing
+        :param memoize: ``True`` or a :py:class:`.memo.Memo` to reuse results of a pure field
 
         """
         super(Field, self).__init__(**kwargs)
@@ -280,6 +389,31 @@ class Field(Node):
         if 'missing' not in kwargs and kwargs.get('optional', False):
             self._missing = Ignore
 
+        memoize = kwargs.get('memoize')
+
+        if memoize is True or isinstance(memoize, memo.Memo):
+            self._memoize(memoize)
+
+    def _memoize(self, cache):
+        """Replace ``deserialize`` of this instance by a memoized version."""
+
+        # a plain function may depend on the environment
+        if not self.pure or not getattr(self._validator, 'pure', self._validator is None):
+            raise ValueError("{!r} is not pure and can not be memoized.".format(self))
+
+        if not isinstance(cache, memo.Memo):
+            cache = memo.Memo()
+
+        self.memo = cache
+        deserialize = self.deserialize
+
+        def memoized(value, environment=None):
+            scope = memo.active()
+
+            return (cache if scope is None else scope).deserialize(self, deserialize, value, environment)
+
+        self.deserialize = memoized
+
     def _resolve_value(self, value, environment=None):
         """Resolve the value.
 
@@ -313,7 +447,7 @@ class Field(Node):
 
         return value
 
-    def serialize(self, value, environment=None):
+    def serialize(self, value, environment=None, trusted=False):
         """Serialze a value into a transportable and interchangeable format.
 
         The default assumption is that the value is JSON e.g. string or number.
@@ -322,13 +456,46 @@ class Field(Node):
         Serialization should not be validated, since the developer app would be
         bounced, since the mistake comes from there - use unittests for this!
 
+        :param value: the value to be serialized
+        :param environment: additional environment
+        :param trusted: the value was produced by our own code, so only fields, which convert a value, are applied to
+            it and present values are not resolved, see :py:meth:`_compile_serializer`
         """
+
+        if trusted and value is not values.Undefined:
+            try:
+                return self._trusted_serializer(value, environment)
+
+            except (exc.Invalid, exc.UndefinedValue):
+                # an invalid or missing value, the regular serialization raises the proper error
+                pass
+
         value = self._resolve_value(value, environment)
 
         value = self._serialize(value, environment)
 
         return value
 
+    @reify
+    def _trusted_serializer(self):
+        return self._compile_serializer()
+
+    def _compile_serializer(self):
+        """Return a function to serialize a present and trusted value.
+
+        The result is the same as of ``serialize``. A field, which does not convert a value, just passes it through.
+        """
+
+        cls = self.__class__
+
+        if 'serialize' in self.__dict__ or six.get_unbound_function(cls.serialize) is not Field.__dict__['serialize']:
+            return self.serialize
+
+        if six.get_unbound_function(cls._serialize) is Field.__dict__['_serialize']:
+            return passthrough
+
+        return self._serialize
+
     def _deserialize(self, value, environment=None):              # pylint: disable=R0201
         """Derserialization worker method."""
 
@@ -360,3 +527,47 @@ class Field(Node):
             raise exc.InvalidValue(self, value=value, origin=ex)
 
         return value
+
+    def adeserialize(self, value, environment=None, concurrency=None):
+        """Deserialize a value and await asynchronous validators, see :py:mod:`.aio`.
+
+        :param value: the value to be deserialized
+        :param environment: additional environment
+        :param concurrency: the maximum number of validators awaited at once
+        :returns: an awaitable of the deserialized value
+        """
+
+        from . import aio
+
+        return aio.deserialize(self, value, environment, concurrency=concurrency)
+
+    def _check(self, value, environment=None):
+        """Validation worker method.
+
+        Applies the same rules as ``deserialize`` but is not obliged to build the result.
+        """
+
+        self.deserialize(value, environment)
+
+    def validate(self, value, environment=None, raises=False):
+        """Validate a value without keeping the deserialized result.
+
+        Containers traverse their children without creating the resulting mapping or collection, unless they have a
+        validator, which needs that result.
+
+        :param value: the value to be validated
+        :param environment: additional environment
+        :param raises: raise the ``Invalid`` error tree instead of returning ``False``
+        :returns: ``True`` if the value is valid
+        """
+
+        try:
+            self._check(value, environment)
+
+        except exc.Invalid:
+            if raises:
+                raise
+
+            return False
+
+        return True
@@ -1,3 +1,8 @@
+try:
+    from collections.abc import Sequence
+except ImportError:
+    from collections import Sequence
+
 from . import values
 
 
@@ -15,21 +20,58 @@ class InvalidValue(Invalid):
 
     """Raised when a type is not as expected."""
 
+    template = "Invalid value for `{name}`: {0.value}"
+    """The default message."""
+
+    code = 'invalid'
+    """A short identifier of the kind of error."""
+
     def __init__(self, node, msg=None, **kwargs):
         super(InvalidValue, self).__init__()
 
         self.node = node
         self.value = kwargs.pop("value", values.Undefined())
-        self.message = msg or "Invalid value for `{name}`: {0.value}"\
-            .format(self, name=self.node__name__)
+        self.origin = kwargs.pop("origin", None)
+
+        # a collection names the invalid value by its index
+        self.name = kwargs.pop("name", None)
+
+        # the message is formatted on first access, additional kwargs are used as format parameters
+        self.params = kwargs
+        self._message = msg
+        self._formatted = None
 
     def __repr__(self):
         return "<{0.__class__.__name__}: {0.node__name__} = {0.value}>"\
             .format(self)
 
+    @property
+    def message(self):
+        """Format the message on first access, so no time is wasted for messages nobody reads."""
+
+        if self._formatted is None:
+            msg = self._message
+
+            if not msg:
+                msg = self.template.format(self, name=self.node__name__, **self.params)
+
+            elif self.params:
+                msg = msg.format(self, name=self.node__name__, **self.params)
+
+            self._formatted = msg
+
+        return self._formatted
+
+    @message.setter
+    def message(self, msg):
+        self._formatted = msg
+
     @property
     def node__name__(self):
-        """Return the name of this node or its class name."""
+        """Return the name of this invalid value, of its node or the node class name."""
+
+        if self.name is not None:
+            return self.name
 
         return self.node.__name__ \
             if self.node.__name__ is not None else self.node.__class__.__name__              # pylint: disable=W0212
@@ -39,33 +81,210 @@ class InvalidChildren(InvalidValue):
 
     """Contains a list of previously raised Invalids."""
 
-    def __init__(self, node, children, **kwargs):
+    def __init__(self, node, children, truncated=False, **kwargs):
+        """
+        :param children: the invalid children
+        :param truncated: ``True`` if the traversal stopped after too many invalid children
+        """
         super(InvalidChildren, self).__init__(node, **kwargs)
 
         self.children = children
+        self.truncated = truncated
+
+    code = 'invalid_children'
 
     def __iter__(self):
-        """Traverse through children an yield name, child."""
+        """Traverse through all descendants and yield the path to and the descendant.
+
+        Every path is linked to the path of its parent, so the whole traversal takes linear time.
+        """
+
+        stack = [(None, iter(self.children))]
 
-        for invalid in self.children:
-            yield [invalid], invalid
+        while stack:
+            parent, children = stack[-1]
 
-            if isinstance(invalid, InvalidChildren):
-                for path, child in invalid:
-                    yield [invalid] + list(path), child
+            for invalid in children:
+                path = ErrorPath(parent, invalid)
+
+                yield path, invalid
+
+                if isinstance(invalid, InvalidChildren):
+                    stack.append((path, iter(invalid.children)))
+                    break
+
+            else:
+                stack.pop()
 
     def error_dict(self):
         return {
-            tuple(x.node__name__ for x in path): invalid
+            path.names(): invalid
             for path, invalid in self
         }
 
+    def error_list(self):
+        """Flatten all invalid descendants, which have no children, into a list of plain dicts.
+
+        :returns: a list of dicts with ``path``, ``code`` and ``message``, e.g. for an API response
+        """
+
+        return [
+            {'path': list(path.names()), 'code': invalid.code, 'message': invalid.message}
+            for path, invalid in self
+            if not isinstance(invalid, InvalidChildren)
+        ]
+
+
+def error_list(invalid):
+    """Flatten any invalid value into a list of plain dicts like :py:meth:`InvalidChildren.error_list`.
+
+    :returns: a list of dicts with ``path``, ``code`` and ``message``
+    """
+
+    if isinstance(invalid, InvalidChildren):
+        return invalid.error_list()
+
+    return [{
+        'path': [],
+        'code': getattr(invalid, 'code', InvalidValue.code),
+        'message': getattr(invalid, 'message', str(invalid)),
+    }]
+
+
+class ErrorPath(Sequence):
+
+    """The invalids from the first child down to an invalid descendant.
+
+    Only the link to the parent path is stored, the list of invalids is materialized on demand.
+    """
+
+    __slots__ = ('parent', 'invalid', '_invalids')
+
+    def __init__(self, parent, invalid):
+        self.parent = parent
+        self.invalid = invalid
+        self._invalids = None
+
+    @property
+    def invalids(self):
+        """:returns: the materialized list of invalids"""
+
+        if self._invalids is None:
+            invalids = []
+            path = self
+
+            while path is not None:
+                invalids.append(path.invalid)
+                path = path.parent
+
+            invalids.reverse()
+            self._invalids = invalids
+
+        return self._invalids
+
+    def names(self):
+        """:returns: a tuple of the names of all invalids"""
+
+        return tuple(invalid.node__name__ for invalid in self.invalids)
+
+    def __getitem__(self, index):
+        return self.invalids[index]
+
+    def __len__(self):
+        return len(self.invalids)
+
+    def __eq__(self, other):
+        return list(self) == list(other) if isinstance(other, Sequence) else NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return self.invalids + list(other)
+
+    def __radd__(self, other):
+        return list(other) + self.invalids
+
+    def __repr__(self):
+        return "<{0.__class__.__name__}: {1}>".format(self, self.names())
+
 
 class MissingValue(InvalidValue, UndefinedValue):
 
     """Raised when a value is not defined but seems to be mandatory."""
 
+    template = "Value for `{name}` is missing!"
+    code = 'missing'
+
+
+class ExtraValue(InvalidValue):
+
+    """Raised when a strict mapping gets a value for an unknown key."""
+
+    template = "Key `{name}` is not allowed!"
+    code = 'extra'
+
+
+class NotFinite(InvalidValue):
+
+    """Raised when a float is NaN or infinite, but only finite values are allowed."""
+
+    template = "Value of `{name}` is not finite: {0.value}"
+    code = 'not_finite'
+
 
 class IgnoreValue(UndefinedValue):
 
     """Raised when the undefined value shall be ignored."""
+
+
+class LimitExceeded(InvalidValue):
+
+    """Raised when a value crosses a declared limit."""
+
+    template = "Limit of {limit} exceeded for `{name}`"
+    code = 'limit'
+
+
+class LengthExceeded(LimitExceeded):
+
+    """Raised when a collection or a string is longer than allowed."""
+
+    template = "Length of `{name}` exceeds {limit}"
+    code = 'max_length'
+
+
+class DepthExceeded(LimitExceeded):
+
+    """Raised when a value is nested deeper than allowed."""
+
+    template = "Nesting depth of `{name}` exceeds {limit}"
+    code = 'max_depth'
+
+
+class ElementsExceeded(LimitExceeded):
+
+    """Raised when a value contains more elements than allowed."""
+
+    template = "Number of elements in `{name}` exceeds {limit}"
+    code = 'max_elements'
+
+
+class BelowMinimum(LimitExceeded):
+
+    """Raised when a value is less than allowed."""
+
+    template = "Value of `{name}` is less than {limit}"
+    code = 'minimum'
+
+
+class AboveMaximum(LimitExceeded):
+
+    """Raised when a value is greater than allowed."""
+
+    template = "Value of `{name}` is greater than {limit}"
+    code = 'maximum'
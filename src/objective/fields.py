@@ -1,3 +1,6 @@
+import array
+import base64
+import operator
 from datetime import datetime
 from collections import OrderedDict
 try:
@@ -11,13 +14,135 @@ import six
 from dateutil.parser import parse as dateutil_parse
 import pytz
 
-from . import core, exc, values
+from . import core, exc, memo, validation, values
 
 
-class CollectionMixin(object):
+def inherits(node, name, owner):
+    """:returns: ``True`` if the method of the node is the one defined by ``owner``"""
+
+    return name not in node.__dict__ \
+        and six.get_unbound_function(getattr(node.__class__, name)) is owner.__dict__[name]
+
+
+class ContainerMixin(object):
+
+    """Collects the invalid children of a container.
+
+    The traversal stops after ``max_errors`` invalid children or after the first one if ``fail_fast`` is set, so
+    rejecting garbage does not take longer than accepting valid values.
+    """
+
+    max_errors = None
+    fail_fast = False
+
+    max_depth = None
+    max_elements = None
+
+    def __init__(self, max_errors=None, fail_fast=None, max_depth=None, max_elements=None, **kwargs):
+        """
+        :param max_errors: the maximum number of invalid children to be collected
+        :param fail_fast: stop at the first invalid child
+        :param max_depth: the maximum number of nested containers including this one
+        :param max_elements: the maximum number of values in this and all nested containers
+        """
+        super(ContainerMixin, self).__init__(**kwargs)
+
+        if max_errors is not None:
+            self.max_errors = max_errors
+
+        if fail_fast is not None:
+            self.fail_fast = fail_fast
+
+        if max_depth is not None:
+            self.max_depth = max_depth
+
+        if max_elements is not None:
+            self.max_elements = max_elements
+
+    def deserialize(self, value, environment=None, inplace=False):
+        """Deserialize the value.
+
+        The limits for depth and elements are counted over all nested containers, so the explicit stack of
+        :py:mod:`.traversal` is used to enforce them during traversal.
+
+        :param inplace: convert the input dicts and lists in place, see :py:mod:`.inplace`
+        """
+
+        if inplace:
+            from .inplace import deserialize
+
+            return deserialize(self, value, environment)
+
+        if self.max_depth is None and self.max_elements is None:
+            return super(ContainerMixin, self).deserialize(value, environment)
+
+        from . import traversal
+
+        return traversal.deserialize(self, value, environment)
+
+    @property
+    def max_invalids(self):
+        """:returns: the number of invalid children to stop the traversal at or ``None``"""
+
+        return 1 if self.fail_fast else self.max_errors
+
+    @core.reify
+    def _checks_children(self):
+        """``True`` if the children may be checked without creating the container.
+
+        This is not possible for a validator, which needs the result, or if deserialization was overridden.
+        """
+
+        cls = self.__class__
+        owner = next(base for base in cls.__mro__ if '_check_children' in base.__dict__)
+
+        return self._validator is None \
+            and self.max_depth is None and self.max_elements is None \
+            and six.get_unbound_function(cls.deserialize) is ContainerMixin.__dict__['deserialize'] \
+            and six.get_unbound_function(cls._deserialize) is owner.__dict__.get('_deserialize')
+
+    @core.reify
+    def _inplace_type(self):
+        """The type of the values, which :py:mod:`.inplace` converts in place, or ``None``."""
+
+        if not inherits(self, 'deserialize', ContainerMixin) \
+                or self.max_depth is not None or self.max_elements is not None:
+            return None
+
+        if isinstance(self, Mapping):
+            if self._type is dict and inherits(self, '_create_deserialize_type', Mapping) \
+                    and inherits(self, '_deserialize', Mapping):
+                return dict
+
+        elif isinstance(self, CollectionMixin):
+            if self.collection_type is list and self.collection_pusher is CollectionMixin.collection_pusher \
+                    and inherits(self, '_deserialize', CollectionMixin):
+                return list
+
+        return None
+
+    def _check(self, value, environment=None):
+        if not self._checks_children:
+            return super(ContainerMixin, self)._check(value, environment)
+
+        value = self._resolve_value(value, environment)
+
+        try:
+            self._check_children(value, environment)
+
+        except exc.InvalidValue:
+            raise
+
+        except (exc.Invalid, ValueError, TypeError) as ex:
+            raise exc.InvalidValue(self, value=value, origin=ex)
+
+
+class CollectionMixin(ContainerMixin):
     items = core.Item(core.Field)
     collection_type = list
 
+    max_length = None
+
     @staticmethod
     def collection_pusher(col, x):
         col.append(x)
@@ -30,6 +155,21 @@ class CollectionMixin(object):
             inst.__dict__['items'] = items.__get__(inst, cls)
         return inst
 
+    def __init__(self, max_length=None, **kwargs):
+        """
+        :param max_length: the maximum number of items
+        """
+        super(CollectionMixin, self).__init__(**kwargs)
+
+        if max_length is not None:
+            self.max_length = max_length
+
+    def _check_length(self, value):
+        """Raise ``LengthExceeded`` before any item is traversed."""
+
+        if self.max_length is not None and len(value) > self.max_length:
+            raise exc.LengthExceeded(self, value=value, limit=self.max_length)
+
     def _serialize(self, value, environment=None):
         value = super(CollectionMixin, self)._serialize(value, environment)
 
@@ -40,32 +180,93 @@ class CollectionMixin(object):
 
         return collection
 
-    def _deserialize(self, value, environment=None):
-        """A collection traverses over something to deserialize its value."""
+    def _compile_serializer(self):
+        if not (inherits(self, 'serialize', core.Field) and inherits(self, '_serialize', CollectionMixin)):
+            return super(CollectionMixin, self)._compile_serializer()
+
+        items = self.items
+
+        def serialize(value, environment=None):
+            # compiled on first use, since the items may be of the same class
+            items_serializer = items._trusted_serializer                 # pylint: disable=W0212
+
+            if items_serializer is core.passthrough:
+                return list(value)
+
+            return [items_serializer(subvalue, environment) for subvalue in value]
+
+        return serialize
+
+    def _deserialize_container(self, value, environment=None):
+        """Check the value and create the empty collection to be filled."""
 
         if not isinstance(value, CollectionABC):
             raise exc.Invalid(self)
 
-        items_class = self.items.__class__
-        invalids = []
+        self._check_length(value)
 
-        # traverse items and match against validated struct
-        collection = self.collection_type()
+        return self.collection_type()
+
+    def _deserialize_children(self, value, environment=None):
+        """Yield the key, the node and the value of every item to be deserialized."""
+
+        # all items share the same node
+        items = self.items
 
         for i, subvalue in enumerate(value):
-            item = items_class(name=i)
+            yield i, items, subvalue
+
+    def _deserialize(self, value, environment=None):
+        """A collection traverses over something to deserialize its value."""
+
+        collection = self._deserialize_container(value, environment)
+
+        invalids = []
+        max_invalids = self.max_invalids
+
+        # traverse items and match against validated struct
+        for i, item, subvalue in self._deserialize_children(value, environment):
             try:
                 self.collection_pusher(collection, item.deserialize(subvalue, environment=environment))
 
             except exc.Invalid as ex:
+                ex.name = i
                 invalids.append(ex)
 
+                if len(invalids) == max_invalids:
+                    raise exc.InvalidChildren(self, invalids, truncated=True)
+
         if invalids:
             # on invalids this item is also ``Invalid``
             raise exc.InvalidChildren(self, invalids)
 
         return collection
 
+    def _check_children(self, value, environment=None):
+        """Check all items like ``_deserialize`` without creating the collection."""
+
+        if not isinstance(value, CollectionABC):
+            raise exc.Invalid(self)
+
+        self._check_length(value)
+
+        invalids = []
+        max_invalids = self.max_invalids
+
+        for i, item, subvalue in self._deserialize_children(value, environment):
+            try:
+                item._check(subvalue, environment)                     # pylint: disable=W0212
+
+            except exc.Invalid as ex:
+                ex.name = i
+                invalids.append(ex)
+
+                if len(invalids) == max_invalids:
+                    raise exc.InvalidChildren(self, invalids, truncated=True)
+
+        if invalids:
+            raise exc.InvalidChildren(self, invalids)
+
 
 class Set(CollectionMixin, core.Field):
     collection_type = set
@@ -79,12 +280,122 @@ class List(CollectionMixin, core.Field):
     pass
 
 
-class Mapping(core.Field):
+def interner(intern, validator=None):
+    """Resolve the ``intern`` option of a node.
+
+    :param intern: ``True``, a :py:class:`.memo.Interner`, ``False`` or ``None``
+    :param validator: the validator of the node, whose text choices are always interned
+    :returns: the :py:class:`.memo.Interner` or ``None``
+    """
+
+    if intern is None or intern is False:
+        return None
+
+    table = intern if isinstance(intern, memo.Interner) else memo.Interner()
+
+    if isinstance(validator, validation.OneOf) and isinstance(validator.choices, (list, tuple, set, frozenset)):
+        for choice in validator.choices:
+            if isinstance(choice, six.text_type):
+                table.add(choice)
+
+    return table
+
+
+def ignores_missing(node):
+    """:returns: ``True`` if the node always ignores a missing value, so it need not be deserialized at all"""
+
+    return node._missing is core.Ignore and (                           # pylint: disable=W0212
+        six.get_unbound_function(node.__class__.deserialize) in _ignoring_deserializers
+    )
+
+
+_ignoring_deserializers = (
+    six.get_unbound_function(core.Field.deserialize),
+    six.get_unbound_function(ContainerMixin.deserialize),
+)
+
+
+class Forbidden(core.Field):
+
+    """Rejects any value, e.g. for an unknown key of a strict mapping."""
+
+    def _deserialize(self, value, environment=None):
+        raise exc.ExtraValue(self, value=value)
+
+
+class Mapping(ContainerMixin, core.Field):
+
+    """A ``Mapping`` resembles a :py:obj:`dict` like structure.
 
-    """A ``Mapping`` resembles a :py:obj:`dict` like structure."""
+    Values for unknown keys are ignored by default. With ``extra='forbid'`` or ``strict=True`` each of them is
+    reported as :py:class:`.exc.ExtraValue` and with ``extra='keep'`` they are passed through as they are.
+
+    The keys of the result are the names of the items, so all results share the same key strings. With ``intern`` the
+    kept unknown keys are interned as well.
+    """
 
     _type = dict
 
+    extra = 'ignore'
+    extras = ('forbid', 'ignore', 'keep')
+
+    sparse_ratio = 2
+    """Look up the keys of a value instead of all items, if there are that many times more items than keys.
+
+    ``None`` always looks up all items."""
+
+    intern = None
+
+    def __init__(self, extra=None, strict=None, intern=None, **kwargs):
+        """
+        :param extra: ``'forbid'``, ``'ignore'`` or ``'keep'`` values for unknown keys
+        :param strict: a shortcut for ``extra='forbid'``
+        :param intern: ``True`` or a :py:class:`.memo.Interner` for the kept unknown keys
+        """
+        super(Mapping, self).__init__(**kwargs)
+
+        if intern is not None:
+            self.intern = intern
+
+        if strict:
+            extra = 'forbid'
+
+        if extra is not None:
+            if extra not in self.extras:
+                raise ValueError("`extra` must be one of {}: {!r}".format(', '.join(self.extras), extra))
+
+            self.extra = extra
+
+    @core.reify
+    def _interner(self):
+        """The :py:class:`.memo.Interner` of the kept unknown keys or ``None``."""
+
+        return interner(self.intern)
+
+    @core.reify
+    def _passthrough(self):
+        """The node for values of unknown keys to be kept."""
+
+        return core.Field()
+
+    @core.reify
+    def _children(self):
+        """The name, the node and if a missing value is ignored for all items in order."""
+
+        return tuple((name, item, ignores_missing(item)) for name, item in self)
+
+    @core.reify
+    def _positions(self):
+        """The position of every item by name."""
+
+        return {name: i for i, (name, _, _) in enumerate(self._children)}
+
+    @core.reify
+    def _required(self):
+        """The positions of the items, which do not ignore a missing value."""
+
+        return tuple(i for i, (_, _, optional) in enumerate(self._children) if not optional)
+
     def _create_serialize_type(self, value, environment=None):
         """Resolve the type for serialization."""
 
@@ -95,18 +406,42 @@ class Mapping(core.Field):
 
         return self._type()
 
+    @core.reify
+    def _sources(self):
+        """The name, the node, the source key and the attribute getter of all items in order."""
+
+        sources = []
+
+        for name, item in self:
+            source = item.__item__.source or name
+
+            sources.append((name, item, source, operator.attrgetter(source)))
+
+        return tuple(sources)
+
     def _serialize(self, value, environment=None):
+        """Serialize a mapping or any object by the attributes named like the items or by their ``source``."""
 
         mapping = self._create_serialize_type(value, environment)
 
         invalids = []
+        undefined = values.Undefined
+        is_mapping = isinstance(value, MappingABC)
+
+        for name, item, source, getter in self._sources:
+            if is_mapping:
+                subvalue = value.get(source, undefined)
+
+            else:
+                try:
+                    subvalue = getter(value)
+
+                except AttributeError:
+                    subvalue = undefined
 
-        for name, item in self:
             # serialize each item
             try:
-                mapping[name] = item.serialize(
-                    value.get(name, values.Undefined), environment
-                )
+                mapping[name] = item.serialize(subvalue, environment)
 
             except exc.IgnoreValue:
                 # just ignore this value
@@ -122,27 +457,131 @@ class Mapping(core.Field):
 
         return mapping
 
+    def _compile_serializer(self):
+        if not (inherits(self, 'serialize', core.Field) and inherits(self, '_serialize', Mapping)):
+            return super(Mapping, self)._compile_serializer()
+
+        # and if a missing value is ignored anyway
+        sources = tuple(
+            (name, item, source, getter,
+             item._missing is core.Ignore and inherits(item, 'serialize', core.Field))       # pylint: disable=W0212
+            for name, item, source, getter in self._sources
+        )
+        create = self._create_serialize_type
+        undefined = values.Undefined
+
+        def serialize(value, environment=None):
+            mapping = create(value, environment)
+            is_mapping = isinstance(value, MappingABC)
+
+            for name, item, source, getter, skip in sources:
+                if is_mapping:
+                    subvalue = value.get(source, undefined)
+
+                else:
+                    try:
+                        subvalue = getter(value)
+
+                    except AttributeError:
+                        subvalue = undefined
+
+                if subvalue is undefined:
+                    if skip:
+                        continue
+
+                    # resolve the missing value
+                    try:
+                        mapping[name] = item.serialize(subvalue, environment)
+
+                    except exc.IgnoreValue:
+                        pass
+
+                else:
+                    mapping[name] = item._trusted_serializer(subvalue, environment)     # pylint: disable=W0212
+
+            return mapping
+
+        return serialize
+
+    def _deserialize_container(self, value, environment=None):
+        """Check the value and create the empty mapping to be filled."""
+
+        if not isinstance(value, MappingABC):
+            raise exc.Invalid(self)
+
+        return self._create_deserialize_type(value, environment)
+
+    def _deserialize_children(self, value, environment=None):
+        """Yield the name, the node and the value of every item to be deserialized.
+
+        Items, which ignore a missing value, are skipped if their key is missing.
+        """
+
+        children = self._children
+        ratio = self.sparse_ratio
+
+        if ratio is not None and len(value) * ratio < len(children):
+            # a sparse value: look up its keys and add the required items
+            positions = self._positions
+            found = [i for i in six.moves.map(positions.get, value) if i is not None]
+            found.extend(i for i in self._required if children[i][0] not in value)
+
+            # in order of the items
+            found.sort()
+
+            for i in found:
+                name, item, _ = children[i]
+
+                yield name, item, value.get(name, values.Undefined)
+
+        else:
+            undefined = values.Undefined
+
+            for name, item, optional in children:
+                subvalue = value.get(name, undefined)
+
+                if subvalue is undefined and optional:
+                    continue
+
+                yield name, item, subvalue
+
+        if self.extra == 'ignore':
+            return
+
+        unknown = six.viewkeys(value) - self.__keys__
+
+        if unknown:
+            intern = self._interner
+
+            # keep the order of the value
+            for name in value:
+                if name in unknown:
+                    if self.extra == 'forbid':
+                        yield name, Forbidden(name=name), value[name]
+
+                    elif intern is not None and isinstance(name, six.string_types):
+                        yield intern(name), self._passthrough, value[name]
+
+                    else:
+                        yield name, self._passthrough, value[name]
+
     def _deserialize(self, value, environment=None):
         """A collection traverses over something to deserialize its value.
 
         :param value: a ``dict`` wich contains mapped values
         """
 
-        if not isinstance(value, MappingABC):
-            raise exc.Invalid(self)
-
         # traverse items and match against validated struct
-        mapping = self._create_deserialize_type(value, environment)
+        mapping = self._deserialize_container(value, environment)
 
         invalids = []
+        max_invalids = self.max_invalids
 
-        for name, item in self:
+        for name, item, subvalue in self._deserialize_children(value, environment):
 
             # deserialize each item
             try:
-                mapping[name] = item.deserialize(
-                    value.get(name, values.Undefined), environment
-                )
+                mapping[name] = item.deserialize(subvalue, environment)
 
             except exc.IgnoreValue:
                 # just ignore this value
@@ -152,12 +591,40 @@ class Mapping(core.Field):
                 # append this to the list of invalids, so we can return a complete overview of errors
                 invalids.append(ex)
 
+                if len(invalids) == max_invalids:
+                    raise exc.InvalidChildren(self, invalids, truncated=True)
+
         if invalids:
             # on invalids this item is also ``Invalid``
             raise exc.InvalidChildren(self, invalids)
 
         return mapping
 
+    def _check_children(self, value, environment=None):
+        """Check all items like ``_deserialize`` without creating the mapping."""
+
+        if not isinstance(value, MappingABC):
+            raise exc.Invalid(self)
+
+        invalids = []
+        max_invalids = self.max_invalids
+
+        for _, item, subvalue in self._deserialize_children(value, environment):
+            try:
+                item._check(subvalue, environment)                     # pylint: disable=W0212
+
+            except exc.IgnoreValue:
+                pass
+
+            except exc.Invalid as ex:
+                invalids.append(ex)
+
+                if len(invalids) == max_invalids:
+                    raise exc.InvalidChildren(self, invalids, truncated=True)
+
+        if invalids:
+            raise exc.InvalidChildren(self, invalids)
+
 
 class BunchMapping(Mapping):
 
@@ -173,13 +640,217 @@ class OrderedMapping(Mapping):
     _type = OrderedDict
 
 
+class Union(core.Field):
+
+    """Deserializes a value by one of several nodes.
+
+    If a ``discriminator`` key is defined, its value is used to look up the node class in the ``choices`` mapping.
+    Without a discriminator or if the value lacks that key, all ``choices`` are tried in order and the first valid
+    result wins.
+
+    .. code-block:: python
+
+        class Event(objective.List):
+            items = objective.Item(objective.Union, discriminator='type', choices={
+                'created': Created,
+                'deleted': Deleted,
+            })
+
+    """
+
+    discriminator = None
+    choices = ()
+
+    def __init__(self, choices=None, discriminator=None, **kwargs):
+        """
+        :param choices: a mapping of discriminator values to node classes or a sequence of node classes
+        :param discriminator: the key of the value, which selects the node class
+        """
+
+        super(Union, self).__init__(**kwargs)
+
+        if choices is not None:
+            self.choices = choices
+
+        if discriminator is not None:
+            self.discriminator = discriminator
+
+        if self.discriminator is not None and not isinstance(self.choices, MappingABC):
+            raise ValueError("A `discriminator` needs a mapping of `choices`: {!r}".format(self.choices))
+
+    @core.reify
+    def _dispatch(self):
+        """Instantiate one node per class, which carries the name of this node."""
+
+        nodes = {}
+
+        return {
+            key: nodes.setdefault(node_class, node_class(name=self.__name__))
+            for key, node_class in six.iteritems(self.choices)
+        }
+
+    @core.reify
+    def _trial(self):
+        """Instantiate the nodes to be tried in order.
+
+        Every node is named by its class or by its index, if that name is taken, so the reasons of all failed trials
+        have distinct paths.
+        """
+
+        choices = self.choices
+
+        if isinstance(choices, MappingABC):
+            choices = choices.values()
+
+        nodes = []
+        names = set()
+
+        for node_class in choices:
+            if node_class in (node.__class__ for node in nodes):
+                continue
+
+            name = node_class.__name__
+
+            if name in names:
+                name = len(nodes)
+
+            names.add(name)
+            nodes.append(node_class(name=name))
+
+        return nodes
+
+    def _choose(self, value):
+        """:returns: the node selected by the discriminator or ``None``"""
+
+        if self.discriminator is None or not isinstance(value, MappingABC):
+            return None
+
+        key = value.get(self.discriminator, values.Undefined)
+
+        if key is values.Undefined:
+            return None
+
+        try:
+            return self._dispatch[key]
+
+        except KeyError:
+            raise exc.InvalidValue(
+                self,
+                msg="Invalid value `{key}` for discriminator `{discriminator}`",
+                value=value,
+                key=key,
+                discriminator=self.discriminator
+            )
+
+    def _try(self, method, value, environment=None):
+        """Try all nodes in order and return the first valid result."""
+
+        invalids = []
+
+        for node in self._trial:
+            try:
+                return getattr(node, method)(value, environment)
+
+            except exc.Invalid as ex:
+                invalids.append(ex)
+
+        # the reasons of all failed trials
+        raise exc.InvalidChildren(self, invalids, value=value)
+
+    def _serialize(self, value, environment=None):
+        node = self._choose(value)
+
+        if node is None:
+            return self._try('serialize', value, environment)
+
+        return node.serialize(value, environment)
+
+    def _deserialize(self, value, environment=None):
+        node = self._choose(value)
+
+        if node is None:
+            return self._try('deserialize', value, environment)
+
+        return node.deserialize(value, environment)
+
+    def _check(self, value, environment=None):
+        if self._validator is not None:
+            return super(Union, self)._check(value, environment)
+
+        value = self._resolve_value(value, environment)
+
+        try:
+            node = self._choose(value)
+
+            if node is None:
+                self._try('_check', value, environment)
+
+            else:
+                node._check(value, environment)                         # pylint: disable=W0212
+
+        except exc.InvalidValue:
+            raise
+
+        except (exc.Invalid, ValueError, TypeError) as ex:
+            raise exc.InvalidValue(self, value=value, origin=ex)
+
+
+_buffers = (six.binary_type, bytearray, memoryview)
+
+
+def as_bytes(value):
+    """Return a buffer of bytes for a bytes-like value without copying it if possible.
+
+    A ``memoryview`` of another format is cast to bytes. Only a non-contiguous ``memoryview`` is copied.
+    """
+
+    if not isinstance(value, memoryview):
+        return value
+
+    if getattr(value, 'c_contiguous', False):
+        return value if value.format == 'B' and value.ndim == 1 else value.cast('B')
+
+    # python 2 or not contiguous
+    return value.tobytes()
+
+
+def array_frombytes(typecode, value):
+    """:returns: an array of the numbers in the machine representation of a bytes-like value"""
+
+    numbers = array.array(typecode)
+
+    if six.PY2:
+        # python 2 has no ``frombytes``
+        numbers.fromstring(bytes(value))
+
+    else:
+        numbers.frombytes(value)
+
+    return numbers
+
+
+def array_tobytes(numbers):
+    """:returns: the machine representation of an array or a ``memoryview`` as bytes"""
+
+    if six.PY2 and isinstance(numbers, array.array):
+        # python 2 has no ``tobytes``
+        return numbers.tostring()
+
+    return numbers.tobytes()
+
+
 class Number(core.Field):
 
     """Represents a numeric value ``float`` or ``int``."""
 
+    pure = True
+
     types = (int, float)
 
     def _deserialize(self, value, environment=None):
+        if isinstance(value, memoryview):
+            value = as_bytes(value)
+
         for _type in self.types:
             try:
                 casted = _type(value)
@@ -190,19 +861,86 @@ class Number(core.Field):
 
         raise exc.InvalidValue(
             self,
-            msg="Invalid value `{value}` for `{types}`".format(
-                value=value, types=self.types
-            ),
-            value=value
+            msg="Invalid value `{0.value}` for `{types}`",
+            value=value,
+            types=self.types
         )
 
 
 class Float(Number):
 
-    """Represents a ``float`` value."""
+    """Represents a ``float`` value.
+
+    NaN and infinite values are allowed by default. With ``nan='null'`` they are serialized as ``None`` and with
+    ``nan='forbid'`` they are rejected as :py:class:`.exc.NotFinite`. A ``precision`` rounds serialized values to that
+    many decimal digits.
+    """
 
     types = (float,)
 
+    nan = 'allow'
+    nans = ('allow', 'forbid', 'null')
+
+    precision = None
+
+    def __init__(self, nan=None, precision=None, **kwargs):
+        """
+        :param nan: ``'allow'``, ``'forbid'`` or ``'null'`` NaN and infinite values
+        :param precision: the number of decimal digits of serialized values
+        """
+        super(Float, self).__init__(**kwargs)
+
+        if nan is not None:
+            if nan not in self.nans:
+                raise ValueError("`nan` must be one of {}: {!r}".format(', '.join(self.nans), nan))
+
+            self.nan = nan
+
+        if precision is not None:
+            self.precision = precision
+
+    def _deserialize(self, value, environment=None):
+        value = super(Float, self)._deserialize(value, environment)
+
+        # only NaN and infinity are not 0.0
+        if self.nan == 'forbid' and value - value != 0.0:
+            raise exc.NotFinite(self, value=value)
+
+        return value
+
+    def _serialize(self, value, environment=None):
+        if isinstance(value, float) and value - value != 0.0:
+            if self.nan == 'null':
+                return None
+
+            if self.nan == 'forbid':
+                raise exc.NotFinite(self, value=value)
+
+            return value
+
+        if self.precision is not None and isinstance(value, (int, float)):
+            return round(value, self.precision)
+
+        return value
+
+    def _compile_serializer(self):
+        if not (inherits(self, 'serialize', core.Field) and inherits(self, '_serialize', Float)):
+            return super(Float, self)._compile_serializer()
+
+        if self.precision is None and self.nan == 'allow':
+            return core.passthrough
+
+        precision = self.precision
+        serialize_ = self._serialize
+
+        def serialize(value, environment=None):
+            if value.__class__ is float and value - value == 0.0:
+                return value if precision is None else round(value, precision)
+
+            return serialize_(value, environment)
+
+        return serialize
+
 
 class Int(Number):
 
@@ -213,13 +951,45 @@ class Int(Number):
 
 class Unicode(core.Field):
 
-    """Represents a text string."""
+    """Represents a text string.
+
+    With ``intern`` equal strings share one object, e.g. for statuses or country codes held by many records. Short
+    strings and the choices of a :py:class:`.validation.OneOf` validator are interned.
+    """
+
+    pure = True
 
     encoding = "utf-8"
+    max_length = None
+
+    intern = None
+
+    def __init__(self, max_length=None, intern=None, **kwargs):
+        """
+        :param max_length: the maximum number of characters
+        :param intern: ``True`` or a :py:class:`.memo.Interner` shared by several fields
+        """
+        super(Unicode, self).__init__(**kwargs)
+
+        if max_length is not None:
+            self.max_length = max_length
+
+        if intern is not None:
+            self.intern = intern
+
+    @core.reify
+    def _interner(self):
+        """The :py:class:`.memo.Interner` of this field or ``None``."""
+
+        return interner(self.intern, self._validator)
 
     def _deserialize(self, value, environment=None):
         # ensure we have a unicode afterwards
 
+        if isinstance(value, memoryview):
+            # decode the buffer in place
+            value = as_bytes(value)
+
         try:
             value = six.text_type(value, self.encoding)
 
@@ -227,10 +997,191 @@ class Unicode(core.Field):
             # may be we have an integer or another number
             value = six.text_type(value)
 
+        if self.max_length is not None and len(value) > self.max_length:
+            raise exc.LengthExceeded(self, value=value, limit=self.max_length)
+
+        if self._interner is not None:
+            value = self._interner(value)
+
         return value
 
     def _serialize(self, value, environment=None):
-        return six.text_type(value)
+        return value if value.__class__ is six.text_type else six.text_type(value)
+
+    def _compile_serializer(self):
+        if not (inherits(self, 'serialize', core.Field) and inherits(self, '_serialize', Unicode)):
+            return super(Unicode, self)._compile_serializer()
+
+        text_type = six.text_type
+
+        def serialize(value, environment=None):                         # pylint: disable=W0613
+            return value if value.__class__ is text_type else text_type(value)
+
+        return serialize
+
+
+class Bytes(core.Field):
+
+    """Represents a byte string.
+
+    Text is encoded and a ``bytearray`` or ``memoryview`` is copied into ``bytes``. If ``zero_copy`` is set, a
+    ``memoryview`` of the buffer is kept instead, which is only valid as long as the buffer is not modified.
+    """
+
+    pure = True
+
+    encoding = "utf-8"
+    zero_copy = False
+    max_length = None
+
+    def __init__(self, zero_copy=None, max_length=None, **kwargs):
+        """
+        :param zero_copy: keep a ``memoryview`` of a buffer instead of copying it
+        :param max_length: the maximum number of bytes
+        """
+        super(Bytes, self).__init__(**kwargs)
+
+        if zero_copy is not None:
+            self.zero_copy = zero_copy
+
+        if max_length is not None:
+            self.max_length = max_length
+
+    def _deserialize(self, value, environment=None):
+        if isinstance(value, six.text_type):
+            value = value.encode(self.encoding)
+
+        elif isinstance(value, (bytearray, memoryview)):
+            value = as_bytes(value)
+            value = memoryview(value) if self.zero_copy else six.binary_type(value)
+
+        elif not isinstance(value, six.binary_type):
+            raise exc.Invalid(self)
+
+        if self.max_length is not None and len(value) > self.max_length:
+            raise exc.LengthExceeded(self, value=value, limit=self.max_length)
+
+        return value
+
+    def _serialize(self, value, environment=None):
+        if isinstance(value, memoryview):
+            return value.tobytes()
+
+        return six.binary_type(value)
+
+
+class Array(core.Field):
+
+    """Represents a sequence of numbers of the same type as :py:class:`array.array`.
+
+    A sequence of numbers is converted at once, text is decoded by base64 and a bytes-like value is taken as the
+    machine representation of the numbers. If ``zero_copy`` is set, a ``memoryview`` of decoded or given bytes is
+    kept instead of copying them into an array, python 2 always copies them, since it can not cast a ``memoryview``.
+
+    .. code-block:: python
+
+        class Sample(objective.Mapping):
+            values = objective.Item(objective.Array, typecode='d', minimum=0)
+
+    """
+
+    typecode = 'd'
+    zero_copy = False
+    max_length = None
+    minimum = None
+    maximum = None
+
+    output = 'list'
+    outputs = ('list', 'bytes', 'base64')
+
+    def __init__(self, typecode=None, zero_copy=None,           # pylint: disable=R0913
+                 max_length=None, minimum=None, maximum=None, output=None, **kwargs):
+        """
+        :param typecode: the type of the numbers as for :py:class:`array.array`
+        :param zero_copy: keep a ``memoryview`` of bytes instead of copying them
+        :param max_length: the maximum number of numbers
+        :param minimum: the minimum of all numbers
+        :param maximum: the maximum of all numbers
+        :param output: serialize to a ``'list'``, to ``'bytes'`` or to ``'base64'`` text
+        """
+        super(Array, self).__init__(**kwargs)
+
+        for name, value in (('typecode', typecode), ('zero_copy', zero_copy), ('max_length', max_length),
+                            ('minimum', minimum), ('maximum', maximum), ('output', output)):
+            if value is not None:
+                setattr(self, name, value)
+
+        if self.output not in self.outputs:
+            raise ValueError("`output` must be one of {}: {!r}".format(', '.join(self.outputs), self.output))
+
+    @core.reify
+    def _number(self):
+        """The type to convert single numbers to."""
+
+        return float if self.typecode in 'fd' else int
+
+    def _deserialize(self, value, environment=None):
+        typecode = self.typecode
+
+        if isinstance(value, array.array) and value.typecode == typecode:
+            numbers = value
+
+        else:
+            if isinstance(value, six.text_type):
+                value = base64.b64decode(value)
+
+            if isinstance(value, _buffers):
+                buf = as_bytes(value)
+
+                if self.zero_copy and not six.PY2:
+                    numbers = memoryview(buf).cast(typecode)
+
+                else:
+                    numbers = array_frombytes(typecode, buf)
+
+            else:
+                try:
+                    try:
+                        # convert all at once
+                        numbers = array.array(typecode, value)
+
+                    except TypeError:
+                        # e.g. numbers as strings
+                        numbers = array.array(typecode, six.moves.map(self._number, value))
+
+                except OverflowError as ex:
+                    raise exc.InvalidValue(self, value=value, origin=ex)
+
+        self._check_limits(numbers)
+
+        return numbers
+
+    def _check_limits(self, numbers):
+        if self.max_length is not None and len(numbers) > self.max_length:
+            raise exc.LengthExceeded(self, value=numbers, limit=self.max_length)
+
+        if not numbers:
+            return
+
+        if self.minimum is not None and min(numbers) < self.minimum:
+            raise exc.BelowMinimum(self, value=numbers, limit=self.minimum)
+
+        if self.maximum is not None and max(numbers) > self.maximum:
+            raise exc.AboveMaximum(self, value=numbers, limit=self.maximum)
+
+    def _serialize(self, value, environment=None):
+        if self.output == 'list':
+            return value.tolist() if isinstance(value, (array.array, memoryview)) else list(value)
+
+        if not isinstance(value, (array.array, memoryview)):
+            value = array.array(self.typecode, value)
+
+        value = array_tobytes(value)
+
+        if self.output == 'base64':
+            return base64.b64encode(value).decode('ascii')
+
+        return value
 
 
 def totimestamp(dt, epoch=datetime(1970, 1, 1, tzinfo=pytz.utc)):
@@ -239,17 +1190,88 @@ def totimestamp(dt, epoch=datetime(1970, 1, 1, tzinfo=pytz.utc)):
     return (td.microseconds + (td.seconds + td.days * 24 * 3600) * 10**6) / 1e6
 
 
+_epoch = datetime(1970, 1, 1)
+_utc_epoch = pytz.utc.localize(_epoch)
+
+
+def epoch(value):
+    """:returns: the seconds of a datetime since the epoch, a naive datetime is taken as UTC"""
+
+    return (value - (_epoch if value.tzinfo is None else _utc_epoch)).total_seconds()
+
+
+def epoch_ms(value):
+    """:returns: the milliseconds of a datetime since the epoch, a naive datetime is taken as UTC"""
+
+    delta = value - (_epoch if value.tzinfo is None else _utc_epoch)
+
+    return (delta.days * 86400 + delta.seconds) * 1000 + delta.microseconds // 1000
+
+
+def isoformat(value):
+    """:returns: the ISO 8601 string of a datetime in UTC, a naive datetime is taken as UTC"""
+
+    if value.tzinfo is pytz.utc:
+        return value.isoformat()
+
+    offset = value.utcoffset()
+
+    if offset is None:
+        value = value.replace(tzinfo=pytz.utc)
+
+    elif offset:
+        value = value.astimezone(pytz.utc)
+
+    return value.isoformat()
+
+
 class UtcDateTime(core.Field):
 
-    """Represents a datetime string in UTC."""
+    """Represents a datetime string in UTC.
+
+    A datetime is serialized by ``format``:
+
+    - ``'str'``: the string of the datetime, e.g. ``2014-05-07 14:19:09.522000+00:00``
+    - ``'iso'``: the ISO 8601 string in UTC, e.g. ``2014-05-07T14:19:09.522000+00:00``
+    - ``'epoch'``: the seconds since the epoch as ``float``
+    - ``'epoch_ms'``: the milliseconds since the epoch as ``int``, numbers are also deserialized as milliseconds
+    """
+
+    pure = True
+
+    format = 'str'
+    formats = {
+        'str': six.text_type,
+        'iso': isoformat,
+        'epoch': epoch,
+        'epoch_ms': epoch_ms,
+    }
+
+    def __init__(self, format=None, **kwargs):                          # pylint: disable=W0622
+        """
+        :param format: ``'str'``, ``'iso'``, ``'epoch'`` or ``'epoch_ms'``
+        """
+        super(UtcDateTime, self).__init__(**kwargs)
+
+        if format is not None:
+            if format not in self.formats:
+                raise ValueError("`format` must be one of {}: {!r}".format(', '.join(sorted(self.formats)), format))
+
+            self.format = format
 
     def _deserialize(self, value, environment=None):
+        if isinstance(value, _buffers):
+            value = six.text_type(as_bytes(value), 'ascii')
+
         # test for a timestamp
         if isinstance(value, six.string_types):
             # try utc datetime string
             return dateutil_parse(value)
 
         elif isinstance(value, (int, float)):
+            if self.format == 'epoch_ms':
+                value = value / 1000.0
+
             dt = datetime.utcfromtimestamp(value)
             return pytz.utc.localize(dt)
 
@@ -259,8 +1281,30 @@ class UtcDateTime(core.Field):
         raise exc.InvalidValue(self, "Invalid DateTime", value)
 
     def _serialize(self, value, environment=None):
+        if isinstance(value, datetime):
+            return self.formats[self.format](value)
+
+        if self.format in ('epoch', 'epoch_ms') and isinstance(value, (int, float)):
+            # already a timestamp
+            return value
+
         return six.text_type(value)
 
+    def _compile_serializer(self):
+        if not (inherits(self, 'serialize', core.Field) and inherits(self, '_serialize', UtcDateTime)):
+            return super(UtcDateTime, self)._compile_serializer()
+
+        formatter = self.formats[self.format]
+        serialize_ = self._serialize
+
+        def serialize(value, environment=None):
+            if value.__class__ is datetime:
+                return formatter(value)
+
+            return serialize_(value, environment)
+
+        return serialize
+
 
 _truth = frozenset(('yes', 'enabled', 'true', '1', 't', 'on', 'y'))
 
@@ -269,6 +1313,8 @@ class Bool(core.Field):
 
     """Represents a boolean value."""
 
+    pure = True
+
     def _deserialize(self, value, environment=None):
         if value is None:
             return False
@@ -276,5 +1322,8 @@ class Bool(core.Field):
         if isinstance(value, bool):
             return value
 
+        if isinstance(value, _buffers):
+            value = six.text_type(as_bytes(value), 'latin-1')
+
         # convert string values to boolean
         return six.text_type(value).strip().lower() in _truth
@@ -0,0 +1,259 @@
+"""
+Deserialization of large JSON-lines files by several processes.
+
+The file is memory-mapped and split into ranges of whole lines. Every worker process maps the file itself and
+deserializes its ranges by its own instance of the schema, so only the results are sent between the processes. The
+results are yielded in the order of the lines and at most ``max_pending`` ranges are in progress at once, so the
+memory use does not depend on the size of the file:
+
+.. code-block:: python
+
+    from objective import ingest
+
+    for line in ingest.read('orders.jsonl', Order, workers=8):
+        if line.errors:
+            print(line.number, line.errors)
+
+    valid, invalid = ingest.write('orders.jsonl', Order, 'valid.jsonl', errors='invalid.jsonl')
+
+The schema is given as a node class or as another callable, which creates the node. It must be importable by the
+worker processes.
+"""
+
+import collections
+import json
+import mmap
+import multiprocessing
+import os
+
+from . import exc
+
+
+Line = collections.namedtuple('Line', 'number value errors')
+"""The outcome of a line: its number starting at 1, the deserialized value and ``None`` or a list of errors."""
+
+
+def ranges(path, chunk_size):
+    """Split a file into ranges of whole lines.
+
+    :returns: a generator of the start and the end offset of every range
+    """
+
+    size = os.path.getsize(path)
+
+    if not size:
+        return
+
+    with open(path, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            start = 0
+
+            while start < size:
+                end = start + chunk_size
+
+                if end < size:
+                    # extend the range to the end of the line
+                    newline = data.find(b'\n', end - 1)
+                    end = size if newline == -1 else newline + 1
+
+                else:
+                    end = size
+
+                yield start, end
+
+                start = end
+
+        finally:
+            data.close()
+
+
+class Worker(object):
+
+    """Deserializes the lines of a range."""
+
+    def __init__(self, schema, environment=None, loads=json.loads):
+        """
+        :param schema: a callable, which creates the node
+        :param environment: additional environment
+        :param loads: the function to parse a line
+        """
+        self.node = schema()
+        self.environment = environment
+        self.loads = loads
+
+    def line(self, number, data):
+        """Deserialize a line.
+
+        :returns: a :py:class:`Line`
+        """
+
+        try:
+            # python before 3.6 does not parse bytes, an invalid encoding raises a ValueError too
+            value = self.loads(data.decode('utf-8') if isinstance(data, bytes) else data)
+
+        except ValueError as ex:
+            return Line(number, None, [{'path': [], 'code': 'parse', 'message': str(ex)}])
+
+        try:
+            return Line(number, self.node.deserialize(value, self.environment), None)
+
+        except exc.Invalid as ex:
+            return Line(number, None, exc.error_list(ex))
+
+    def __call__(self, path, start, end, serialize=False):
+        """Deserialize all lines of a range.
+
+        :param serialize: return the valid values serialized as JSON text
+        :returns: the number of lines and a list of :py:class:`Line` for all lines, which are not blank
+        """
+
+        lines = []
+        count = 0
+
+        with open(path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            try:
+                position = start
+
+                while position < end:
+                    newline = data.find(b'\n', position, end)
+
+                    if newline == -1:
+                        newline = end
+
+                    count += 1
+                    chunk = data[position:newline]
+                    position = newline + 1
+
+                    if not chunk.strip():
+                        continue
+
+                    line = self.line(count, chunk)
+
+                    if serialize and line.errors is None:
+                        line = line._replace(value=json.dumps(self.node.serialize(line.value, trusted=True)))
+
+                    lines.append(line)
+
+            finally:
+                data.close()
+
+        return count, lines
+
+
+# the worker of a worker process
+_worker = None
+
+
+def _start(schema, environment, loads):
+    global _worker                                                      # pylint: disable=W0603
+
+    _worker = Worker(schema, environment, loads)
+
+
+def _work(path, start, end, serialize):
+    return _worker(path, start, end, serialize)
+
+
+def read(path, schema, environment=None,                                # pylint: disable=R0913,R0914
+         workers=None, chunk_size=4 * 1024 * 1024, max_pending=None, loads=json.loads, serialize=False,
+         context=multiprocessing):
+    """Deserialize all lines of a JSON-lines file.
+
+    :param path: the path of the file
+    :param schema: a node class or another callable, which creates the node
+    :param environment: additional environment
+    :param workers: the number of worker processes, the default is the number of CPUs, ``0`` works in this process
+    :param chunk_size: the approximate size of a range in bytes
+    :param max_pending: the maximum number of ranges in progress, the default is twice the number of workers
+    :param loads: the function to parse a line
+    :param serialize: yield the valid values serialized as JSON text
+    :param context: the :py:mod:`multiprocessing` context to create the worker processes
+    :returns: a generator of a :py:class:`Line` for every line, which is not blank, in order
+    """
+
+    offset = 0
+
+    if workers == 0:
+        worker = Worker(schema, environment, loads)
+
+        for start, end in ranges(path, chunk_size):
+            count, lines = worker(path, start, end, serialize)
+
+            for line in lines:
+                yield line._replace(number=offset + line.number)
+
+            offset += count
+
+        return
+
+    workers = workers or context.cpu_count()
+    pool = context.Pool(workers, initializer=_start, initargs=(schema, environment, loads))
+    pending = collections.deque()
+    max_pending = max_pending or 2 * workers
+
+    try:
+        tasks = ranges(path, chunk_size)
+
+        while True:
+            # keep the workers busy, but bound the results waiting for an earlier range
+            for start, end in tasks:
+                pending.append(pool.apply_async(_work, (path, start, end, serialize)))
+
+                if len(pending) >= max_pending:
+                    break
+
+            if not pending:
+                break
+
+            count, lines = pending.popleft().get()
+
+            for line in lines:
+                yield line._replace(number=offset + line.number)
+
+            offset += count
+
+        pool.close()
+
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def write(path, schema, output, errors=None, **kwargs):
+    """Deserialize all lines of a JSON-lines file and write the serialized valid values to another one.
+
+    :param path: the path of the file
+    :param schema: a node class or another callable, which creates the node
+    :param output: the path of the JSON-lines file for the valid values
+    :param errors: the path of a JSON-lines file for the ``line`` number and the ``errors`` of all invalid lines
+    :param kwargs: the options of :py:func:`read`
+    :returns: the numbers of valid and invalid lines
+    """
+
+    valid = invalid = 0
+    error_file = open(errors, 'w') if errors is not None else None
+
+    try:
+        with open(output, 'w') as output_file:
+            for line in read(path, schema, serialize=True, **kwargs):
+                if line.errors is None:
+                    output_file.write(line.value)
+                    output_file.write('\n')
+                    valid += 1
+
+                else:
+                    if error_file is not None:
+                        error_file.write(json.dumps({'line': line.number, 'errors': line.errors}))
+                        error_file.write('\n')
+
+                    invalid += 1
+
+    finally:
+        if error_file is not None:
+            error_file.close()
+
+    return valid, invalid
@@ -0,0 +1,169 @@
+"""
+Deserialization into the input value itself.
+
+A pipeline, which owns its input, may let the deserialized values replace the raw values of its dicts and lists
+instead of building a second copy of the whole structure:
+
+.. code-block:: python
+
+    result = Schema().deserialize(value, inplace=True)
+
+    assert result is value
+
+A :py:class:`.fields.Mapping`, whose type is :py:obj:`dict`, converts a :py:obj:`dict` in place and a
+:py:class:`.fields.List` a :py:obj:`list`. The values of ignored items and of unknown keys, which are not kept, are
+deleted. All other nodes and containers of other types are deserialized as usual and their results are put into the
+parent. The result is equal to the one of :py:meth:`.core.Field.deserialize`, but a mapping keeps the order of the
+input keys and the keys of missing items with a default are appended.
+
+The costs:
+
+- every container of the input is modified, so it must not be used by anything else, e.g. a dict, which is part of
+  the input twice, is converted twice
+- to restore the input, if the value is invalid, every replaced and deleted value is logged by a tuple until the
+  end, which is cheaper than a copy of all containers, but not free; with ``rollback=False`` nothing is logged and an
+  invalid value leaves the input partially converted, what is marked by the ``partial`` attribute of the raised error
+- containers with depth or element limits and overridden deserialization are not converted in place
+"""
+
+from . import exc
+
+
+_absent = object()
+
+
+def _set(container, key, value, journal):
+    if journal is not None:
+        previous = container.get(key, _absent) if isinstance(container, dict) else container[key]
+        journal.append((container, key, previous))
+
+    container[key] = value
+
+
+def _delete(container, key, journal):
+    if journal is not None:
+        journal.append((container, key, container[key]))
+
+    del container[key]
+
+
+def restore(journal):
+    """Restore all replaced and deleted values of a journal in reverse order."""
+
+    for container, key, value in reversed(journal):
+        if value is _absent:
+            del container[key]
+
+        else:
+            container[key] = value
+
+    del journal[:]
+
+
+def _mapping(node, value, environment, journal):
+    # the children are collected first, since keys are deleted
+    children = list(node._deserialize_children(value, environment))    # pylint: disable=W0212
+    kept = set()
+    invalids = []
+    max_invalids = node.max_invalids
+
+    for name, item, subvalue in children:
+        try:
+            result = _deserialize(item, subvalue, environment, journal)
+
+        except exc.IgnoreValue:
+            continue
+
+        except exc.Invalid as ex:
+            invalids.append(ex)
+
+            if len(invalids) == max_invalids:
+                raise exc.InvalidChildren(node, invalids, truncated=True)
+
+            continue
+
+        kept.add(name)
+
+        if result is not subvalue:
+            _set(value, name, result, journal)
+
+    if invalids:
+        raise exc.InvalidChildren(node, invalids)
+
+    if len(kept) < len(value):
+        # the values of ignored items and unknown keys
+        for name in [name for name in value if name not in kept]:
+            _delete(value, name, journal)
+
+
+def _collection(node, value, environment, journal):
+    node._check_length(value)                                           # pylint: disable=W0212
+    invalids = []
+    max_invalids = node.max_invalids
+
+    for i, item, subvalue in node._deserialize_children(value, environment):   # pylint: disable=W0212
+        try:
+            result = _deserialize(item, subvalue, environment, journal)
+
+        except exc.Invalid as ex:
+            ex.name = i
+            invalids.append(ex)
+
+            if len(invalids) == max_invalids:
+                raise exc.InvalidChildren(node, invalids, truncated=True)
+
+            continue
+
+        if result is not subvalue:
+            _set(value, i, result, journal)
+
+    if invalids:
+        raise exc.InvalidChildren(node, invalids)
+
+
+def _deserialize(node, value, environment, journal):
+    if type(value) is not getattr(node, '_inplace_type', None):
+        return node.deserialize(value, environment)
+
+    try:
+        if type(value) is dict:
+            _mapping(node, value, environment, journal)
+
+        else:
+            _collection(node, value, environment, journal)
+
+        if node._validator is not None:                                 # pylint: disable=W0212
+            value = node._validator(node, value, environment)           # pylint: disable=W0212
+
+    except exc.InvalidValue:
+        raise
+
+    except (exc.Invalid, ValueError, TypeError) as ex:
+        raise exc.InvalidValue(node, value=value, origin=ex)
+
+    return value
+
+
+def deserialize(node, value, environment=None, rollback=True):
+    """Deserialize a value by a node and convert its dicts and lists in place.
+
+    :param node: the root node
+    :param value: the value to be deserialized
+    :param environment: additional environment
+    :param rollback: restore the input, if the value is invalid, otherwise the raised error is marked as ``partial``
+    :returns: the deserialized value, which is the input value itself, if it was converted in place
+    """
+
+    journal = [] if rollback else None
+
+    try:
+        return _deserialize(node, value, environment, journal)
+
+    except Exception as ex:
+        if journal is not None:
+            restore(journal)
+
+        else:
+            ex.partial = True
+
+        raise
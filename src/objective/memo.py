@@ -0,0 +1,207 @@
+"""
+Memoization of deserialized values.
+
+Payloads often repeat the same values, like enum strings, country codes or timestamps. A field created with
+``memoize=True`` reuses an earlier result for an equal input instead of deserializing it again:
+
+.. code-block:: python
+
+    class Address(objective.Mapping):
+        country = objective.Item(objective.Unicode, memoize=True)
+
+Only fields marked as ``pure`` with a pure validator may be memoized, since the result must only depend on the value
+and never on the environment. Only values of the exact types text, bytes, ``int``, ``bool`` and ``None`` are cached,
+since equal values of other types may differ, like datetimes in different time zones or ``0.0`` and ``-0.0``.
+
+A :py:class:`Memo` may be used by several threads.
+
+By default every field uses its own bounded :py:class:`Memo` for the lifetime of the process. A :py:class:`Memo` may
+be shared by several fields or used as a context manager to scope all memoized fields to a call or a batch:
+
+.. code-block:: python
+
+    with Memo(maxsize=10000) as memo:
+        for record in batch:
+            schema.deserialize(record)
+
+    print(memo.hit_rate)
+
+"""
+
+import threading
+from collections import OrderedDict
+
+import six
+
+from . import values
+
+
+_local = threading.local()
+_miss = object()
+
+# equal values of these types are the same value
+_exact = frozenset(six.string_types + (six.text_type, six.binary_type, bool, type(None)) + six.integer_types)
+
+
+def active():
+    """:returns: the innermost :py:class:`Memo` entered as a context manager or ``None``"""
+
+    scopes = getattr(_local, 'scopes', None)
+
+    return scopes[-1] if scopes else None
+
+
+class Memo(object):
+
+    """A bounded LRU cache of deserialized values."""
+
+    def __init__(self, maxsize=1024, max_length=256):
+        """
+        :param maxsize: the maximum number of cached values
+        :param max_length: values with a greater length are not cached
+        """
+        self.maxsize = maxsize
+        self.max_length = max_length
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        scopes = getattr(_local, 'scopes', None)
+
+        if scopes is None:
+            scopes = _local.scopes = []
+
+        scopes.append(self)
+
+        return self
+
+    def __exit__(self, *exc_info):
+        _local.scopes.remove(self)
+
+    def __len__(self):
+        return len(self._cache)
+
+    @property
+    def hit_rate(self):
+        """:returns: the ratio of hits to all lookups"""
+
+        lookups = self.hits + self.misses
+
+        return float(self.hits) / lookups if lookups else 0.0
+
+    def stats(self):
+        """:returns: a dict of all statistics"""
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+            'size': len(self._cache),
+            'maxsize': self.maxsize,
+        }
+
+    def clear(self):
+        """Remove all cached values and reset the statistics."""
+
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+    def deserialize(self, node, deserialize, value, environment=None):
+        """Return the cached result for the value or deserialize and cache it.
+
+        :param node: the node, which is part of the key
+        :param deserialize: the function to deserialize the value
+        """
+
+        if value is values.Undefined or value.__class__ not in _exact:
+            # the missing value may depend on the environment and other values may be equal, but not the same
+            return deserialize(value, environment)
+
+        if self.max_length is not None and hasattr(value, '__len__') and len(value) > self.max_length:
+            return deserialize(value, environment)
+
+        # equal values of different type, like 1 and True, may have different results
+        return self.cached((node, value.__class__, value), deserialize, value, environment)
+
+    def cached(self, key, func, *args):
+        """Return the cached result for the key or call ``func`` with ``args`` and cache its result.
+
+        Nothing is cached if ``func`` raises or if the key is not hashable.
+        """
+
+        cache = self._cache
+
+        try:
+            hash(key)
+
+        except TypeError:
+            # unhashable
+            return func(*args)
+
+        with self._lock:
+            result = cache.pop(key, _miss)
+
+            if result is not _miss:
+                # move the hit to the end
+                cache[key] = result
+                self.hits += 1
+
+                return result
+
+        # not locked, since it may take long or even use this memo
+        result = func(*args)
+
+        with self._lock:
+            self.misses += 1
+            cache[key] = result
+
+            if len(cache) > self.maxsize:
+                cache.popitem(last=False)
+
+        return result
+
+
+class Interner(object):
+
+    """A bounded table of strings, which shares one object for all equal strings.
+
+    Unlike :py:func:`sys.intern` it works for text on python 2 and never grows beyond ``maxsize``. Once it is full,
+    new strings are returned as they are.
+    """
+
+    def __init__(self, maxsize=65536, max_length=64):
+        """
+        :param maxsize: the maximum number of strings
+        :param max_length: longer strings are not interned
+        """
+        self.maxsize = maxsize
+        self.max_length = max_length
+        self._table = {}
+
+    def __len__(self):
+        return len(self._table)
+
+    def add(self, value):
+        """Intern a string regardless of its length and of ``maxsize``, e.g. a declared choice.
+
+        :returns: the interned string
+        """
+
+        return self._table.setdefault(value, value)
+
+    def __call__(self, value):
+        """:returns: the interned string equal to the value or the value itself"""
+
+        table = self._table
+        interned = table.get(value)
+
+        if interned is not None:
+            return interned
+
+        if len(value) <= self.max_length and len(table) < self.maxsize:
+            table[value] = value
+
+        return value
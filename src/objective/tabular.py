@@ -0,0 +1,239 @@
+"""
+Deserialization of CSV files and other tabular rows by a mapping.
+
+The columns of the header are matched with the items of the mapping once. Every row is then deserialized cell by cell
+into the result without building a dict of the row first. An empty cell is a missing value, so the ``missing`` rule
+of its item applies, just like for a missing key:
+
+.. code-block:: python
+
+    from objective import tabular
+
+    with open('orders.csv') as f:
+        for row in tabular.read(f, Order()):
+            if row.errors:
+                print(row.number, row.errors)
+
+    with open('orders.csv') as f:
+        sink = tabular.ColumnSink(Order())
+        errors = tabular.write(f, Order(), sink)
+
+    sink.columns['price']
+
+The errors of a row are plain dicts like :py:func:`.exc.error_list` with the ``row`` number and the ``column`` name in
+addition.
+"""
+
+import collections
+import csv
+
+from . import exc, fields, values
+
+
+Row = collections.namedtuple('Row', 'number value errors')
+"""The outcome of a row: its number counting the header as 1, the deserialized value and ``None`` or a list of
+errors."""
+
+
+def _errors(number, column, invalid):
+    errors = exc.error_list(invalid)
+
+    for error in errors:
+        error['row'] = number
+        error['column'] = column
+
+        if column is not None:
+            error['path'].insert(0, column)
+
+    return errors
+
+
+def columns(node, header):
+    """Match the columns of a header with the items of a mapping.
+
+    Columns for unknown keys are handled by the ``extra`` option of the mapping.
+
+    :param node: the mapping
+    :param header: the names of the columns
+    :returns: the index of the column or ``None``, the name, the node and if a missing value is ignored for every item
+        in order, followed by the columns of unknown keys to be kept
+    :raises: :py:class:`.exc.InvalidChildren` of :py:class:`.exc.ExtraValue` for columns of unknown keys, if the
+        mapping forbids them
+    """
+
+    if not isinstance(node, fields.Mapping):
+        raise TypeError("`node` must be a mapping: {!r}".format(node))
+
+    indexes = {}
+
+    for index, name in enumerate(header):
+        # the first of duplicate columns wins
+        indexes.setdefault(name, index)
+
+    plan = []
+
+    for name, item, optional in node._children:                         # pylint: disable=W0212
+        index = indexes.get(name)
+
+        if index is None and optional:
+            # always ignored
+            continue
+
+        plan.append((index, name, item, optional))
+
+    unknown = [(index, name) for index, name in enumerate(header) if name not in node.__keys__]
+
+    if unknown and node.extra == 'forbid':
+        raise exc.InvalidChildren(node, [
+            exc.ExtraValue(fields.Forbidden(name=name), value=name) for _, name in unknown
+        ])
+
+    if node.extra == 'keep':
+        plan.extend((index, name, node._passthrough, False) for index, name in unknown)     # pylint: disable=W0212
+
+    return tuple(plan)
+
+
+def rows(node, data, header=None, environment=None):
+    """Deserialize rows of cells by a mapping.
+
+    :param node: the mapping
+    :param data: an iterable of sequences of cells, the first one is the header, if no ``header`` is given
+    :param header: the names of the columns
+    :param environment: additional environment
+    :returns: a generator of a :py:class:`Row` for every row, which is not empty
+    """
+
+    data = iter(data)
+    number = 1
+
+    if header is None:
+        header = next(data, ())
+
+    else:
+        # the header is not part of the rows
+        number = 0
+
+    plan = columns(node, header)
+    create = node._create_deserialize_type                              # pylint: disable=W0212
+    validator = node._validator                                         # pylint: disable=W0212
+    undefined = values.Undefined
+    max_invalids = node.max_invalids
+
+    for row in data:
+        number += 1
+
+        if not row:
+            continue
+
+        size = len(row)
+        record = create(row, environment)
+        errors = []
+        invalids = 0
+
+        for index, name, item, optional in plan:
+            cell = row[index] if index is not None and index < size else ''
+
+            if cell == '':
+                if optional:
+                    continue
+
+                cell = undefined
+
+            try:
+                record[name] = item.deserialize(cell, environment)
+
+            except exc.IgnoreValue:
+                pass
+
+            except exc.Invalid as ex:
+                errors.extend(_errors(number, name, ex))
+                invalids += 1
+
+                if invalids == max_invalids:
+                    break
+
+        if not errors and validator is not None:
+            try:
+                record = validator(node, record, environment)
+
+            except (exc.Invalid, ValueError, TypeError) as ex:
+                if not isinstance(ex, exc.InvalidValue):
+                    ex = exc.InvalidValue(node, value=record, origin=ex)
+
+                errors.extend(_errors(number, None, ex))
+
+        if errors:
+            yield Row(number, None, errors)
+
+        else:
+            yield Row(number, record, None)
+
+
+def read(f, node, environment=None, header=None, **fmtparams):
+    """Deserialize all rows of a CSV file.
+
+    :param f: the file opened with ``newline=''`` or another iterable of lines
+    :param node: the mapping
+    :param environment: additional environment
+    :param header: the names of the columns, if the file has no header
+    :param fmtparams: the dialect and the formatting parameters of :py:func:`csv.reader`
+    :returns: a generator of a :py:class:`Row` for every row, which is not empty
+    """
+
+    return rows(node, csv.reader(f, **fmtparams), header=header, environment=environment)
+
+
+class ColumnSink(object):
+
+    """Collects the values of records column by column."""
+
+    def __init__(self, node, factories=None, fill=None):
+        """
+        :param node: the mapping, which names the columns
+        :param factories: a mapping of a column name to a callable, which creates the column, e.g. an
+            :py:class:`array.array`, the default is a list
+        :param fill: the value of a column, which is missing in a record
+        """
+        factories = factories or {}
+
+        self.columns = collections.OrderedDict(
+            (name, factories.get(name, list)()) for name, _ in node
+        )
+        self.fill = fill
+        self._appenders = tuple((name, column.append) for name, column in self.columns.items())
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()), ()))
+
+    def append(self, record):
+        """Append the values of a record to the columns."""
+
+        fill = self.fill
+
+        for name, append in self._appenders:
+            append(record.get(name, fill))
+
+
+def write(f, node, sink, environment=None, **kwargs):
+    """Deserialize all rows of a CSV file and append the valid records to a sink.
+
+    :param f: the file opened with ``newline=''`` or another iterable of lines
+    :param node: the mapping
+    :param sink: a :py:class:`ColumnSink` or another object with an ``append`` method
+    :param environment: additional environment
+    :param kwargs: the options of :py:func:`read`
+    :returns: a list of the errors of all invalid rows
+    """
+
+    errors = []
+    append = sink.append
+
+    for row in read(f, node, environment, **kwargs):
+        if row.errors is None:
+            append(row.value)
+
+        else:
+            errors.extend(row.errors)
+
+    return errors
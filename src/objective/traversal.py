@@ -0,0 +1,320 @@
+"""
+An alternative deserialization engine, which walks :py:class:`.fields.Mapping`, :py:class:`.fields.List` and
+:py:class:`.fields.Set` with an explicit stack instead of recursing through python frames.
+
+The result and the :py:class:`.exc.InvalidChildren` tree are the same as with :py:meth:`.core.Field.deserialize`, but
+the nesting depth of the value is not bound by the recursion limit.
+
+.. code-block:: python
+
+    from objective import traversal
+
+    result = traversal.deserialize(Tree(), deeply_nested_value)
+
+"""
+
+import sys
+
+import six
+
+from . import core, exc, fields
+
+
+MAPPING = 'mapping'
+COLLECTION = 'collection'
+
+_deserializers = {
+    six.get_unbound_function(core.Field.deserialize),
+    six.get_unbound_function(fields.ContainerMixin.deserialize),
+}
+_kinds = {
+    six.get_unbound_function(fields.Mapping._deserialize): MAPPING,
+    six.get_unbound_function(fields.CollectionMixin._deserialize): COLLECTION,
+}
+
+_unlimited = sys.maxsize
+
+# these are the only exceptions, which may be handled by an ancestor
+_outcomes = (exc.Invalid, exc.IgnoreValue, ValueError, TypeError)
+
+
+# the container kind per node class
+_class_kinds = {}
+
+
+def container_kind(node):
+    """:returns: ``MAPPING`` or ``COLLECTION`` if the engine may traverse into the node or ``None``.
+
+    Nodes, which override ``deserialize`` or ``_deserialize`` are treated as leafs and deserialize themselves.
+    """
+
+    cls = node.__class__
+
+    try:
+        return _class_kinds[cls]
+
+    except KeyError:
+        kind = None
+
+        if six.get_unbound_function(cls.deserialize) in _deserializers:
+            kind = _kinds.get(six.get_unbound_function(cls._deserialize))
+
+        _class_kinds[cls] = kind
+
+        return kind
+
+
+class Frame(object):        # pylint: disable=R0903
+
+    """The state of a container, which is currently deserialized."""
+
+    __slots__ = ('node', 'kind', 'key', 'value', 'container', 'children', 'invalids', 'max_invalids', 'truncated',
+                 'depth_limit', 'element_limit')
+
+    def __init__(self, node, kind, key, value, container, children):
+        self.node = node
+        self.kind = kind
+        self.key = key
+        self.value = value
+        self.container = container
+        self.children = children
+        self.invalids = []
+        self.max_invalids = node.max_invalids
+        self.truncated = False
+        self.depth_limit = self.element_limit = _unlimited
+
+    def push(self, key, value):
+        """Store the deserialized value of a child."""
+
+        if self.kind is MAPPING:
+            self.container[key] = value
+
+        else:
+            self.node.collection_pusher(self.container, value)
+
+    def handles(self, key, ex):
+        """:returns: ``True`` if the exception of a child is collected or ignored by this frame."""
+
+        if isinstance(ex, exc.Invalid):
+            if self.kind is COLLECTION:
+                ex.name = key
+
+            self.invalids.append(ex)
+
+            if len(self.invalids) == self.max_invalids:
+                self.stop()
+
+            return True
+
+        # only a mapping ignores a value
+        return self.kind is MAPPING and isinstance(ex, exc.IgnoreValue)
+
+    def stop(self):
+        """Skip all remaining children."""
+
+        self.children = iter(())
+        self.truncated = True
+
+    def wrap(self, ex, value):
+        """Convert an exception like :py:meth:`.core.Field.deserialize` does."""
+
+        if isinstance(ex, exc.InvalidValue):
+            return ex
+
+        if isinstance(ex, (exc.Invalid, ValueError, TypeError)):
+            return exc.InvalidValue(self.node, value=value, origin=ex)
+
+        return ex
+
+    def finish(self, environment=None):
+        """Apply the validator to the filled container.
+
+        :returns: the deserialized value
+        """
+
+        node = self.node
+
+        if self.invalids:
+            # on invalids this item is also ``Invalid``
+            raise exc.InvalidChildren(node, self.invalids, truncated=self.truncated)
+
+        value = self.container
+
+        if node._validator is not None:                                 # pylint: disable=W0212
+            try:
+                value = node._validator(node, value, environment)       # pylint: disable=W0212
+
+            except _outcomes as ex:
+                raise self.wrap(ex, value)
+
+        return value
+
+
+def enter(node, key, value, environment=None):
+    """Start the deserialization of a node.
+
+    :returns: a :py:class:`Frame` to be traversed or ``None`` and the deserialized value
+    """
+
+    kind = container_kind(node)
+
+    if kind is None:
+        return None, node.deserialize(value, environment)
+
+    value = node._resolve_value(value, environment)                     # pylint: disable=W0212
+
+    try:
+        container = node._deserialize_container(value, environment)     # pylint: disable=W0212
+        children = node._deserialize_children(value, environment)       # pylint: disable=W0212
+
+    except exc.InvalidValue:
+        raise
+
+    except (exc.Invalid, ValueError, TypeError) as ex:
+        raise exc.InvalidValue(node, value=value, origin=ex)
+
+    return Frame(node, kind, key, value, container, children), None
+
+
+def deserialize(node, value, environment=None,                          # pylint: disable=R0913
+                max_errors=None, fail_fast=False, max_depth=None, max_elements=None):
+    """Deserialize a value by a node without recursion.
+
+    In contrast to the options of a container, which apply only to its own children, the limits given here are
+    counted over the whole value. If the depth or the elements limit is crossed, the traversal stops at once.
+
+    :param node: the root node
+    :param value: the value to be deserialized
+    :param environment: additional environment
+    :param max_errors: stop the traversal after that many invalid values
+    :param fail_fast: stop the traversal at the first invalid value
+    :param max_depth: the maximum number of nested mappings and collections
+    :param max_elements: the maximum number of values in all mappings and collections
+    """
+
+    (result,) = next(steps(node, value, environment, max_errors=max_errors, fail_fast=fail_fast,
+                           max_depth=max_depth, max_elements=max_elements))
+
+    return result
+
+
+def steps(node, value, environment=None,                                # pylint: disable=R0912,R0913,R0914,R0915
+          max_errors=None, fail_fast=False, max_depth=None, max_elements=None, chunk=None):
+    """Deserialize a value like :py:func:`deserialize` in steps.
+
+    The traversal can be suspended after every ``chunk`` values, e.g. to let an event loop run other tasks.
+
+    :param chunk: the number of values to be deserialized between two steps
+    :returns: a generator, which yields ``None`` after every ``chunk`` values and finally a tuple of the result
+    """
+
+    stack = []
+    key = None
+    max_invalids = 1 if fail_fast else max_errors
+    invalids = 0
+    elements = 0
+    suspend_at = chunk
+
+    def unwind():
+        for pending in stack:
+            pending.stop()
+
+    while True:
+        # descend into the next child
+        try:
+            frame, result = enter(node, key, value, environment)
+            error = None
+
+        except _outcomes as ex:
+            frame, error = None, ex
+
+        if frame is not None:
+            parent = stack[-1] if stack else None
+            depth = len(stack) + 1
+            depth_limit = parent.depth_limit if parent else max_depth or _unlimited
+
+            if depth > depth_limit:
+                frame, error = None, exc.DepthExceeded(node, value=frame.value, limit=depth_limit)
+                unwind()
+
+            else:
+                frame.depth_limit = depth_limit
+                frame.element_limit = parent.element_limit if parent else max_elements or _unlimited
+
+                if node.max_depth is not None:
+                    frame.depth_limit = min(depth_limit, depth - 1 + node.max_depth)
+
+                if node.max_elements is not None:
+                    frame.element_limit = min(frame.element_limit, elements + node.max_elements)
+
+                stack.append(frame)
+
+        # the outcome of a child or a finished frame is delivered to the top of the stack
+        deliver = frame is None
+
+        while stack:
+            frame = stack[-1]
+
+            if deliver:
+                if error is None:
+                    frame.push(key, result)
+
+                elif frame.handles(key, error):
+                    if not isinstance(error, exc.InvalidChildren) and isinstance(error, exc.Invalid):
+                        invalids += 1
+
+                        if invalids == max_invalids:
+                            unwind()
+
+                    error = None
+
+                else:
+                    # the error of the child aborts this frame
+                    stack.pop()
+                    error, key = frame.wrap(error, frame.value), frame.key
+                    continue
+
+            deliver = True
+
+            try:
+                key, node, value = next(frame.children)
+
+            except StopIteration:
+                stack.pop()
+                key = frame.key
+
+                try:
+                    result = frame.finish(environment)
+                    error = None
+
+                except _outcomes as ex:
+                    error = ex
+
+                continue
+
+            except _outcomes as ex:
+                stack.pop()
+                error, key = frame.wrap(ex, frame.value), frame.key
+                continue
+
+            elements += 1
+
+            if elements > frame.element_limit:
+                stack.pop()
+                error, key = exc.ElementsExceeded(frame.node, value=frame.value, limit=frame.element_limit), frame.key
+                unwind()
+                continue
+
+            if elements == suspend_at:
+                suspend_at += chunk
+                yield None
+
+            break
+
+        else:
+            # the stack is empty, so we are done
+            if error is not None:
+                raise error
+
+            yield (result,)
+            return
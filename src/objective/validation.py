@@ -1,8 +1,28 @@
+import re
+import socket
+
 import six
 
 import validate_email
 
-from . import exc
+from . import exc, memo
+
+
+# the same rules as ``validate_email.validate_email`` without compiling on every call
+_match_address = re.compile(validate_email.VALID_ADDRESS_REGEXP).match
+
+
+def resolve_mx(domain):
+    """Look up the MX hosts of a domain by ``pyDNS``.
+
+    :returns: a list of MX hosts or ``None`` if the domain does not exist
+    """
+
+    if not validate_email.DNS:
+        raise Exception('For check the mx records or check if the email exists you must '
+                        'have installed pyDNS python package')
+
+    return validate_email.get_mx_ip(domain)
 
 
 class Validator(object):
@@ -12,6 +32,9 @@ class Validator(object):
     You can use a validator to convert the value into something else.
     """
 
+    pure = False
+    """A pure validator returns equal results for equal values without regard to the environment."""
+
     def __call__(self, node, value, environment=None):
         """Perform value validation.
 
@@ -21,23 +44,70 @@ class Validator(object):
         return value
 
 
+def compile_choices(choices):
+    """Precompile a membership test for choices.
+
+    Hashable choices of a ``list`` or a ``tuple`` are looked up in a ``frozenset``, unhashable ones are compared one
+    by one. Any other container, e.g. a ``set``, a ``range`` or a mapping, tests the membership itself.
+
+    :returns: a function, which returns ``True`` if a value is one of the choices
+    """
+
+    if not isinstance(choices, (list, tuple)):
+        # already fast, with special semantics or even not iterable
+        contains = getattr(choices, '__contains__', None)
+
+        return contains if contains is not None else lambda value: value in choices
+
+    choices = tuple(choices)
+    hashable = []
+    unhashable = []
+
+    for choice in choices:
+        try:
+            hash(choice)
+            hashable.append(choice)
+
+        except TypeError:
+            unhashable.append(choice)
+
+    hashable = frozenset(hashable)
+    unhashable = tuple(unhashable)
+
+    def contains(value):
+        try:
+            return value in hashable or bool(unhashable) and value in unhashable
+
+        except TypeError:
+            # an unhashable value
+            return value in choices
+
+    return contains
+
+
 class OneOf(Validator):
+    pure = True
+
     def __init__(self, choices):
         self.choices = choices
+        self._contains = compile_choices(choices)
 
     def __call__(self, node, value, environment=None):
-        if value in self.choices:
+        if self._contains(value):
             return value
 
         raise exc.Invalid()
 
 
 class NoneOf(Validator):
+    pure = True
+
     def __init__(self, choices):
         self.choices = choices
+        self._contains = compile_choices(choices)
 
     def __call__(self, node, value, environment=None):
-        if value in self.choices:
+        if self._contains(value):
             raise exc.Invalid()
 
         return value
@@ -47,52 +117,108 @@ class Email(Validator):
 
     """Validate an email.
 
-    if ``pyDNS`` is installed you can check mx and verify the existance of that
-    email.
+    The syntax is checked offline and the result is cached per address. ``check_mx`` looks up the MX hosts of the
+    domain by a ``resolver`` and caches the result per domain. The default resolver needs ``pyDNS``.
+
+    ``verify`` contacts the SMTP server of the domain for every address and is never cached.
 
     """
 
-    def __init__(self, verify=False, check_mx=False):
+    def __init__(self, verify=False, check_mx=False, resolver=None, cache_size=1024):
+        """
+        :param verify: verify the existance of the address
+        :param check_mx: check if the domain has MX hosts
+        :param resolver: a callable returning the MX hosts of a domain or ``None``
+        :param cache_size: the maximum number of cached addresses and domains each
+        """
         self.check_mx = check_mx
         self.verify = verify
+        self.resolver = resolver or resolve_mx
+
+        # network lookups are not cached
+        self.pure = not (check_mx or verify)
+
+        self.addresses = memo.Memo(maxsize=cache_size)
+        self.domains = memo.Memo(maxsize=cache_size)
 
     def __call__(self, node, value, environment=None):
-        if isinstance(value, six.string_types):
-            if validate_email.validate_email(
-                    value,
-                    check_mx=self.check_mx,
-                    verify=self.verify
-            ):
-                return value
+        if isinstance(value, six.string_types) and self.is_valid(value):
+            return value
 
         raise exc.Invalid()
 
+    def is_valid(self, address):
+        """:returns: ``True`` if the address is valid"""
+
+        if self.verify:
+            return bool(validate_email.validate_email(address, check_mx=self.check_mx, verify=True))
+
+        try:
+            return self.addresses.cached(address, self._is_valid, address)
+
+        except (socket.error, validate_email.ServerError):
+            return False
+
+    def validate_many(self, addresses):
+        """Validate a column of addresses at once.
+
+        :returns: a list of booleans in the order of the addresses
+        """
+
+        is_valid = self.is_valid
+
+        return [isinstance(address, six.string_types) and is_valid(address) for address in addresses]
+
+    def _is_valid(self, address):
+        # the regular expression needs an @ anyway
+        if '@' not in address or _match_address(address) is None:
+            return False
+
+        if self.check_mx:
+            domain = address[address.find('@') + 1:]
+
+            return self.domains.cached(domain, self._has_mx, domain)
+
+        return True
+
+    def _has_mx(self, domain):
+        return bool(self.resolver(domain))
+
 
 class ValueMap(Validator):
 
     """Map certain values to other values."""
 
+    pure = True
+
     def __init__(self, map_values, **kwargs):
         self.map_values = map_values
 
         if 'default' in kwargs:
             self.default = kwargs.get('default')
 
-    def __call__(self, node, value, environment=None):
-        if callable(self.map_values):
-            value = self.map_values(value)
+        self._map = map_values if callable(map_values) else self._compile_map(map_values)
 
-        else:
-            # assume dict
+    def _compile_map(self, map_values):
+        """Bind the lookup of a constant map."""
+
+        # assume dict
+        getitem = map_values.__getitem__
+
+        def lookup(value):
             try:
-                value = self.map_values[value]
+                return getitem(value)
+
             except KeyError:
                 if 'default' not in self.__dict__:
                     raise exc.Invalid()
 
-                value = self.default
+                return self.default
 
-        return value
+        return lookup
+
+    def __call__(self, node, value, environment=None):
+        return self._map(value)
 
 
 class Chain(Validator):
@@ -100,24 +226,106 @@ class Chain(Validator):
     """Chains a set of validators."""
 
     def __init__(self, *validators):
-        self.validators = validators
+        flat = []
 
-    def __call__(self, node, value, environment=None):
-        for validator in self.validators:
-            value = validator(node, value, environment=environment)
+        for validator in validators:
+            # nested chains are flattened
+            if type(validator) is Chain:                                # pylint: disable=C0123
+                flat.extend(validator.validators)
 
-        return value
+            else:
+                flat.append(validator)
+
+        self.validators = tuple(flat)
+        self.pure = all(getattr(validator, 'pure', False) for validator in self.validators)
+        self._chained = self._compile(self.validators)
+
+    @staticmethod
+    def _compile(validators):
+        """Fuse the validators into a single callable."""
+
+        if not validators:
+            return lambda node, value, environment=None: value
+
+        if len(validators) == 1:
+            return validators[0]
+
+        if len(validators) == 2:
+            first, second = validators
+
+            def chained(node, value, environment=None):
+                return second(node, first(node, value, environment), environment)
+
+            return chained
+
+        def chained(node, value, environment=None):                   # pylint: disable=E0102
+            for validator in validators:
+                value = validator(node, value, environment)
+
+            return value
+
+        return chained
+
+    def __call__(self, node, value, environment=None):
+        return self._chained(node, value, environment)
 
 
 class FieldValue(Validator):
 
-    """Deserialize the value by field."""
+    """Deserialize the value by field.
+
+    The field is created once per environment and kept in a bounded cache, so that e.g. all items of a list share
+    the same field. A field instance is used for all values and gets the environment passed on deserialization.
+    """
+
+    def __init__(self, field, key=None, maxsize=128):
+        """
+        :param field: the field class or a field instance
+        :param key: a function to get the cache key of the environment, the default is the identity of the environment
+        :param maxsize: the maximum number of cached fields
+        """
+
+        if isinstance(field, type):
+            self.field_class = field
+            self.field = None
+
+        else:
+            self.field_class = field.__class__
+            self.field = field
+
+        self.key = key
+        self.fields = memo.Memo(maxsize=maxsize, max_length=None)
+
+        # the last environment and its field
+        self._last = (self, None)
+
+    def _create(self, environment):
+        return environment, self.field_class(environment=environment)
+
+    def get_field(self, environment=None):
+        """:returns: the field for that environment"""
+
+        last_environment, field = self._last
+
+        if last_environment is environment:
+            return field
 
-    def __init__(self, field):
-        self.field_class = field
+        if self.key is None:
+            # the environment is referenced by the cache, so its id is not reused while it is cached
+            _, field = self.fields.cached(id(environment), self._create, environment)
+
+        else:
+            _, field = self.fields.cached(self.key(environment), self._create, environment)
+
+        self._last = (environment, field)
+
+        return field
 
     def __call__(self, node, value, environment=None):
-        field = self.field_class(environment=environment)
+        if self.field is not None:
+            return self.field.deserialize(value, environment)
+
+        field = self.get_field(environment)
 
         value = field.deserialize(value)
 
@@ -14,3 +14,7 @@ class Bunch(dict):
         self.__dict__ = self
 
         super(Bunch, self).__init__(*args, **kwargs)
+
+    def __reduce__(self):
+        # the items are also the attributes, so they must only be restored once
+        return self.__class__, (dict(self),)
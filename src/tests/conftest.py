@@ -0,0 +1,5 @@
+import sys
+
+
+# coroutine syntax
+collect_ignore = ['test_aio.py'] if sys.version_info < (3, 5) else []
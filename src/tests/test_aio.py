@@ -0,0 +1,255 @@
+# coding: utf-8
+import asyncio
+
+import pytest
+
+
+def run(awaitable):
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(awaitable)
+
+    finally:
+        loop.close()
+
+
+class Active(object):
+
+    """Counts the validators awaited at once."""
+
+    def __init__(self):
+        self.current = self.max = 0
+
+    async def __call__(self, node, value, environment=None):
+        self.current += 1
+        self.max = max(self.max, self.current)
+
+        try:
+            await asyncio.sleep(0.001)
+
+        finally:
+            self.current -= 1
+
+        if value == 'invalid':
+            raise ValueError(value)
+
+        return value
+
+
+@pytest.fixture
+def schema():
+    import objective
+
+    active = Active()
+
+    class Bar(objective.Mapping):
+        x = objective.Item(objective.Unicode, validator=active)
+        y = objective.Item(objective.Int, missing=objective.Ignore)
+
+    class Foo(objective.Mapping):
+        bar = objective.Item(objective.List, items=objective.Item(Bar), missing=objective.Ignore)
+        tags = objective.Item(objective.Set, items=objective.Item(objective.Int))
+        name = objective.Item(objective.Unicode, validator=active, missing=objective.Ignore)
+
+    return Foo(), active
+
+
+def sync(validator):
+    """Run an async validator synchronously to get the expected outcome."""
+
+    return lambda node, value, environment=None: run(validator(node, value, environment))
+
+
+@pytest.mark.parametrize('value', [
+    {'bar': [{'x': 1}, {'x': 'a', 'y': '2'}], 'tags': [1, '2'], 'name': 'foo'},
+    {'tags': []},
+])
+def test_same_result(schema, value):
+    node, active = schema
+    result = run(node.adeserialize(value))
+
+    node.bar.items.x._validator = node.name._validator = sync(active)
+
+    assert result == node.deserialize(value)
+
+
+@pytest.mark.parametrize('value', [
+    {'bar': [{'x': 1}, {}, {'x': 'invalid'}, {'y': 'a'}], 'tags': [1, 'x'], 'name': 'invalid'},
+    {'bar': 3},
+    [],
+])
+def test_same_invalids(schema, value):
+    import objective
+
+    node, active = schema
+
+    def errors(func):
+        with pytest.raises(objective.Invalid) as err:
+            func(value)
+
+        if isinstance(err.value, objective.exc.InvalidChildren):
+            return {path: (invalid.__class__, invalid.message) for path, invalid in err.value.error_dict().items()}
+
+        return err.value.__class__, err.value.message
+
+    expected = errors(lambda v: run(node.adeserialize(v)))
+
+    node.bar.items.x._validator = node.name._validator = sync(active)
+
+    assert expected == errors(node.deserialize)
+
+
+def test_concurrency():
+    import objective
+
+    active = Active()
+
+    class Names(objective.List):
+        items = objective.Item(objective.Unicode, validator=active)
+
+    value = [str(i) for i in range(20)]
+
+    assert run(Names().adeserialize(value)) == value
+    assert active.max == 20
+
+    active.max = 0
+
+    assert run(Names().adeserialize(value, concurrency=3)) == value
+    assert active.max == 3
+
+
+def test_max_errors():
+    import objective
+
+    class Names(objective.List):
+        items = objective.Item(objective.Unicode, validator=Active())
+
+    with pytest.raises(objective.exc.InvalidChildren) as err:
+        run(Names(max_errors=2).adeserialize(['a', 'invalid', 'b', 'invalid', 'invalid']))
+
+    assert err.value.truncated
+    assert sorted(err.value.error_dict()) == [(1,), (3,)]
+
+
+def test_container_validator():
+    import objective
+
+    async def not_empty(node, value, environment=None):
+        await asyncio.sleep(0)
+
+        if not value:
+            raise objective.Invalid()
+
+        return value
+
+    class M(objective.Mapping):
+        tags = objective.Item(objective.List, validator=not_empty)
+
+    with pytest.raises(objective.exc.InvalidChildren) as err:
+        run(M().adeserialize({'tags': []}))
+
+    assert err.value.children[0].node is M().tags
+    assert run(M().adeserialize({'tags': [1]})) == {'tags': [1]}
+
+
+def test_union():
+    import objective
+
+    class A(objective.Mapping):
+        type = objective.Item(objective.Unicode)
+        x = objective.Item(objective.Unicode, validator=Active())
+
+    class B(objective.Mapping):
+        y = objective.Item(objective.Int)
+
+    class M(objective.Mapping):
+        u = objective.Item(objective.Union, discriminator='type', choices={'a': A})
+        v = objective.Item(objective.Union, choices=[A, B], missing=objective.Ignore)
+
+    node = M()
+
+    assert run(node.adeserialize({'u': {'type': 'a', 'x': 1}})) == {'u': {'type': u'a', 'x': u'1'}}
+
+    # the first choice is invalid after awaiting its validator
+    value = {'u': {'type': 'a', 'x': 1}, 'v': {'type': 'a', 'x': 'invalid', 'y': '2'}}
+    assert run(node.adeserialize(value)) == {'u': {'type': u'a', 'x': u'1'}, 'v': {'y': 2}}
+
+    with pytest.raises(objective.exc.InvalidChildren) as err:
+        run(node.adeserialize({'u': {'type': 'a', 'x': 'invalid'}}))
+
+    assert sorted(err.value.error_dict()) == [('u',), ('u', 'x')]
+
+    with pytest.raises(objective.exc.InvalidChildren) as err:
+        run(node.adeserialize({'u': {'type': 'a', 'x': 1}, 'v': {'type': 'a', 'x': 'invalid'}}))
+
+    # the reasons of both failed trials
+    assert [error['path'][-1] for error in err.value.error_list()] == ['x', 'y']
+
+
+def test_synchronous_subtree():
+    import objective
+
+    class Custom(objective.Mapping):
+        x = objective.Item(objective.Unicode, validator=Active())
+
+        def _deserialize(self, value, environment=None):
+            return {'x': self.x.deserialize(value['x'], environment)}
+
+    class M(objective.Mapping):
+        custom = objective.Item(Custom)
+
+    with pytest.raises(RuntimeError):
+        run(M().adeserialize({'custom': {'x': 'a'}}))
+
+
+@pytest.mark.parametrize('options', [
+    {'chunk': 2, 'interval': None},
+    {'chunk': 1, 'interval': 0},
+    {'executor': 'thread'},
+])
+def test_chunked(options):
+    from concurrent.futures import ThreadPoolExecutor
+
+    import objective
+    from objective import aio
+
+    class Row(objective.Mapping):
+        x = objective.Item(objective.Int)
+        y = objective.Item(objective.Unicode, missing=objective.Ignore)
+
+    class Rows(objective.List):
+        items = objective.Item(Row)
+
+    value = [{'x': str(i), 'y': i} for i in range(50)]
+    released = []
+
+    async def ticker():
+        while True:
+            released.append(None)
+            await asyncio.sleep(0)
+
+    async def main(value):
+        task = asyncio.ensure_future(ticker())
+
+        try:
+            return await aio.chunked(Rows(), value, **options)
+
+        finally:
+            task.cancel()
+
+    if options.get('executor') == 'thread':
+        options['executor'] = ThreadPoolExecutor(1)
+
+    assert run(main(value)) == Rows().deserialize(value)
+
+    if 'chunk' in options:
+        # the loop was released between the chunks
+        assert len(released) >= 25
+
+    value[3]['x'] = 'a'
+
+    with pytest.raises(objective.exc.InvalidChildren) as err:
+        run(main(value))
+
+    assert sorted(err.value.error_dict()) == [(3,), (3, 'x')]
@@ -0,0 +1,211 @@
+# coding: utf-8
+import pytest
+
+
+@pytest.fixture
+def schema():
+    import objective
+
+    calls = []
+
+    class Tag(objective.Unicode):
+        def _deserialize(self, value, environment=None):
+            calls.append(value)
+            return super(Tag, self)._deserialize(value, environment)
+
+    class Post(objective.BunchMapping):
+        title = objective.Item(objective.Unicode)
+        tags = objective.Item(objective.List, items=objective.Item(Tag))
+
+    return Post(), calls
+
+
+def test_deserialize(schema):
+    from objective.cache import ResultCache
+
+    node, calls = schema
+    cache = ResultCache()
+
+    result = cache.deserialize(node, {'title': 'foo', 'tags': ['a']})
+    result.tags.append('b')
+    result.title = 'bar'
+
+    # equal values in another order
+    again = cache.deserialize(node, {'tags': ['a'], 'title': 'foo'})
+
+    assert again == {'title': u'foo', 'tags': [u'a']}
+    assert again.title == u'foo'
+    assert calls == ['a']
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5}
+
+    # not JSON serializable
+    cache.deserialize(node, {'title': 'foo', 'tags': {'a'}})
+    assert calls == ['a', 'a']
+
+
+def test_loads(schema):
+    import objective
+    from objective.cache import ResultCache
+
+    node, calls = schema
+    cache = ResultCache()
+    parsed = []
+
+    def loads(data):
+        import json
+
+        parsed.append(data)
+        return json.loads(data)
+
+    for _ in range(3):
+        assert cache.loads(node, b'{"title": "foo", "tags": ["a"]}', loads=loads) == {'title': u'foo', 'tags': [u'a']}
+
+    assert len(parsed) == 1
+
+    # invalid results are not cached
+    for _ in range(2):
+        with pytest.raises(objective.Invalid):
+            cache.loads(node, b'{"tags": []}', loads=loads)
+
+    assert len(parsed) == 3
+
+
+def test_environment(schema):
+    from objective.cache import ResultCache
+
+    node, calls = schema
+    value = {'title': 'foo', 'tags': ['a']}
+
+    cache = ResultCache()
+    cache.deserialize(node, value, environment={'user': 1})
+    cache.deserialize(node, value, environment={'user': 1})
+    assert cache.stats()['hits'] == 0
+
+    cache = ResultCache(environment_key=lambda environment: str(environment['user']))
+    cache.deserialize(node, value, environment={'user': 1})
+    cache.deserialize(node, value, environment={'user': 1})
+    cache.deserialize(node, value, environment={'user': 2})
+    cache.deserialize(node, value, schema='other')
+    assert cache.stats()['hits'] == 1
+
+
+def test_canonical():
+    import objective
+    from objective.cache import ResultCache
+
+    class M(objective.Mapping):
+        x = objective.Item(objective.Unicode, name='1')
+
+    cache = ResultCache()
+    node = M()
+
+    assert cache.deserialize(node, {'1': 'x'}) == {'1': u'x'}
+
+    # an int key is not the same
+    with pytest.raises(objective.Invalid):
+        cache.deserialize(node, {1: 'x'})
+
+    canonical = ResultCache.canonical
+
+    assert canonical([1, 2]) != canonical((1, 2))
+    assert canonical({'a': [1.0]}) == canonical({'a': [1.0]})
+    assert canonical(0.0) != canonical(-0.0)
+    assert canonical(1) != canonical(True) != canonical(1.0)
+    assert canonical({'a': 1, 'b': 2}) == canonical({'b': 2, 'a': 1})
+    assert canonical({object(): 1}) is None
+
+
+def test_schema_key():
+    import objective
+    from objective.cache import ResultCache
+
+    cache = ResultCache()
+    ints = objective.List(items=objective.Item(objective.Int))
+    texts = objective.List(items=objective.Item(objective.Unicode))
+
+    assert cache.deserialize(ints, ['1']) == [1]
+    assert cache.deserialize(texts, ['1']) == [u'1']
+    assert cache.deserialize(ints, ['1']) == [1]
+
+    assert cache.stats()['hits'] == 1
+    assert ResultCache.schema_key(ints) == ResultCache.schema_key(ints) != ResultCache.schema_key(texts)
+
+    # instances share results by an explicit key
+    cache.deserialize(objective.Mapping(), {}, schema='empty')
+    cache.deserialize(objective.Mapping(), {}, schema='empty')
+
+    assert cache.stats()['hits'] == 2
+
+
+def test_memory_store():
+    from objective.cache import MemoryStore
+
+    now = [0]
+    store = MemoryStore(max_bytes=10, ttl=5, clock=lambda: now[0])
+
+    store.set('a', b'1234')
+    store.set('b', b'1234')
+    assert store.get('a') == b'1234'
+
+    # b is the least recently used
+    store.set('c', b'1234')
+    assert store.get('b') is None
+    assert store.size == 8
+
+    store.set('d', b'12345678901')
+    assert store.get('d') is None
+
+    now[0] = 5
+    assert store.get('a') is None
+    assert len(store) == 1
+
+
+def test_file_store(tmpdir, schema):
+    import os
+
+    from objective.cache import FileStore, ResultCache
+
+    node, calls = schema
+    directory = str(tmpdir.join('results'))
+    value = {'title': 'foo', 'tags': ['a']}
+
+    # like two processes
+    first = ResultCache(store=FileStore(directory))
+    second = ResultCache(store=FileStore(directory))
+
+    assert first.deserialize(node, value) == second.deserialize(node, value)
+    assert calls == ['a']
+
+    directory = str(tmpdir.join('bounded'))
+    now = [1000.0]
+    store = FileStore(directory, max_bytes=10, ttl=5, clock=lambda: now[0])
+    store.set('x', b'123456')
+    os.utime(store._path('x'), (now[0] - 1, now[0]))
+    store.set('y', b'123456')
+
+    # the oldest is evicted
+    assert sorted(os.listdir(directory)) == ['y']
+    assert store.get('y') == b'123456'
+
+    now[0] += 5
+    assert store.get('y') is None
+    assert os.listdir(directory) == []
+
+
+def test_file_store_directory(tmpdir):
+    import os
+    import stat
+
+    from objective.cache import FileStore
+
+    directory = str(tmpdir.join('private'))
+    FileStore(directory)
+
+    assert stat.S_IMODE(os.stat(directory).st_mode) & 0o077 == 0
+
+    shared = str(tmpdir.join('shared'))
+    os.mkdir(shared)
+    os.chmod(shared, 0o777)
+
+    with pytest.raises(ValueError):
+        FileStore(shared)
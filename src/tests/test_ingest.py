@@ -0,0 +1,107 @@
+# coding: utf-8
+import json
+
+import pytest
+
+
+def order():
+    # the schema must be importable by the worker processes
+    import objective
+
+    class Order(objective.Mapping):
+        id = objective.Item(objective.Int)
+        sku = objective.Item(objective.Unicode)
+
+    return Order()
+
+
+@pytest.fixture
+def path(tmpdir):
+    lines = [json.dumps({'id': str(i), 'sku': 'sku {}'.format(i)}) for i in range(200)]
+    lines[10] = '{"id": "a", "sku": "x"}'
+    lines[20] = ''
+    lines[30] = '{"id": 1'
+
+    path = tmpdir.join('orders.jsonl')
+    path.write('\n'.join(lines))
+
+    return str(path)
+
+
+def check(lines):
+    numbers = [line.number for line in lines]
+
+    assert numbers == [i + 1 for i in range(200) if i != 20]
+
+    for line in lines:
+        if line.number == 11:
+            assert [(error['path'], error['code']) for error in line.errors] == [(['id'], 'invalid')]
+
+        elif line.number == 31:
+            assert line.value is None and line.errors[0]['code'] == 'parse'
+
+        else:
+            assert line.errors is None
+            assert line.value == {'id': line.number - 1, 'sku': u'sku {}'.format(line.number - 1)}
+
+
+@pytest.mark.parametrize('workers,chunk_size', [(0, 100), (0, 10 ** 6), (2, 100), (3, 1000)])
+def test_read(path, workers, chunk_size):
+    from objective import ingest
+
+    check(list(ingest.read(path, order, workers=workers, chunk_size=chunk_size, max_pending=3)))
+
+
+def test_ranges(path):
+    from objective import ingest
+
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    ranges = list(ingest.ranges(path, 64))
+
+    assert b''.join(data[start:end] for start, end in ranges) == data
+    assert all(data[end - 1:end] == b'\n' for _, end in ranges[:-1])
+
+    assert list(ingest.ranges(path, 10 ** 6)) == [(0, len(data))]
+
+
+def test_write(path, tmpdir):
+    from objective import ingest
+
+    output, errors = str(tmpdir.join('valid.jsonl')), str(tmpdir.join('invalid.jsonl'))
+
+    assert ingest.write(path, order, output, errors=errors, workers=2, chunk_size=500) == (197, 2)
+
+    with open(output) as f:
+        assert [json.loads(line) for line in f][:2] == [{'id': 0, 'sku': 'sku 0'}, {'id': 1, 'sku': 'sku 1'}]
+
+    with open(errors) as f:
+        assert [json.loads(line)['line'] for line in f] == [11, 31]
+
+
+def test_empty(tmpdir):
+    from objective import ingest
+
+    path = tmpdir.join('empty.jsonl')
+    path.write('')
+
+    assert list(ingest.read(str(path), order, workers=1)) == []
+
+
+def test_text():
+    from objective import ingest
+
+    def loads(data):
+        # like python before 3.6
+        assert not isinstance(data, bytes)
+
+        return json.loads(data)
+
+    worker = ingest.Worker(order, loads=loads)
+
+    assert worker.line(1, u'{"id": 1, "sku": "ä"}'.encode('utf-8')).value == {'id': 1, 'sku': u'ä'}
+
+    line = worker.line(2, b'{"id": 1, "sku": "\xff"}')
+
+    assert line.value is None and line.errors[0]['code'] == 'parse'
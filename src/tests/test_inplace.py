@@ -0,0 +1,90 @@
+# coding: utf-8
+import copy
+
+import pytest
+
+
+@pytest.fixture
+def schema():
+    import objective
+
+    class Line(objective.Mapping):
+        sku = objective.Item(objective.Unicode)
+        quantity = objective.Item(objective.Int, missing=1)
+
+    class Order(objective.Mapping):
+        id = objective.Item(objective.Int)
+        note = objective.Item(objective.Unicode, missing=objective.Ignore)
+        lines = objective.Item(objective.List, items=objective.Item(Line))
+        tags = objective.Item(objective.Set, items=objective.Item(objective.Unicode), missing=objective.Ignore)
+
+    return Order()
+
+
+def value():
+    return {
+        'id': '1',
+        'color': 'red',
+        'lines': [{'sku': 'a', 'quantity': '2'}, {'sku': 'b'}],
+        'tags': ['x', 'x'],
+    }
+
+
+def test_inplace(schema):
+    data = value()
+    lines = data['lines']
+    first = lines[0]
+
+    result = schema.deserialize(data, inplace=True)
+
+    assert result is data
+    assert result['lines'] is lines and lines[0] is first
+
+    # equal to the allocating deserialization
+    assert result == schema.deserialize(value())
+    assert result == {
+        'id': 1,
+        'lines': [{'sku': u'a', 'quantity': 2}, {'sku': u'b', 'quantity': 1}],
+        'tags': {u'x'},
+    }
+
+
+def test_other_types():
+    import objective
+
+    class Bunched(objective.BunchMapping):
+        id = objective.Item(objective.Int)
+
+    data = {'id': '1'}
+    result = Bunched().deserialize(data, inplace=True)
+
+    assert result is not data and result.id == 1
+    assert data == {'id': '1'}
+
+
+def test_rollback(schema):
+    import objective
+
+    data = value()
+    data['lines'].append({'quantity': 'x'})
+    original = copy.deepcopy(data)
+
+    with pytest.raises(objective.Invalid) as info:
+        schema.deserialize(data, inplace=True)
+
+    assert [error['path'] for error in info.value.error_list()] == [['lines', 2, 'sku'], ['lines', 2, 'quantity']]
+    assert data == original
+
+
+def test_partial(schema):
+    import objective
+    from objective import inplace
+
+    data = value()
+    data['id'] = 'x'
+
+    with pytest.raises(objective.Invalid) as info:
+        inplace.deserialize(schema, data, rollback=False)
+
+    assert info.value.partial is True
+    assert data['lines'][1] == {'sku': u'b', 'quantity': 1}
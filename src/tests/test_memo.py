@@ -0,0 +1,165 @@
+# coding: utf-8
+import pytest
+
+
+def test_memoize():
+    import objective
+
+    calls = []
+
+    class Country(objective.Unicode):
+        def _deserialize(self, value, environment=None):
+            calls.append(value)
+            return super(Country, self)._deserialize(value, environment)
+
+    class Countries(objective.List):
+        items = objective.Item(Country, memoize=True)
+
+    countries = Countries()
+
+    assert countries.deserialize(['de', 'fr', 'de', 'de', 1, True]) == [u'de', u'fr', u'de', u'de', u'1', u'True']
+    assert calls == ['de', 'fr', 1, True]
+
+
+def test_scope():
+    import objective
+    from objective.memo import Memo
+
+    class Countries(objective.List):
+        items = objective.Item(objective.Unicode, memoize=Memo(maxsize=2))
+
+    countries = Countries()
+
+    with Memo() as memo:
+        countries.deserialize(['de', 'fr', 'de', 'it', 'de'])
+
+    assert memo.stats() == {'hits': 2, 'misses': 3, 'hit_rate': 0.4, 'size': 3, 'maxsize': 1024}
+
+    # without scope the bounded memo of the field is used
+    countries.deserialize(['de', 'fr', 'de', 'it', 'de'])
+
+    assert len(countries.items.memo) == 2
+    assert countries.items.memo.hits == 2
+
+
+def test_impure():
+    import objective
+
+    class M(objective.Mapping):
+        foo = objective.Item(objective.Unicode, memoize=True, validator=objective.FieldValue(objective.Unicode))
+        bar = objective.Item(objective.Field, memoize=True)
+        baz = objective.Item(objective.Unicode, memoize=True, validator=objective.OneOf(['a']))
+
+    with pytest.raises(ValueError):
+        M().foo                                                         # pylint: disable=W0104
+
+    with pytest.raises(ValueError):
+        M().bar                                                         # pylint: disable=W0104
+
+    assert M().baz.deserialize('a') == u'a'
+
+
+def test_interner():
+    from objective.memo import Interner
+
+    interner = Interner(maxsize=2, max_length=3)
+    first = u''.join([u'd', u'e'])
+
+    assert interner(first) is first
+    assert interner(u''.join([u'd', u'e'])) is first
+
+    # too long
+    long_value = u''.join([u'a', u'bcd'])
+    assert interner(long_value) is long_value
+    assert len(interner) == 1
+
+    interner(u'fr')
+    other = u''.join([u'i', u't'])
+
+    # full
+    assert interner(other) is other
+    assert len(interner) == 2
+
+    # added regardless of size and length
+    assert interner.add(other) is other and len(interner) == 3
+
+
+def test_intern():
+    import objective
+    from objective.memo import Interner
+
+    shared = Interner()
+
+    class Address(objective.Mapping):
+        country = objective.Item(objective.Unicode, intern=shared)
+        status = objective.Item(objective.Unicode, intern=True, validator=objective.OneOf([u'active' * 20, u'x']))
+        street = objective.Item(objective.Unicode)
+
+    class Addresses(objective.List):
+        items = objective.Item(Address, extra='keep', intern=shared)
+
+    def text(*parts):
+        return u''.join(parts)
+
+    results = Addresses().deserialize([
+        {'country': text(u'd', u'e'), 'status': text(u'active' * 20), 'street': text(u'a', u'b'),
+         text(u'ex', u'tra'): 1},
+        {'country': text(u'd', u'e'), 'status': text(u'active' * 20), 'street': text(u'a', u'b'),
+         text(u'ex', u'tra'): 2},
+    ])
+
+    first, second = results
+
+    assert first['country'] is second['country']
+    # a declared choice is interned regardless of its length
+    assert first['status'] is second['status']
+    assert first['street'] is not second['street']
+
+    # the keys are the names of the items or interned
+    assert [key for key in first if key == 'country'][0] is [key for key in second if key == 'country'][0]
+    assert [key for key in first if key == 'extra'][0] is [key for key in second if key == 'extra'][0]
+    assert len(shared) == 2
+
+
+def test_equal_but_different():
+    import datetime
+
+    import pytz
+
+    import objective
+
+    utc = objective.UtcDateTime(memoize=True)
+    noon = pytz.utc.localize(datetime.datetime(2020, 1, 1, 12))
+    one = pytz.FixedOffset(60).localize(datetime.datetime(2020, 1, 1, 13))
+
+    assert utc.deserialize(noon) is noon
+    assert utc.deserialize(one) is one
+
+    number = objective.Float(memoize=True)
+
+    assert str(number.deserialize(0.0)) == '0.0'
+    assert str(number.deserialize(-0.0)) == '-0.0'
+    assert number.memo.stats()['size'] == 0
+
+
+def test_threads():
+    import threading
+
+    from objective.memo import Memo
+
+    memo = Memo(maxsize=10)
+
+    def work():
+        for i in range(1000):
+            memo.cached(i % 20, lambda value: value * 2, i % 20)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert memo.hits + memo.misses == 4000
+    assert len(memo) == 10
@@ -1,6 +1,7 @@
 # coding: utf-8
 # this is the test section
 import pytest
+import six
 
 
 def test_validate():
@@ -351,6 +352,111 @@ class TestDateTime(object):
 
         assert f.deserialize(ds) == result
 
+    @pytest.mark.parametrize("fmt, expected", [
+        ('str', u"2014-05-07 14:19:09.522000+00:00"),
+        ('iso', u"2014-05-07T14:19:09.522000+00:00"),
+        ('epoch', 1399472349.522),
+        ('epoch_ms', 1399472349522),
+    ])
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_serialize(self, fmt, expected, trusted):
+        import datetime
+
+        import pytz
+
+        import objective.fields
+
+        f = objective.fields.UtcDateTime(format=fmt)
+        aware = objective.fields.dateutil_parse("2014-05-07T16:19:09.522+02:00")
+
+        for value in (aware, aware.astimezone(pytz.utc), datetime.datetime(2014, 5, 7, 14, 19, 9, 522000)):
+            result = f.serialize(value, trusted=trusted)
+
+            if fmt == 'str' and value.tzinfo is not pytz.utc:
+                # the string keeps the time zone or its absence
+                continue
+
+            assert result == expected
+            assert type(result) is type(expected)
+
+    @pytest.mark.parametrize("fmt", ['str', 'iso', 'epoch', 'epoch_ms'])
+    def test_round_trip(self, fmt):
+        import objective.fields
+
+        f = objective.fields.UtcDateTime(format=fmt)
+        value = objective.fields.dateutil_parse("2014-05-07T14:19:09.522Z")
+
+        assert f.deserialize(f.serialize(value)) == value
+
+    def test_invalid_format(self):
+        import objective.fields
+
+        with pytest.raises(ValueError):
+            objective.fields.UtcDateTime(format='rfc')
+
+
+class TestFloat(object):
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_precision(self, trusted):
+        import objective
+
+        f = objective.Float(precision=2)
+
+        assert f.serialize(1.23456, trusted=trusted) == 1.23
+        assert f.serialize(2, trusted=trusted) == 2
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    @pytest.mark.parametrize("nan, expected", [
+        ('allow', True),
+        ('null', None),
+    ])
+    def test_serialize_nan(self, nan, expected, trusted):
+        import math
+
+        import objective
+
+        f = objective.Float(nan=nan, precision=1)
+
+        for value in (float('nan'), float('inf'), float('-inf')):
+            result = f.serialize(value, trusted=trusted)
+
+            if expected is None:
+                assert result is None
+
+            else:
+                assert math.isnan(result) or math.isinf(result)
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_forbid(self, trusted):
+        import objective
+
+        f = objective.Float(nan='forbid')
+
+        with pytest.raises(objective.exc.NotFinite):
+            f.serialize(float('inf'), trusted=trusted)
+
+        with pytest.raises(objective.exc.NotFinite) as e:
+            f.deserialize('nan')
+
+        assert e.value.code == 'not_finite'
+        assert f.deserialize('1.5') == 1.5
+
+    def test_invalid_nan(self):
+        import objective
+
+        with pytest.raises(ValueError):
+            objective.Float(nan='zero')
+
+
+def test_serialize_unicode():
+    import objective
+
+    value = u'foo'
+
+    assert objective.Unicode().serialize(value) is value
+    assert objective.Unicode().serialize(1) == u'1'
+
 
 class TestNode(object):
 
@@ -519,6 +625,53 @@ def test_unicode():
     assert v == "123"
 
 
+@pytest.mark.parametrize('field,value,result', [
+    ('Unicode', b'\xc3\xa4bc', u'\xe4bc'),
+    ('Unicode', bytearray(b'abc'), u'abc'),
+    ('Unicode', memoryview(b'xx abc xx')[3:6], u'abc'),
+    ('Unicode', memoryview(b'a_b_c_')[::2], u'abc'),
+    ('Int', memoryview(b'123, 4')[:3], 123),
+    ('Int', bytearray(b'-1'), -1),
+    ('Float', memoryview(b' 1.5 ')[1:4], 1.5),
+    ('Bytes', u'\xe4', b'\xc3\xa4'),
+    ('Bytes', bytearray(b'abc'), b'abc'),
+    ('Bytes', memoryview(b'xx abc')[3:], b'abc'),
+])
+def test_buffers(field, value, result):
+    import objective
+
+    deserialized = getattr(objective, field)().deserialize(value)
+
+    assert deserialized == result
+    assert type(deserialized) is type(result)
+
+
+def test_bytes():
+    import array
+
+    import objective
+
+    buf = bytearray(b'xx abc')
+    view = objective.Bytes(zero_copy=True).deserialize(memoryview(buf)[3:])
+
+    assert isinstance(view, memoryview)
+
+    buf[3:4] = b'A'
+
+    assert view == b'Abc'
+    assert objective.Bytes().serialize(view) == b'Abc'
+
+    # other formats are cast to bytes
+    numbers = array.array('B', [97, 98])
+    assert objective.Bytes(zero_copy=True).deserialize(memoryview(numbers).cast('c')) == b'ab'
+
+    with pytest.raises(objective.exc.LengthExceeded):
+        objective.Bytes(max_length=2).deserialize(b'abc')
+
+    with pytest.raises(objective.Invalid):
+        objective.Bytes().deserialize(1)
+
+
 def test_utc():
     import objective
     import datetime
@@ -592,7 +745,9 @@ def test_order():
     (0, False),
     ('t', True),
     ('On', True),
-    ('foo', False)
+    ('foo', False),
+    (b'true', True),
+    (memoryview(b'yes'), True),
 
 ])
 def test_bool(value, result):
@@ -633,6 +788,44 @@ def test_chain(value, result):
     assert v(None, value) == result
 
 
+def test_field_value_cache():
+    import objective
+
+    created = []
+
+    class Env(objective.Unicode):
+        def __init__(self, environment=None, **kwargs):
+            super(Env, self).__init__(**kwargs)
+            self.environment = environment
+            created.append(self)
+
+        def _deserialize(self, value, environment=None):
+            return u'{}{}'.format(value, self.environment['suffix'])
+
+    v = objective.FieldValue(Env, maxsize=2)
+    env1, env2, env3 = {'suffix': 1}, {'suffix': 2}, {'suffix': 3}
+
+    assert [v(None, x, env1) for x in 'ab'] == [u'a1', u'b1']
+    assert v(None, 'a', env2) == u'a2'
+    assert v(None, 'a', env1) == u'a1'
+    assert len(created) == 2
+
+    # the least recently used field is dropped
+    v(None, 'a', env3)
+    v(None, 'a', env2)
+    assert len(created) == 4
+
+    # an explicit key shares the field for equal keys
+    v = objective.FieldValue(Env, key=lambda environment: environment['suffix'])
+    assert v(None, 'a', {'suffix': 1}) == v(None, 'a', {'suffix': 1}) == u'a1'
+    assert len(created) == 5
+
+    # an instance is used for all environments
+    v = objective.FieldValue(objective.Bool())
+    assert v(None, 'on', env1) is v(None, 'on', env2) is True
+    assert len(created) == 5
+
+
 def test_list_items_error():
     import objective
     import six
@@ -705,3 +898,869 @@ class TestContainer:
         foo = Foo()
         with pytest.raises(objective.Invalid) as e:
             d = foo.deserialize([])
+
+
+class TestForwardReference(object):
+
+    def test_self_reference(self):
+        import objective
+
+        class Category(objective.Mapping):
+            name = objective.Item(objective.Unicode)
+            children = objective.Item(objective.List, items=objective.Item('Category'), missing=objective.Ignore)
+
+        category = Category()
+
+        assert category.deserialize({'name': 1, 'children': [{'name': 2, 'children': [{'name': 3}]}]}) == {
+            'name': u'1', 'children': [{'name': u'2', 'children': [{'name': u'3'}]}]
+        }
+
+        # all levels share the same nodes
+        assert category.children.items.children.items is category.children.items
+
+    def test_enclosing_scope(self):
+        import objective
+
+        class Category(objective.Mapping):
+            @objective.Item(missing=objective.Ignore)
+            class parent(objective.Mapping):
+                category = objective.Item('Category')
+
+        assert Category.parent.category is Category
+
+    def test_factory(self):
+        import objective
+
+        def make(field):
+            class Category(objective.Mapping):
+                value = objective.Item(field)
+                child = objective.Item('Category', missing=objective.Ignore)
+
+            return Category
+
+        IntCategory = make(objective.Int)
+        UnicodeCategory = make(objective.Unicode)
+
+        # each class resolves to itself, not to the last class of the same qualified name
+        assert IntCategory().child.__class__ is IntCategory
+        assert UnicodeCategory().child.__class__ is UnicodeCategory
+
+        assert IntCategory().deserialize({'value': '1', 'child': {'value': '2'}}) == {'value': 1, 'child': {'value': 2}}
+
+    def test_lazy_callable(self):
+        import objective
+
+        class Node(objective.Mapping):
+            next = objective.Item(lambda: Node, missing=objective.Ignore)
+
+        assert Node().deserialize({'next': {'next': {}}}) == {'next': {'next': {}}}
+        assert Node().next.next is Node().next
+
+    def test_dotted_name(self):
+        import objective
+
+        class M(objective.Mapping):
+            foo = objective.Item('objective.fields.Int')
+
+        assert M().deserialize({'foo': '1'}) == {'foo': 1}
+
+    def test_unresolvable(self):
+        import objective
+
+        class M(objective.Mapping):
+            foo = objective.Item('DoesNotExist')
+
+        with pytest.raises(ValueError):
+            M().foo                                                     # pylint: disable=W0104
+
+
+def test_list_items_share_node():
+    import objective
+
+    class M(objective.Mapping):
+        tags = objective.Item(
+            objective.List,
+            items=objective.Item(objective.Unicode, validator=objective.OneOf([u'a', u'b']))
+        )
+
+    with pytest.raises(objective.exc.InvalidChildren) as err:
+        M().deserialize({'tags': ['a', 'c', 'b', 'd']})
+
+    assert sorted(path for path in err.value.error_dict()) == [('tags',), ('tags', 1), ('tags', 3)]
+    assert err.value.children[0].children[0].message == 'Invalid value for `1`: c'
+
+
+class TestUnion(object):
+
+    @pytest.fixture
+    def events(self):
+        import objective
+
+        class Created(objective.Mapping):
+            type = objective.Item(objective.Unicode)
+            name = objective.Item(objective.Unicode)
+
+        class Deleted(objective.Mapping):
+            type = objective.Item(objective.Unicode)
+            id = objective.Item(objective.Int)
+
+        class Events(objective.List):
+            items = objective.Item(objective.Union, discriminator='type', choices={
+                'created': Created,
+                'deleted': Deleted,
+            })
+
+        return Events()
+
+    def test_dispatch(self, events):
+        assert events.deserialize([
+            {'type': 'created', 'name': 'foo'},
+            {'type': 'deleted', 'id': '1', 'name': 'foo'},
+        ]) == [
+            {'type': u'created', 'name': u'foo'},
+            {'type': u'deleted', 'id': 1},
+        ]
+
+    def test_dispatch_invalid(self, events):
+        import objective
+
+        with pytest.raises(objective.exc.InvalidChildren) as err:
+            events.deserialize([
+                {'type': 'created', 'name': 'foo'},
+                {'type': 'deleted'},
+                {'type': 'unknown'},
+            ])
+
+        errors = {path: invalid.message for path, invalid in err.value.error_dict().items()}
+
+        assert errors == {
+            (1,): 'Invalid value for `1`: <Undefined>',
+            (1, 'id'): 'Value for `id` is missing!',
+            (2,): 'Invalid value `unknown` for discriminator `type`',
+        }
+
+    def test_serialize(self, events):
+        assert events.serialize([{'type': 'deleted', 'id': 1, 'name': 'foo'}]) == [{'type': u'deleted', 'id': 1}]
+
+    def test_trial(self):
+        import objective
+
+        class Point(objective.Mapping):
+            x = objective.Item(objective.Int)
+            y = objective.Item(objective.Int)
+
+        class Ref(objective.Mapping):
+            ref = objective.Item(objective.Unicode)
+
+        class M(objective.Mapping):
+            target = objective.Item(objective.Union, choices=[Point, Ref])
+
+        m = M()
+
+        assert m.deserialize({'target': {'x': '1', 'y': 2}}) == {'target': {'x': 1, 'y': 2}}
+        assert m.deserialize({'target': {'ref': 'foo'}}) == {'target': {'ref': u'foo'}}
+
+        with pytest.raises(objective.exc.InvalidChildren) as err:
+            m.deserialize({'target': {}})
+
+        # every trial has its own path
+        assert [error['path'] for error in err.value.error_list()] == [
+            ['target', 'Point', 'x'], ['target', 'Point', 'y'], ['target', 'Ref', 'ref'],
+        ]
+        assert [invalid.node.__class__ for invalid in err.value.children[0].children] == [Point, Ref]
+
+        errors = err.value.error_dict()
+
+        assert isinstance(errors[('target', 'Point')], objective.exc.InvalidChildren)
+        assert isinstance(errors[('target', 'Ref')], objective.exc.InvalidChildren)
+
+    def test_trial_same_names(self):
+        import objective
+
+        def point():
+            class Point(objective.Mapping):
+                x = objective.Item(objective.Int)
+
+            return Point
+
+        class M(objective.Mapping):
+            target = objective.Item(objective.Union, choices=[point(), point()])
+
+        with pytest.raises(objective.exc.InvalidChildren) as err:
+            M().deserialize({'target': {}})
+
+        assert [error['path'] for error in err.value.error_list()] == [['target', 'Point', 'x'], ['target', 1, 'x']]
+
+    def test_discriminator_needs_mapping(self):
+        import objective
+
+        with pytest.raises(ValueError):
+            objective.Union(choices=[objective.Mapping], discriminator='type')
+
+        class Choices(objective.Union):
+            discriminator = 'type'
+            choices = (objective.Mapping,)
+
+        with pytest.raises(ValueError):
+            Choices()
+
+
+class TestMaxErrors(object):
+
+    def test_fail_fast(self):
+        import objective
+
+        class M(objective.Mapping):
+            tags = objective.Item(objective.List, items=objective.Item(objective.Int), fail_fast=True)
+
+        with pytest.raises(objective.exc.InvalidChildren) as err:
+            M().deserialize({'tags': ['a', 1, 'b', 'c']})
+
+        invalid = err.value.children[0]
+
+        assert invalid.truncated
+        assert [child.name for child in invalid.children] == [0]
+
+    def test_max_errors(self):
+        import objective
+
+        class M(objective.Mapping):
+            a = objective.Item(objective.Int)
+            b = objective.Item(objective.Int)
+            c = objective.Item(objective.Int)
+
+        with pytest.raises(objective.exc.InvalidChildren) as err:
+            M(max_errors=2).deserialize({})
+
+        assert err.value.truncated
+        assert [child.node__name__ for child in err.value.children] == ['a', 'b']
+
+        with pytest.raises(objective.exc.InvalidChildren) as err:
+            M().deserialize({})
+
+        assert not err.value.truncated
+        assert len(err.value.children) == 3
+
+    def test_lazy_message(self):
+        import objective
+
+        with pytest.raises(objective.exc.InvalidValue) as err:
+            objective.Int().deserialize('foo')
+
+        assert err.value._formatted is None
+        assert err.value.message == "Invalid value `foo` for `{}`".format((int,))
+
+
+class TestValidate(object):
+
+    @pytest.fixture
+    def schema(self):
+        import objective
+
+        class Bar(objective.Mapping):
+            x = objective.Item(objective.Unicode)
+            y = objective.Item(objective.Int, missing=objective.Ignore)
+
+            def _create_deserialize_type(self, value, environment=None):
+                raise AssertionError("No container is created by validate.")
+
+        class Foo(objective.Mapping):
+            bars = objective.Item(objective.List, items=objective.Item(Bar))
+            email = objective.Item(objective.Unicode, validator=objective.Email(), missing=objective.Ignore)
+
+        return Foo()
+
+    def test_valid(self, schema):
+        assert schema.validate({'bars': [{'x': 1}, {'x': 'a', 'y': '2'}], 'email': 'foo@example.com'}) is True
+
+    @pytest.mark.parametrize('value', [
+        {'bars': [{'x': 1}, {'y': 'a'}]},
+        {'bars': [{'x': 1}], 'email': 'foo'},
+        {'bars': 1},
+        [],
+    ])
+    def test_invalid(self, schema, value):
+        import objective
+
+        assert schema.validate(value) is False
+
+        def errors(func):
+            with pytest.raises(objective.Invalid) as err:
+                func(value)
+
+            if isinstance(err.value, objective.exc.InvalidChildren):
+                return {path: invalid.message for path, invalid in err.value.error_dict().items()}
+
+            return err.value.message
+
+        schema.bars.items._create_deserialize_type = lambda value, environment=None: {}
+
+        assert errors(lambda v: schema.validate(v, raises=True)) == errors(schema.deserialize)
+
+    def test_container_validator(self):
+        import objective
+
+        def not_empty(node, value, environment=None):
+            if not value:
+                raise objective.Invalid()
+
+            return value
+
+        class M(objective.Mapping):
+            tags = objective.Item(objective.List, validator=not_empty)
+
+        assert M().tags._checks_children is False
+        assert M().validate({'tags': []}) is False
+        assert M().validate({'tags': [1]}) is True
+
+
+class TestLimits(object):
+
+    def test_max_length(self):
+        import objective
+
+        class M(objective.Mapping):
+            tags = objective.Item(objective.List, items=objective.Item(objective.Int), max_length=2)
+            name = objective.Item(objective.Unicode, max_length=3)
+
+        assert M().deserialize({'tags': ['1', 2], 'name': 'foo'}) == {'tags': [1, 2], 'name': u'foo'}
+
+        with pytest.raises(objective.exc.InvalidChildren) as err:
+            M().deserialize({'tags': [1, 2, 3], 'name': 'fooo'})
+
+        errors = {path: invalid for path, invalid in err.value.error_dict().items()}
+
+        assert isinstance(errors[('tags',)], objective.exc.LengthExceeded)
+        assert isinstance(errors[('name',)], objective.exc.LengthExceeded)
+        assert errors[('tags',)].message == 'Length of `tags` exceeds 2'
+        assert M().validate({'tags': [1, 2, 3], 'name': 'foo'}) is False
+
+    def test_max_depth(self):
+        import objective
+
+        class Tree(objective.List):
+            items = objective.Item('Tree')
+
+        tree = Tree(max_depth=3)
+
+        assert tree.deserialize([[[]]]) == [[[]]]
+
+        with pytest.raises(objective.exc.InvalidChildren) as err:
+            tree.deserialize([[[[]]]])
+
+        assert err.value.truncated
+        assert isinstance(err.value.error_dict()[(0, 0, 0)], objective.exc.DepthExceeded)
+        assert tree.validate([[[[]]]]) is False
+
+    def test_max_elements(self):
+        import objective
+
+        calls = []
+
+        class Counted(objective.Field):
+            def _deserialize(self, value, environment=None):
+                calls.append(value)
+                return value
+
+        class Rows(objective.List):
+            items = objective.Item(objective.List, items=objective.Item(Counted))
+
+        rows = Rows(max_elements=10)
+
+        assert rows.deserialize([[1, 2], [3]]) == [[1, 2], [3]]
+
+        del calls[:]
+
+        with pytest.raises(objective.exc.InvalidChildren) as err:
+            rows.deserialize([list(range(100))])
+
+        assert len(calls) == 9
+        assert err.value.error_dict()[(0,)].message == 'Number of elements in `0` exceeds 10'
+
+
+class TestErrorTree(object):
+
+    @pytest.fixture
+    def invalid(self):
+        import objective
+
+        class Row(objective.Mapping):
+            x = objective.Item(objective.Int)
+            y = objective.Item(objective.Unicode, max_length=1)
+
+        class M(objective.Mapping):
+            rows = objective.Item(objective.List, items=objective.Item(Row))
+
+        with pytest.raises(objective.exc.InvalidChildren) as err:
+            M().deserialize({'rows': [{'x': 1, 'y': 'a'}, {'y': 'ab'}]})
+
+        return err.value
+
+    def test_paths(self, invalid):
+        paths = [(path, child) for path, child in invalid]
+
+        assert [path.names() for path, _ in paths] == [('rows',), ('rows', 1), ('rows', 1, 'x'), ('rows', 1, 'y')]
+
+        path, child = paths[-1]
+
+        assert path[-1] is child
+        assert path == [invalid.children[0], invalid.children[0].children[0], child]
+        assert [invalid] + path == [invalid] + list(path)
+
+    def test_error_list(self, invalid):
+        assert invalid.error_list() == [
+            {'path': ['rows', 1, 'x'], 'code': 'missing', 'message': 'Value for `x` is missing!'},
+            {'path': ['rows', 1, 'y'], 'code': 'max_length', 'message': 'Length of `y` exceeds 1'},
+        ]
+
+    def test_error_list_of_any(self, invalid):
+        import objective
+
+        assert objective.exc.error_list(invalid) == invalid.error_list()
+        assert objective.exc.error_list(objective.exc.InvalidValue(objective.Field(name='x'), 'bad')) == [
+            {'path': [], 'code': 'invalid', 'message': 'bad'},
+        ]
+        assert objective.exc.error_list(objective.Invalid('bad')) == [
+            {'path': [], 'code': 'invalid', 'message': 'bad'},
+        ]
+
+    def test_deep(self):
+        import objective
+        from objective import traversal
+
+        class Tree(objective.List):
+            items = objective.Item('Tree')
+
+        value = 1
+
+        for _ in range(5000):
+            value = [value]
+
+        with pytest.raises(objective.exc.InvalidChildren) as err:
+            traversal.deserialize(Tree(), value)
+
+        errors = err.value.error_list()
+
+        assert len(errors) == 1
+        assert errors[0]['path'] == [0] * 5000
+
+
+class TestEmail(object):
+
+    @pytest.mark.parametrize('address', [
+        'foo@example.com',
+        'foo.bar+baz@example.co.uk',
+        '"foo bar"@example.com',
+        'foo',
+        'foo@',
+        '@example.com',
+        'foo@@example.com',
+        'foo bar@example.com',
+    ])
+    def test_same_rules(self, address):
+        import objective
+        import validate_email
+
+        assert objective.Email().is_valid(address) is validate_email.validate_email(address)
+
+    def test_cache(self):
+        import objective
+
+        email = objective.Email(cache_size=2)
+
+        assert email.validate_many(['foo@example.com', 'foo', 'foo@example.com', None, 1]) == [
+            True, False, True, False, False
+        ]
+        assert email.addresses.stats()['hits'] == 1
+
+    def test_check_mx(self):
+        import objective
+
+        lookups = []
+
+        def resolver(domain):
+            lookups.append(domain)
+
+            return [(10, 'mx.example.com')] if domain == 'example.com' else None
+
+        email = objective.Email(check_mx=True, resolver=resolver)
+
+        assert email.validate_many(['foo@example.com', 'bar@example.com', 'foo@example.org']) == [True, True, False]
+        assert lookups == ['example.com', 'example.org']
+
+        with pytest.raises(objective.Invalid):
+            email(None, 'bar@example.org')
+
+
+@pytest.mark.parametrize('choices,value,result', [
+    (['a', 'b'], 'a', True),
+    (['a', 'b'], 'c', False),
+    (('a', ['b']), ['b'], True),
+    (('a', ['b']), ['c'], False),
+    (('a', {'b': 1}), {'b': 1}, True),
+    ([1, 2], True, True),
+    ('abc', 'ab', True),
+    ({'a': 1}, 'a', True),
+    (six.moves.range(0, 10 ** 8), 10 ** 8 - 1, True),
+    (six.moves.range(0, 10 ** 8), 10 ** 8, False),
+])
+def test_one_of_none_of(choices, value, result):
+    import objective
+
+    assert objective.OneOf(choices)._contains(value) is result
+
+    if result:
+        assert objective.OneOf(choices)(None, value) == value
+
+        with pytest.raises(objective.Invalid):
+            objective.NoneOf(choices)(None, value)
+
+    else:
+        assert objective.NoneOf(choices)(None, value) == value
+
+        with pytest.raises(objective.Invalid):
+            objective.OneOf(choices)(None, value)
+
+
+def test_one_of_contains_only():
+    import objective
+
+    class Even(object):
+        def __contains__(self, value):
+            return value % 2 == 0
+
+    assert objective.OneOf(Even())(None, 2) == 2
+
+    with pytest.raises(objective.Invalid):
+        objective.OneOf(Even())(None, 3)
+
+
+def test_chain_flatten():
+    import objective
+
+    def add(n):
+        return lambda node, value, environment=None: value + n
+
+    one = objective.Chain(add(1))
+    two = objective.Chain(add(1), add(2))
+    chain = objective.Chain(objective.Chain(add(1), objective.Chain(add(2), add(3))), add(4))
+
+    assert len(chain.validators) == 4
+    assert objective.Chain()(None, 0) == 0
+    assert one(None, 0) == 1
+    assert two(None, 0) == 3
+    assert chain(None, 0) == 10
+
+
+def test_value_map_callable():
+    import objective
+
+    assert objective.ValueMap(str.upper)(None, 'a') == 'A'
+
+    with pytest.raises(objective.Invalid):
+        objective.ValueMap({'a': 1})(None, 'b')
+
+
+class TestExtra(object):
+
+    @pytest.fixture
+    def value(self):
+        return {'x': '1', 'foo': 1, 'y': 2, 'bar': [2]}
+
+    def test_ignore(self, value):
+        import objective
+
+        class M(objective.Mapping):
+            x = objective.Item(objective.Int)
+            y = objective.Item(objective.Int, name='y')
+
+        assert M.__keys__ == frozenset(['x', 'y'])
+        assert M().deserialize(value) == {'x': 1, 'y': 2}
+
+    def test_keep(self, value):
+        import objective
+
+        class M(objective.fields.OrderedMapping):
+            x = objective.Item(objective.Int)
+
+        result = M(extra='keep').deserialize(value)
+
+        assert list(result.items()) == [('x', 1), ('foo', 1), ('y', 2), ('bar', [2])]
+        assert result['bar'] is value['bar']
+
+    @pytest.mark.parametrize('kwargs', [{'extra': 'forbid'}, {'strict': True}])
+    def test_forbid(self, value, kwargs):
+        import objective
+        from objective import traversal
+
+        class M(objective.Mapping):
+            x = objective.Item(objective.Int)
+            y = objective.Item(objective.Unicode)
+
+        m = M(**kwargs)
+
+        assert m.deserialize({'x': 1, 'y': 'a'}) == {'x': 1, 'y': u'a'}
+
+        for deserialize in (m.deserialize, lambda v: traversal.deserialize(m, v)):
+            with pytest.raises(objective.exc.InvalidChildren) as err:
+                deserialize(value)
+
+            assert err.value.error_list() == [
+                {'path': ['foo'], 'code': 'extra', 'message': 'Key `foo` is not allowed!'},
+                {'path': ['bar'], 'code': 'extra', 'message': 'Key `bar` is not allowed!'},
+            ]
+
+        assert not m.validate(value)
+
+    def test_invalid(self):
+        import objective
+
+        with pytest.raises(ValueError):
+            objective.Mapping(extra='drop')
+
+
+class TestSparse(object):
+
+    @pytest.fixture
+    def config(self):
+        import objective
+
+        items = {'opt{}'.format(i): objective.Item(objective.Int, missing=objective.Ignore) for i in range(40)}
+        items['required'] = objective.Item(objective.Unicode)
+        items['default'] = objective.Item(objective.Unicode, missing='foo')
+
+        return type('Config', (objective.fields.OrderedMapping,), items)()
+
+    @pytest.mark.parametrize('value,result', [
+        ({'opt3': '3', 'required': 'x', 'opt1': 1},
+         [('opt1', 1), ('opt3', 3), ('required', u'x'), ('default', u'foo')]),
+        ({'required': 'x', 'default': 'bar'}, [('required', u'x'), ('default', u'bar')]),
+    ])
+    def test_sparse(self, config, value, result):
+        assert list(config.deserialize(value).items()) == result
+
+        # the same for dense values
+        config.sparse_ratio = None
+        assert list(config.deserialize(value).items()) == result
+
+    def test_required(self, config):
+        import objective
+
+        for ratio in (2, None):
+            config.sparse_ratio = ratio
+
+            with pytest.raises(objective.exc.InvalidChildren) as err:
+                config.deserialize({'opt7': 'a'})
+
+            assert [error['path'] for error in err.value.error_list()] == [['opt7'], ['required']]
+
+
+class TestArray(object):
+
+    @pytest.mark.parametrize('kwargs,value,result', [
+        ({}, [1, 2.5], [1.0, 2.5]),
+        ({}, ['1', '2.5'], [1.0, 2.5]),
+        ({'typecode': 'i'}, (1, 2), [1, 2]),
+        ({'typecode': 'i'}, ['1', 2], [1, 2]),
+        ({'typecode': 'h'}, '', []),
+        ({'minimum': -1, 'maximum': 1}, [-1, 1], [-1.0, 1.0]),
+    ])
+    def test_sequence(self, kwargs, value, result):
+        import array
+
+        import objective
+
+        numbers = objective.Array(**kwargs).deserialize(value)
+
+        assert isinstance(numbers, array.array)
+        assert numbers.typecode == kwargs.get('typecode', 'd')
+        assert numbers.tolist() == result
+
+    def test_buffers(self):
+        import array
+        import base64
+
+        import objective
+
+        tobytes = objective.fields.array_tobytes
+
+        raw = tobytes(array.array('d', [1.5, -2.0]))
+        encoded = base64.b64encode(raw).decode('ascii')
+
+        for value in (raw, bytearray(raw), memoryview(b'xx' + raw)[2:], encoded):
+            assert objective.Array().deserialize(value) == array.array('d', [1.5, -2.0])
+
+            view = objective.Array(zero_copy=True).deserialize(value)
+
+            # python 2 copies
+            assert isinstance(view, array.array if six.PY2 else memoryview)
+            assert view.tolist() == [1.5, -2.0]
+
+        if six.PY2:
+            return
+
+        buf = bytearray(raw)
+        view = objective.Array(zero_copy=True).deserialize(buf)
+        buf[:8] = tobytes(array.array('d', [3.0]))
+
+        assert view[0] == 3.0
+
+    def test_serialize(self):
+        import array
+        import base64
+
+        import objective
+
+        numbers = array.array('i', [1, 2])
+        raw = objective.fields.array_tobytes(numbers)
+
+        assert objective.Array(typecode='i').serialize(numbers) == [1, 2]
+        assert objective.Array(typecode='i', output='bytes').serialize(numbers) == raw
+        assert objective.Array(typecode='i', output='bytes').serialize([1, 2]) == raw
+        assert objective.Array(typecode='i', output='base64').serialize(numbers) \
+            == base64.b64encode(raw).decode('ascii')
+
+        if not six.PY2:
+            assert objective.Array(typecode='i', output='bytes').serialize(memoryview(numbers)) == raw
+
+        with pytest.raises(ValueError):
+            objective.Array(output='json')
+
+    @pytest.mark.parametrize('kwargs,value,error', [
+        ({'minimum': 0}, [1, -1], 'BelowMinimum'),
+        ({'maximum': 1}, [1, 1.5], 'AboveMaximum'),
+        ({'max_length': 1}, [1, 1], 'LengthExceeded'),
+        ({'typecode': 'b'}, [1000], 'InvalidValue'),
+        ({'typecode': 'b'}, ['1000'], 'InvalidValue'),
+        ({'typecode': 'B'}, [1, '-1'], 'InvalidValue'),
+        ({'typecode': 'i'}, ['a'], 'InvalidValue'),
+        ({}, b'123', 'InvalidValue'),
+        ({}, 1, 'InvalidValue'),
+    ])
+    def test_invalid(self, kwargs, value, error):
+        import objective
+
+        with pytest.raises(objective.exc.InvalidValue) as err:
+            objective.Array(**kwargs).deserialize(value)
+
+        assert err.value.__class__.__name__ == error
+
+
+def test_serialize_objects():
+    import collections
+
+    import objective
+
+    Point = collections.namedtuple('Point', 'x y')
+
+    class User(object):
+        def __init__(self, **kwargs):
+            self.__dict__.update(kwargs)
+
+    class Location(objective.Mapping):
+        x = objective.Item(objective.Int)
+        y = objective.Item(objective.Int)
+
+    class UserObjective(objective.Mapping):
+        name = objective.Item(objective.Unicode)
+        class_ = objective.Item(objective.Unicode, name='class', source='group')
+        city = objective.Item(objective.Unicode, source='address.city')
+        location = objective.Item(Location)
+        tags = objective.Item(objective.List, items=objective.Item(objective.Unicode))
+        nick = objective.Item(objective.Unicode, missing=objective.Ignore)
+
+    user = User(name='foo', group='admin', address=User(city='Berlin'), location=Point(1, 2), tags=('a', 'b'))
+
+    assert UserObjective().serialize(user) == {
+        'name': u'foo', 'class': u'admin', 'city': u'Berlin', 'location': {'x': 1, 'y': 2}, 'tags': [u'a', u'b'],
+    }
+
+    # a mapping is looked up by source key
+    assert UserObjective().serialize({
+        'name': 'foo', 'group': 'admin', 'address.city': 'Berlin', 'location': {'x': 1, 'y': 2}, 'tags': [],
+    })['class'] == u'admin'
+
+    with pytest.raises(objective.exc.InvalidChildren) as err:
+        UserObjective().serialize(User(name='foo'))
+
+    assert sorted(err.value.error_dict()) == [('city',), ('class',), ('location',), ('tags',)]
+
+
+class TestTrustedSerialize(object):
+
+    @pytest.fixture
+    def node(self):
+        import objective
+
+        class Tag(objective.Unicode):
+            def _serialize(self, value, environment=None):
+                return u'#' + value
+
+        class Comment(objective.Mapping):
+            text = objective.Item(objective.Unicode)
+            replies = objective.Item(objective.List, items=objective.Item('Comment'), missing=objective.Ignore)
+
+        class Post(objective.Mapping):
+            id = objective.Item(objective.Int)
+            title = objective.Item(objective.Unicode)
+            created = objective.Item(objective.UtcDateTime)
+            scores = objective.Item(objective.List, items=objective.Item(objective.Float))
+            tags = objective.Item(objective.Set, items=objective.Item(Tag))
+            comments = objective.Item(objective.List, items=objective.Item(Comment))
+            state = objective.Item(objective.Unicode, missing='draft')
+            note = objective.Item(objective.Unicode, missing=objective.Ignore)
+
+        return Post()
+
+    def test_same_result(self, node):
+        import datetime
+        import json
+
+        value = {
+            'id': 1,
+            'title': 'foo',
+            'created': datetime.datetime(2001, 9, 11, 10, 42, 3),
+            'scores': [1.5, 2],
+            'tags': {'a'},
+            'comments': [{'text': 1, 'replies': [{'text': u'b', 'replies': []}]}, {'text': 'c'}],
+        }
+
+        result = node.serialize(value, trusted=True)
+
+        assert json.dumps(result, sort_keys=True) == json.dumps(node.serialize(value), sort_keys=True)
+        assert result['tags'] == [u'#a']
+        assert result['comments'][0]['text'] == u'1'
+
+    def test_invalid(self, node):
+        import objective
+
+        with pytest.raises(objective.exc.InvalidChildren) as err:
+            node.serialize({'id': 1}, trusted=True)
+
+        assert sorted(err.value.error_dict()) == [('comments',), ('created',), ('scores',), ('tags',), ('title',)]
+
+    @pytest.mark.parametrize('error', [RuntimeError, TypeError, AttributeError])
+    def test_bug_propagates(self, error):
+        import objective
+
+        calls = []
+
+        class Broken(objective.Field):
+            def serialize(self, value, environment=None, trusted=False):
+                calls.append(value)
+                raise error(value)
+
+        class BrokenWorker(objective.Field):
+            def _serialize(self, value, environment=None):
+                calls.append(value)
+                raise error(value)
+
+        for field in (Broken, BrokenWorker):
+            class M(objective.Mapping):
+                broken = objective.Item(field)
+
+            with pytest.raises(error):
+                M().serialize({'broken': 1}, trusted=True)
+
+        # not run a second time by the regular serialization
+        assert calls == [1, 1]
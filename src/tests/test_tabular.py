@@ -0,0 +1,108 @@
+# coding: utf-8
+import io
+
+import pytest
+
+
+def order(**kwargs):
+    import objective
+
+    class Order(objective.Mapping):
+        id = objective.Item(objective.Int)
+        sku = objective.Item(objective.Unicode)
+        quantity = objective.Item(objective.Int, missing=1)
+        note = objective.Item(objective.Unicode, missing=objective.Ignore)
+
+    return Order(**kwargs)
+
+
+CSV = u"sku,id,quantity,color\r\na,1,2,red\r\nb,2,,blue\r\n\r\nc,x,3,green\r\n,4,5,black\r\n"
+
+
+def test_read():
+    from objective import tabular
+
+    rows = list(tabular.read(io.StringIO(CSV), order()))
+
+    assert [row.number for row in rows] == [2, 3, 5, 6]
+
+    assert rows[0].value == {'id': 1, 'sku': u'a', 'quantity': 2}
+    assert rows[1].value == {'id': 2, 'sku': u'b', 'quantity': 1}
+
+    assert rows[2].value is None
+    assert [(error['row'], error['column'], error['path'], error['code']) for error in rows[2].errors] == [
+        (5, 'id', ['id'], 'invalid'),
+    ]
+
+    assert [(error['row'], error['column'], error['code']) for error in rows[3].errors] == [
+        (6, 'sku', 'missing'),
+    ]
+
+
+def test_rows_header():
+    from objective import tabular
+
+    rows = list(tabular.rows(order(), [['1', 'a', '', 'n']], header=['id', 'sku', 'quantity', 'note']))
+
+    assert rows == [tabular.Row(1, {'id': 1, 'sku': u'a', 'quantity': 1, 'note': u'n'}, None)]
+
+
+def test_missing_column():
+    from objective import tabular
+
+    rows = list(tabular.rows(order(), [['id'], ['1']]))
+
+    assert [(error['column'], error['code']) for error in rows[0].errors] == [('sku', 'missing')]
+
+
+@pytest.mark.parametrize('extra, expected', [
+    ('ignore', {'id': 1, 'sku': u'a', 'quantity': 2}),
+    ('keep', {'id': 1, 'sku': u'a', 'quantity': 2, 'color': 'red'}),
+])
+def test_extra(extra, expected):
+    from objective import tabular
+
+    rows = tabular.read(io.StringIO(CSV), order(extra=extra))
+
+    assert next(rows).value == expected
+
+
+def test_extra_forbid():
+    import objective
+    from objective import tabular
+
+    with pytest.raises(objective.Invalid) as info:
+        next(tabular.read(io.StringIO(CSV), order(strict=True)))
+
+    assert [(error['path'], error['code']) for error in info.value.error_list()] == [(['color'], 'extra')]
+
+
+def test_validator():
+    import objective
+    from objective import tabular
+
+    def positive(node, value, environment=None):
+        if value['quantity'] < 2:
+            raise objective.Invalid(node)
+
+        return value
+
+    rows = list(tabular.read(io.StringIO(CSV), order(validator=positive)))
+
+    assert rows[0].errors is None
+    assert [(error['row'], error['column'], error['path']) for error in rows[1].errors] == [(3, None, [])]
+
+
+def test_write():
+    import array
+
+    from objective import tabular
+
+    sink = tabular.ColumnSink(order(), factories={'id': lambda: array.array('l')})
+    errors = tabular.write(io.StringIO(CSV), order(), sink)
+
+    assert len(sink) == 2
+    assert sink.columns['id'] == array.array('l', [1, 2])
+    assert sink.columns['sku'] == [u'a', u'b']
+    assert sink.columns['note'] == [None, None]
+    assert [error['row'] for error in errors] == [5, 6]
@@ -0,0 +1,169 @@
+# coding: utf-8
+import pytest
+
+
+def nested_lists(depth):
+    value = []
+    current = value
+
+    for _ in range(depth):
+        child = []
+        current.append(child)
+        current = child
+
+    return value
+
+
+@pytest.fixture
+def schema():
+    import objective
+
+    class Bar(objective.Mapping):
+        x = objective.Item(objective.Unicode)
+        y = objective.Item(objective.Int, missing=objective.Ignore)
+
+    class Foo(objective.Mapping):
+        bar = objective.Item(objective.List, items=objective.Item(Bar), missing=objective.Ignore)
+        tags = objective.Item(objective.Set, items=objective.Item(objective.Int))
+        fom = objective.Item(objective.Field, missing='default')
+
+    return Foo()
+
+
+@pytest.mark.parametrize('value', [
+    {'bar': [{'x': 1}, {'x': 'a', 'y': '2'}], 'tags': [1, '2']},
+    {'tags': []},
+])
+def test_same_result(schema, value):
+    from objective import traversal
+
+    assert traversal.deserialize(schema, value) == schema.deserialize(value)
+
+
+@pytest.mark.parametrize('value', [
+    {'bar': [{'x': 1}, {}, {'y': 'a'}], 'tags': [1, 'x']},
+    {'bar': 3},
+    [],
+])
+def test_same_invalids(schema, value):
+    import objective
+    from objective import traversal
+
+    def errors(func):
+        with pytest.raises(objective.Invalid) as err:
+            func(value)
+
+        if isinstance(err.value, objective.exc.InvalidChildren):
+            return {path: (invalid.__class__, invalid.message) for path, invalid in err.value.error_dict().items()}
+
+        return err.value.__class__, err.value.message
+
+    assert errors(lambda v: traversal.deserialize(schema, v)) == errors(schema.deserialize)
+
+
+def test_deep_nesting():
+    import objective
+    from objective import traversal
+
+    class Tree(objective.List):
+        pass
+
+    Tree.items = objective.Item(Tree)
+
+    value = nested_lists(10000)
+    result = traversal.deserialize(Tree(), value)
+
+    depth = 0
+    while result:
+        result = result[0]
+        depth += 1
+
+    assert depth == 10000
+
+
+def test_custom_deserialize_is_a_leaf():
+    import objective
+    from objective import traversal
+
+    class Upper(objective.Mapping):
+        x = objective.Item(objective.Unicode)
+
+        def _deserialize(self, value, environment=None):
+            mapping = super(Upper, self)._deserialize(value, environment)
+            return {k: v.upper() for k, v in mapping.items()}
+
+    class M(objective.Mapping):
+        upper = objective.Item(Upper)
+
+    assert traversal.container_kind(M().upper) is None
+    assert traversal.deserialize(M(), {'upper': {'x': 'a'}}) == {'upper': {'x': 'A'}}
+
+
+def test_container_validator():
+    import objective
+    from objective import traversal
+
+    def not_empty(node, value, environment=None):
+        if not value:
+            raise objective.Invalid()
+
+        return value
+
+    class M(objective.Mapping):
+        tags = objective.Item(objective.List, validator=not_empty)
+
+    with pytest.raises(objective.exc.InvalidChildren) as err:
+        traversal.deserialize(M(), {'tags': []})
+
+    assert err.value.children[0].node is M().tags
+    assert traversal.deserialize(M(), {'tags': [1]}) == {'tags': [1]}
+
+
+def test_max_errors():
+    import objective
+    from objective import traversal
+
+    class Row(objective.Mapping):
+        x = objective.Item(objective.Int)
+
+    class Rows(objective.List):
+        items = objective.Item(Row)
+
+    value = [{'x': 'a'}, {'x': 1}, {'x': 'b'}, {'x': 'c'}]
+
+    with pytest.raises(objective.exc.InvalidChildren) as err:
+        traversal.deserialize(Rows(), value, max_errors=2)
+
+    assert err.value.truncated
+    assert sorted(err.value.error_dict()) == [(0,), (0, 'x'), (2,), (2, 'x')]
+
+    with pytest.raises(objective.exc.InvalidChildren) as err:
+        traversal.deserialize(Rows(), value, fail_fast=True)
+
+    assert sorted(err.value.error_dict()) == [(0,), (0, 'x')]
+
+    with pytest.raises(objective.exc.InvalidChildren) as err:
+        traversal.deserialize(Rows(fail_fast=True), value)
+
+    assert sorted(err.value.error_dict()) == [(0,), (0, 'x')]
+
+
+def test_limits():
+    import objective
+    from objective import traversal
+
+    class Tree(objective.List):
+        items = objective.Item('Tree')
+
+    with pytest.raises(objective.exc.InvalidChildren) as err:
+        traversal.deserialize(Tree(), nested_lists(100), max_depth=10)
+
+    assert isinstance(err.value.error_dict()[(0,) * 10], objective.exc.DepthExceeded)
+
+    with pytest.raises(objective.exc.ElementsExceeded):
+        traversal.deserialize(Tree(), [[], [[]], [], []], max_elements=3)
+
+    with pytest.raises(objective.exc.InvalidChildren) as err:
+        traversal.deserialize(Tree(), [[], [[], []]], max_elements=3)
+
+    assert isinstance(err.value.error_dict()[(1,)], objective.exc.ElementsExceeded)